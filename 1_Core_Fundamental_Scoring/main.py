@@ -1,13 +1,25 @@
 ﻿"""
 Main Entry Point for Fundamental Stock Analysis System
 Analyzes Eternal Ltd / Zomato Limited (Indian Stock)
+
+Usage:
+    python main.py                            # full report with chart and Excel export
+    python main.py --skip-viz --skip-excel    # text-only report (fast start-up)
+    python main.py --render-profile draft     # low-resolution chart
 """
 
+import argparse
+import os
+import sys
+# Chart render profiles are shared with 2_Generic_Stock_Analyzer
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '2_Generic_Stock_Analyzer'))
+
 # Import real Eternal Ltd data
 from eternal_ltd_real_data import ETERNAL_DATA
 from metric_calculator import FundamentalMetricsCalculator
 from scoring_engine import ScoringEngine
 from report_generator import ReportGenerator
+from render_profiles import RENDER_PROFILES, figure_path
 
 
 def print_data_summary():
@@ -41,8 +53,15 @@ def print_data_summary():
     print("="*70)
 
 
-def main():
-    """Main execution function"""
+def main(render_profile='default', skip_viz=False, skip_excel=False):
+    """
+    Main execution function
+    
+    Args:
+        render_profile: Render profile of the dashboard chart (see render_profiles.py)
+        skip_viz: Do not create the dashboard chart
+        skip_excel: Do not export the Excel report
+    """
     print("\n" + "="*80)
     print(" " * 15 + "FUNDAMENTAL STOCK ANALYSIS SYSTEM")
     print(" " * 20 + "For Indian Markets (NSE/BSE)")
@@ -82,17 +101,32 @@ def main():
         final_score=final_score
     )
     
-    report.generate_complete_report()
+    report.generate_complete_report(render_profile=render_profile, skip_viz=skip_viz,
+                                    skip_excel=skip_excel)
     
     print("\n" + "="*80)
     print("ANALYSIS COMPLETE!")
     print("="*80)
     print("\nYou can now:")
-    print("  1. View the visualization: eternal_analysis.png")
-    print("  2. Open the Excel report: eternal_fundamental_analysis.xlsx")
-    print("  3. Review the terminal output for detailed analysis")
+    steps = []
+    if not skip_viz:
+        steps.append(f"View the visualization: {figure_path('eternal_analysis.png', render_profile)}")
+    if not skip_excel:
+        steps.append("Open the Excel report: eternal_fundamental_analysis.xlsx")
+    steps.append("Review the terminal output for detailed analysis")
+    for i, step in enumerate(steps, 1):
+        print(f"  {i}. {step}")
     print("\n" + "="*80 + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description='Fundamental analysis of Eternal Ltd')
+    parser.add_argument('--skip-viz', action='store_true',
+                        help='Skip the dashboard chart (matplotlib is not loaded)')
+    parser.add_argument('--skip-excel', action='store_true',
+                        help='Skip the Excel export (openpyxl is not loaded)')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                        help='Chart resolution/format (default: 300 DPI PNG)')
+    args = parser.parse_args()
+    
+    main(render_profile=args.render_profile, skip_viz=args.skip_viz, skip_excel=args.skip_excel)
@@ -5,68 +5,165 @@ Calculates all 14 fundamental indicators for stock analysis
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 class FundamentalMetricsCalculator:
-    """Calculate fundamental metrics from financial data"""
+    """
+    Calculate fundamental metrics from financial data
     
-    def __init__(self, financial_data: Dict):
+    Metrics and the intermediate quantities they share (average equity,
+    NOPAT, invested capital, year-over-year growth rates, ...) form a small
+    dependency graph. Each node is computed once on first use and memoized,
+    so requesting a subset of metrics only evaluates what those metrics need.
+    """
+    
+    # Metrics in report order, grouped by scoring category
+    METRIC_GROUPS = [
+        ('Financial Health Metrics', ['debt_to_equity', 'current_ratio', 'interest_coverage']),      # 20%
+        ('Profitability Metrics', ['roe', 'roic', 'net_profit_margin']),                            # 25%
+        ('Growth Metrics', ['revenue_growth_3y', 'eps_growth_3y', 'fcf_growth']),                   # 25%
+        ('Valuation Metrics', ['pe_ratio', 'pb_ratio', 'peg_ratio']),                               # 20%
+        ('Efficiency Metrics', ['asset_turnover', 'inventory_turnover']),                           # 10%
+    ]
+    METRIC_NAMES = [name for _, names in METRIC_GROUPS for name in names]
+    
+    # Metrics that depend on the current share price (see reprice)
+    PRICE_METRICS = ['pe_ratio', 'pb_ratio', 'peg_ratio']
+    
+    def __init__(self, financial_data: Dict, verbose: bool = True):
         """
         Initialize calculator with financial data
         
         Args:
             financial_data: Dictionary containing balance sheet, income statement,
                           cash flow, and company info
+            verbose: Print each metric with its inputs. Pass False for bulk runs
+                     so no output is formatted at all
         """
         self.data = financial_data
+        self.verbose = verbose
         self.metrics = {}
+        self.intermediates = {}
         
     def calculate_all_metrics(self) -> Dict:
         """Calculate all 14 fundamental metrics"""
-        print("\n" + "="*70)
-        print("CALCULATING FUNDAMENTAL METRICS")
-        print("="*70 + "\n")
+        if self.verbose:
+            print("\n" + "="*70)
+            print("CALCULATING FUNDAMENTAL METRICS")
+            print("="*70 + "\n")
+        
+        for number, (title, names) in enumerate(self.METRIC_GROUPS, 1):
+            if self.verbose:
+                if number > 1:
+                    print()
+                print(f"{number}. {title}")
+                print("-" * 40)
+            for name in names:
+                self.metric(name)
+        
+        if self.verbose:
+            print("\n" + "="*70)
+            print("âœ“ ALL METRICS CALCULATED SUCCESSFULLY")
+            print("="*70 + "\n")
         
-        # Financial Health Metrics (20%)
-        print("1. Financial Health Metrics")
-        print("-" * 40)
-        self.metrics['debt_to_equity'] = self.calculate_debt_to_equity()
-        self.metrics['current_ratio'] = self.calculate_current_ratio()
-        self.metrics['interest_coverage'] = self.calculate_interest_coverage()
+        return self.metrics
+    
+    def calculate_metrics(self, names: List[str]) -> Dict:
+        """
+        Calculate only the given metrics
         
-        # Profitability Metrics (25%)
-        print("\n2. Profitability Metrics")
-        print("-" * 40)
-        self.metrics['roe'] = self.calculate_roe()
-        self.metrics['roic'] = self.calculate_roic()
-        self.metrics['net_profit_margin'] = self.calculate_net_profit_margin()
+        Args:
+            names: Metric keys, e.g. ['roe', 'peg_ratio']
         
-        # Growth Metrics (25%)
-        print("\n3. Growth Metrics")
-        print("-" * 40)
-        self.metrics['revenue_growth_3y'] = self.calculate_revenue_growth_3y()
-        self.metrics['eps_growth_3y'] = self.calculate_eps_growth_3y()
-        self.metrics['fcf_growth'] = self.calculate_fcf_growth()
+        Returns:
+            Dictionary of the requested metrics
+        """
+        unknown = [name for name in names if name not in self.METRIC_NAMES]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {', '.join(unknown)}")
+        return {name: self.metric(name) for name in names}
+    
+    def reprice(self, current_price: float) -> Dict:
+        """
+        Update the price-dependent metrics for a new share price
         
-        # Valuation Metrics (20%)
-        print("\n4. Valuation Metrics")
-        print("-" * 40)
-        self.metrics['pe_ratio'] = self.calculate_pe_ratio()
-        self.metrics['pb_ratio'] = self.calculate_pb_ratio()
-        self.metrics['peg_ratio'] = self.calculate_peg_ratio()
+        Statement-derived metrics and intermediates (e.g. EPS growth) stay
+        memoized; only P/E, P/B and PEG are recalculated. The caller's
+        financial_data dictionary is not modified.
         
-        # Efficiency Metrics (10%)
-        print("\n5. Efficiency Metrics")
-        print("-" * 40)
-        self.metrics['asset_turnover'] = self.calculate_asset_turnover()
-        self.metrics['inventory_turnover'] = self.calculate_inventory_turnover()
+        Args:
+            current_price: New share price
         
-        print("\n" + "="*70)
-        print("âœ“ ALL METRICS CALCULATED SUCCESSFULLY")
-        print("="*70 + "\n")
+        Returns:
+            Dictionary of the recalculated price-dependent metrics
+        """
+        company_info = dict(self.data['company_info'], current_price=current_price)
+        self.data = dict(self.data, company_info=company_info)
         
-        return self.metrics
+        for name in self.PRICE_METRICS:
+            self.metrics.pop(name, None)
+        return self.calculate_metrics(self.PRICE_METRICS)
+    
+    def metric(self, name: str) -> float:
+        """Value of one metric, calculated on first use"""
+        if name not in self.metrics:
+            self.metrics[name] = getattr(self, f'calculate_{name}')()
+        return self.metrics[name]
+    
+    def intermediate(self, name: str):
+        """Value of an intermediate quantity, computed once by its _compute_<name> method"""
+        if name not in self.intermediates:
+            self.intermediates[name] = getattr(self, f'_compute_{name}')()
+        return self.intermediates[name]
+    
+    # ==================== INTERMEDIATE QUANTITIES ====================
+    
+    def _average(self, section: str, item: str) -> float:
+        """Average of an item over FY24 and FY23"""
+        return (self.data[section]['fy_2024'][item] + self.data[section]['fy_2023'][item]) / 2
+    
+    def _compute_avg_equity(self) -> float:
+        return self._average('balance_sheet', 'shareholders_equity')
+    
+    def _compute_avg_assets(self) -> float:
+        return self._average('balance_sheet', 'total_assets')
+    
+    def _compute_avg_inventory(self) -> float:
+        return self._average('balance_sheet', 'inventory')
+    
+    def _compute_tax_rate(self) -> float:
+        inc_2024 = self.data['income_statement']['fy_2024']
+        return inc_2024['income_tax_expense'] / inc_2024['pretax_income']
+    
+    def _compute_nopat(self) -> float:
+        """Net Operating Profit After Tax"""
+        return self.data['income_statement']['fy_2024']['operating_income'] * (1 - self.intermediate('tax_rate'))
+    
+    def _compute_invested_capital(self) -> float:
+        bs_2024 = self.data['balance_sheet']['fy_2024']
+        return bs_2024['shareholders_equity'] + bs_2024['total_debt'] - bs_2024['cash_and_equivalents']
+    
+    def _compute_revenues(self) -> List[float]:
+        """Total revenue FY24, FY23, FY22, FY21"""
+        income = self.data['income_statement']
+        return [income[year]['total_revenue'] for year in ('fy_2024', 'fy_2023', 'fy_2022', 'fy_2021')]
+    
+    def _compute_eps_values(self) -> List[float]:
+        """EPS FY24, FY23, FY22, FY21"""
+        eps_data = self.data['per_share_data']
+        return [eps_data[year]['eps'] for year in ('fy_2024', 'fy_2023', 'fy_2022', 'fy_2021')]
+    
+    @staticmethod
+    def _yoy_growth(values: List[float]) -> List[float]:
+        """Year-over-year growth rates (%) of a newest-first series"""
+        return [((values[i] - values[i+1]) / values[i+1]) * 100 for i in range(len(values) - 1)]
+    
+    def _compute_revenue_yoy_growth(self) -> List[float]:
+        return self._yoy_growth(self.intermediate('revenues'))
+    
+    def _compute_eps_yoy_growth(self) -> List[float]:
+        return self._yoy_growth(self.intermediate('eps_values'))
     
     # ==================== FINANCIAL HEALTH METRICS ====================
     
@@ -77,9 +174,10 @@ class FundamentalMetricsCalculator:
         shareholders_equity = bs_2024['shareholders_equity']
         
         ratio = total_debt / shareholders_equity
-        print(f"  Debt-to-Equity Ratio: {ratio:.2f}")
-        print(f"    Total Debt: â‚¹{total_debt:.0f} Cr")
-        print(f"    Shareholders Equity: â‚¹{shareholders_equity:.0f} Cr")
+        if self.verbose:
+            print(f"  Debt-to-Equity Ratio: {ratio:.2f}")
+            print(f"    Total Debt: â‚¹{total_debt:.0f} Cr")
+            print(f"    Shareholders Equity: â‚¹{shareholders_equity:.0f} Cr")
         return ratio
     
     def calculate_current_ratio(self) -> float:
@@ -89,9 +187,10 @@ class FundamentalMetricsCalculator:
         current_liabilities = bs_2024['current_liabilities']
         
         ratio = current_assets / current_liabilities
-        print(f"  Current Ratio: {ratio:.2f}")
-        print(f"    Current Assets: â‚¹{current_assets:.0f} Cr")
-        print(f"    Current Liabilities: â‚¹{current_liabilities:.0f} Cr")
+        if self.verbose:
+            print(f"  Current Ratio: {ratio:.2f}")
+            print(f"    Current Assets: â‚¹{current_assets:.0f} Cr")
+            print(f"    Current Liabilities: â‚¹{current_liabilities:.0f} Cr")
         return ratio
     
     def calculate_interest_coverage(self) -> float:
@@ -105,50 +204,36 @@ class FundamentalMetricsCalculator:
         else:
             ratio = ebit / interest_expense
         
-        print(f"  Interest Coverage Ratio: {ratio:.2f}x")
-        print(f"    EBIT: â‚¹{ebit:.0f} Cr")
-        print(f"    Interest Expense: â‚¹{interest_expense:.0f} Cr")
+        if self.verbose:
+            print(f"  Interest Coverage Ratio: {ratio:.2f}x")
+            print(f"    EBIT: â‚¹{ebit:.0f} Cr")
+            print(f"    Interest Expense: â‚¹{interest_expense:.0f} Cr")
         return ratio
     
     # ==================== PROFITABILITY METRICS ====================
     
     def calculate_roe(self) -> float:
         """Calculate Return on Equity (Higher is better)"""
-        inc_2024 = self.data['income_statement']['fy_2024']
-        bs_2024 = self.data['balance_sheet']['fy_2024']
-        bs_2023 = self.data['balance_sheet']['fy_2023']
-        
-        net_income = inc_2024['net_income']
-        equity_current = bs_2024['shareholders_equity']
-        equity_previous = bs_2023['shareholders_equity']
-        avg_equity = (equity_current + equity_previous) / 2
+        net_income = self.data['income_statement']['fy_2024']['net_income']
+        avg_equity = self.intermediate('avg_equity')
         
         roe = (net_income / avg_equity) * 100
-        print(f"  Return on Equity (ROE): {roe:.2f}%")
-        print(f"    Net Income: â‚¹{net_income:.0f} Cr")
-        print(f"    Average Equity: â‚¹{avg_equity:.0f} Cr")
+        if self.verbose:
+            print(f"  Return on Equity (ROE): {roe:.2f}%")
+            print(f"    Net Income: â‚¹{net_income:.0f} Cr")
+            print(f"    Average Equity: â‚¹{avg_equity:.0f} Cr")
         return roe
     
     def calculate_roic(self) -> float:
         """Calculate Return on Invested Capital (Higher is better)"""
-        inc_2024 = self.data['income_statement']['fy_2024']
-        bs_2024 = self.data['balance_sheet']['fy_2024']
-        
-        # Calculate NOPAT (Net Operating Profit After Tax)
-        ebit = inc_2024['operating_income']
-        tax_rate = inc_2024['income_tax_expense'] / inc_2024['pretax_income']
-        nopat = ebit * (1 - tax_rate)
-        
-        # Calculate Invested Capital
-        total_equity = bs_2024['shareholders_equity']
-        total_debt = bs_2024['total_debt']
-        cash = bs_2024['cash_and_equivalents']
-        invested_capital = total_equity + total_debt - cash
+        nopat = self.intermediate('nopat')
+        invested_capital = self.intermediate('invested_capital')
         
         roic = (nopat / invested_capital) * 100
-        print(f"  Return on Invested Capital (ROIC): {roic:.2f}%")
-        print(f"    NOPAT: â‚¹{nopat:.0f} Cr")
-        print(f"    Invested Capital: â‚¹{invested_capital:.0f} Cr")
+        if self.verbose:
+            print(f"  Return on Invested Capital (ROIC): {roic:.2f}%")
+            print(f"    NOPAT: â‚¹{nopat:.0f} Cr")
+            print(f"    Invested Capital: â‚¹{invested_capital:.0f} Cr")
         return roic
     
     def calculate_net_profit_margin(self) -> float:
@@ -158,65 +243,42 @@ class FundamentalMetricsCalculator:
         total_revenue = inc_2024['total_revenue']
         
         npm = (net_income / total_revenue) * 100
-        print(f"  Net Profit Margin: {npm:.2f}%")
-        print(f"    Net Income: â‚¹{net_income:.0f} Cr")
-        print(f"    Total Revenue: â‚¹{total_revenue:.0f} Cr")
+        if self.verbose:
+            print(f"  Net Profit Margin: {npm:.2f}%")
+            print(f"    Net Income: â‚¹{net_income:.0f} Cr")
+            print(f"    Total Revenue: â‚¹{total_revenue:.0f} Cr")
         return npm
     
     # ==================== GROWTH METRICS ====================
     
     def calculate_revenue_growth_3y(self) -> float:
         """Calculate 3-Year Average Revenue Growth (Higher is better)"""
-        inc_2024 = self.data['income_statement']['fy_2024']
-        inc_2023 = self.data['income_statement']['fy_2023']
-        inc_2022 = self.data['income_statement']['fy_2022']
-        inc_2021 = self.data['income_statement']['fy_2021']
-        
-        revenues = [
-            inc_2024['total_revenue'],
-            inc_2023['total_revenue'],
-            inc_2022['total_revenue'],
-            inc_2021['total_revenue']
-        ]
-        
-        # Calculate year-over-year growth rates
-        growth_rates = []
-        for i in range(len(revenues) - 1):
-            growth = ((revenues[i] - revenues[i+1]) / revenues[i+1]) * 100
-            growth_rates.append(growth)
+        revenues = self.intermediate('revenues')
+        growth_rates = self.intermediate('revenue_yoy_growth')
         
         avg_growth = sum(growth_rates) / len(growth_rates)
-        print(f"  3-Year Average Revenue Growth: {avg_growth:.2f}%")
-        print(f"    FY24 Revenue: â‚¹{revenues[0]:.0f} Cr")
-        print(f"    FY23 Revenue: â‚¹{revenues[1]:.0f} Cr")
-        print(f"    FY22 Revenue: â‚¹{revenues[2]:.0f} Cr")
-        print(f"    FY21 Revenue: â‚¹{revenues[3]:.0f} Cr")
-        print(f"    YoY Growth Rates: {[f'{g:.1f}%' for g in growth_rates]}")
+        if self.verbose:
+            print(f"  3-Year Average Revenue Growth: {avg_growth:.2f}%")
+            print(f"    FY24 Revenue: â‚¹{revenues[0]:.0f} Cr")
+            print(f"    FY23 Revenue: â‚¹{revenues[1]:.0f} Cr")
+            print(f"    FY22 Revenue: â‚¹{revenues[2]:.0f} Cr")
+            print(f"    FY21 Revenue: â‚¹{revenues[3]:.0f} Cr")
+            print(f"    YoY Growth Rates: {[f'{g:.1f}%' for g in growth_rates]}")
         return avg_growth
     
     def calculate_eps_growth_3y(self) -> float:
         """Calculate 3-Year Average EPS Growth (Higher is better)"""
-        eps_data = self.data['per_share_data']
-        eps_values = [
-            eps_data['fy_2024']['eps'],
-            eps_data['fy_2023']['eps'],
-            eps_data['fy_2022']['eps'],
-            eps_data['fy_2021']['eps']
-        ]
-        
-        # Calculate year-over-year growth rates
-        growth_rates = []
-        for i in range(len(eps_values) - 1):
-            growth = ((eps_values[i] - eps_values[i+1]) / eps_values[i+1]) * 100
-            growth_rates.append(growth)
+        eps_values = self.intermediate('eps_values')
+        growth_rates = self.intermediate('eps_yoy_growth')
         
         avg_growth = sum(growth_rates) / len(growth_rates)
-        print(f"  3-Year Average EPS Growth: {avg_growth:.2f}%")
-        print(f"    FY24 EPS: â‚¹{eps_values[0]:.2f}")
-        print(f"    FY23 EPS: â‚¹{eps_values[1]:.2f}")
-        print(f"    FY22 EPS: â‚¹{eps_values[2]:.2f}")
-        print(f"    FY21 EPS: â‚¹{eps_values[3]:.2f}")
-        print(f"    YoY Growth Rates: {[f'{g:.1f}%' for g in growth_rates]}")
+        if self.verbose:
+            print(f"  3-Year Average EPS Growth: {avg_growth:.2f}%")
+            print(f"    FY24 EPS: â‚¹{eps_values[0]:.2f}")
+            print(f"    FY23 EPS: â‚¹{eps_values[1]:.2f}")
+            print(f"    FY22 EPS: â‚¹{eps_values[2]:.2f}")
+            print(f"    FY21 EPS: â‚¹{eps_values[3]:.2f}")
+            print(f"    YoY Growth Rates: {[f'{g:.1f}%' for g in growth_rates]}")
         return avg_growth
     
     def calculate_fcf_growth(self) -> float:
@@ -228,9 +290,10 @@ class FundamentalMetricsCalculator:
         fcf_previous = cf_2023['free_cash_flow']
         
         fcf_growth = ((fcf_current - fcf_previous) / fcf_previous) * 100
-        print(f"  Free Cash Flow Growth: {fcf_growth:.2f}%")
-        print(f"    FY24 FCF: â‚¹{fcf_current:.0f} Cr")
-        print(f"    FY23 FCF: â‚¹{fcf_previous:.0f} Cr")
+        if self.verbose:
+            print(f"  Free Cash Flow Growth: {fcf_growth:.2f}%")
+            print(f"    FY24 FCF: â‚¹{fcf_current:.0f} Cr")
+            print(f"    FY23 FCF: â‚¹{fcf_previous:.0f} Cr")
         return fcf_growth
     
     # ==================== VALUATION METRICS ====================
@@ -241,9 +304,10 @@ class FundamentalMetricsCalculator:
         eps = self.data['per_share_data']['fy_2024']['eps']
         
         pe_ratio = current_price / eps
-        print(f"  Price-to-Earnings (P/E) Ratio: {pe_ratio:.2f}x")
-        print(f"    Current Price: â‚¹{current_price:.2f}")
-        print(f"    EPS (TTM): â‚¹{eps:.2f}")
+        if self.verbose:
+            print(f"  Price-to-Earnings (P/E) Ratio: {pe_ratio:.2f}x")
+            print(f"    Current Price: â‚¹{current_price:.2f}")
+            print(f"    EPS (TTM): â‚¹{eps:.2f}")
         return pe_ratio
     
     def calculate_pb_ratio(self) -> float:
@@ -252,64 +316,58 @@ class FundamentalMetricsCalculator:
         book_value_per_share = self.data['per_share_data']['fy_2024']['book_value_per_share']
         
         pb_ratio = current_price / book_value_per_share
-        print(f"  Price-to-Book (P/B) Ratio: {pb_ratio:.2f}x")
-        print(f"    Current Price: â‚¹{current_price:.2f}")
-        print(f"    Book Value Per Share: â‚¹{book_value_per_share:.2f}")
+        if self.verbose:
+            print(f"  Price-to-Book (P/B) Ratio: {pb_ratio:.2f}x")
+            print(f"    Current Price: â‚¹{current_price:.2f}")
+            print(f"    Book Value Per Share: â‚¹{book_value_per_share:.2f}")
         return pb_ratio
     
     def calculate_peg_ratio(self) -> float:
         """Calculate PEG Ratio (Lower is better)"""
-        pe_ratio = self.metrics.get('pe_ratio') or self.calculate_pe_ratio()
-        eps_growth = self.metrics.get('eps_growth_3y') or self.calculate_eps_growth_3y()
+        # Memoized, so a legitimate 0.0 is reused rather than recalculated
+        pe_ratio = self.metric('pe_ratio')
+        eps_growth = self.metric('eps_growth_3y')
         
         if eps_growth <= 0:
             peg_ratio = float('inf')  # No growth or negative growth
         else:
             peg_ratio = pe_ratio / eps_growth
         
-        print(f"  PEG Ratio: {peg_ratio:.2f}")
-        print(f"    P/E Ratio: {pe_ratio:.2f}x")
-        print(f"    EPS Growth Rate: {eps_growth:.2f}%")
+        if self.verbose:
+            print(f"  PEG Ratio: {peg_ratio:.2f}")
+            print(f"    P/E Ratio: {pe_ratio:.2f}x")
+            print(f"    EPS Growth Rate: {eps_growth:.2f}%")
         return peg_ratio
     
     # ==================== EFFICIENCY METRICS ====================
     
     def calculate_asset_turnover(self) -> float:
         """Calculate Asset Turnover Ratio (Higher is better)"""
-        inc_2024 = self.data['income_statement']['fy_2024']
-        bs_2024 = self.data['balance_sheet']['fy_2024']
-        bs_2023 = self.data['balance_sheet']['fy_2023']
-        
-        revenue = inc_2024['total_revenue']
-        assets_current = bs_2024['total_assets']
-        assets_previous = bs_2023['total_assets']
-        avg_assets = (assets_current + assets_previous) / 2
+        revenue = self.data['income_statement']['fy_2024']['total_revenue']
+        avg_assets = self.intermediate('avg_assets')
         
         asset_turnover = revenue / avg_assets
-        print(f"  Asset Turnover Ratio: {asset_turnover:.2f}x")
-        print(f"    Revenue: â‚¹{revenue:.0f} Cr")
-        print(f"    Average Total Assets: â‚¹{avg_assets:.0f} Cr")
+        if self.verbose:
+            print(f"  Asset Turnover Ratio: {asset_turnover:.2f}x")
+            print(f"    Revenue: â‚¹{revenue:.0f} Cr")
+            print(f"    Average Total Assets: â‚¹{avg_assets:.0f} Cr")
         return asset_turnover
     
     def calculate_inventory_turnover(self) -> float:
         """Calculate Inventory Turnover (Higher is better)"""
-        inc_2024 = self.data['income_statement']['fy_2024']
-        bs_2024 = self.data['balance_sheet']['fy_2024']
-        bs_2023 = self.data['balance_sheet']['fy_2023']
-        
-        cogs = inc_2024['cost_of_revenue']
-        inventory_current = bs_2024['inventory']
-        inventory_previous = bs_2023['inventory']
-        avg_inventory = (inventory_current + inventory_previous) / 2
+        cogs = self.data['income_statement']['fy_2024']['cost_of_revenue']
+        avg_inventory = self.intermediate('avg_inventory')
         
         if avg_inventory == 0:
             inventory_turnover = float('inf')  # Service company with no inventory
-            print(f"  Inventory Turnover: N/A (Service Company)")
+            if self.verbose:
+                print(f"  Inventory Turnover: N/A (Service Company)")
         else:
             inventory_turnover = cogs / avg_inventory
-            print(f"  Inventory Turnover: {inventory_turnover:.2f}x")
-            print(f"    COGS: â‚¹{cogs:.0f} Cr")
-            print(f"    Average Inventory: â‚¹{avg_inventory:.0f} Cr")
+            if self.verbose:
+                print(f"  Inventory Turnover: {inventory_turnover:.2f}x")
+                print(f"    COGS: â‚¹{cogs:.0f} Cr")
+                print(f"    Average Inventory: â‚¹{avg_inventory:.0f} Cr")
         
         return inventory_turnover
     
@@ -377,6 +435,189 @@ class FundamentalMetricsCalculator:
         return pd.DataFrame(summary_data)
 
 
+def financial_data_to_frame(companies: List[Dict]) -> pd.DataFrame:
+    """
+    Flatten a list of nested financial_data dictionaries into a columnar table
+    
+    Each nested key becomes one dotted column, e.g.
+    'balance_sheet.fy_2024.total_assets' or 'company_info.current_price'.
+    
+    Args:
+        companies: List of financial_data dictionaries (one per company)
+    
+    Returns:
+        DataFrame with one row per company, usable by BatchMetricsCalculator
+    """
+    return pd.json_normalize(companies, sep='.')
+
+
+class BatchMetricsCalculator:
+    """Calculate all 14 fundamental metrics for many companies at once"""
+    
+    METRIC_NAMES = [
+        'debt_to_equity', 'current_ratio', 'interest_coverage',
+        'roe', 'roic', 'net_profit_margin',
+        'revenue_growth_3y', 'eps_growth_3y', 'fcf_growth',
+        'pe_ratio', 'pb_ratio', 'peg_ratio',
+        'asset_turnover', 'inventory_turnover',
+    ]
+    
+    PRICE_METRICS = FundamentalMetricsCalculator.PRICE_METRICS
+    
+    GROWTH_YEARS = ['fy_2024', 'fy_2023', 'fy_2022', 'fy_2021']
+    
+    def __init__(self, table: pd.DataFrame):
+        """
+        Initialize batch calculator with a columnar financial table
+        
+        Args:
+            table: DataFrame with one row per company and one dotted column per
+                   line item per fiscal year (see financial_data_to_frame)
+        """
+        self.table = table
+        self.metrics = pd.DataFrame(index=table.index)
+        
+        # Prices set by reprice(); the caller's table is never modified
+        self._current_price = None
+    
+    def _col(self, *keys: str) -> np.ndarray:
+        """Get one line item for all companies as a float array"""
+        return self.table['.'.join(keys)].to_numpy(dtype=float)
+    
+    @staticmethod
+    def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """
+        Element-wise division
+        
+        Zero denominators give NaN (the scalar calculator raises ZeroDivisionError
+        for these companies).
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator != 0, numerator / denominator, np.nan)
+    
+    def _average_yoy_growth(self, section: str, item: str) -> np.ndarray:
+        """Average of year-over-year growth rates across GROWTH_YEARS (newest first)"""
+        values = [self._col(section, year, item) for year in self.GROWTH_YEARS]
+        
+        total = 0
+        for current, previous in zip(values[:-1], values[1:]):
+            total = total + self._divide(current - previous, previous) * 100
+        return total / (len(values) - 1)
+    
+    def _valuation_metrics(self, current_price: np.ndarray, eps_growth: np.ndarray) -> Dict:
+        """P/E, P/B and PEG for all companies at the given prices"""
+        eps = self._col('per_share_data', 'fy_2024', 'eps')
+        book_value_per_share = self._col('per_share_data', 'fy_2024', 'book_value_per_share')
+        
+        m = {}
+        m['pe_ratio'] = self._divide(current_price, eps)
+        m['pb_ratio'] = self._divide(current_price, book_value_per_share)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # No growth or negative growth -> infinite PEG
+            m['peg_ratio'] = np.where(eps_growth <= 0, np.inf, m['pe_ratio'] / eps_growth)
+        return m
+    
+    def reprice(self, prices) -> pd.DataFrame:
+        """
+        Update only the price-dependent metrics (P/E, P/B, PEG) for new prices
+        
+        Statement-derived metrics are kept from the last calculate_all_metrics
+        run, so an intraday screening refresh costs three array divisions.
+        
+        Args:
+            prices: New share prices, one per company (array in table order,
+                    or a Series indexed like the table)
+        
+        Returns:
+            Updated metrics DataFrame (companies x metrics). A new DataFrame
+            is returned on every call; earlier results are left unchanged.
+        """
+        if self.metrics.empty:
+            self.calculate_all_metrics()
+        
+        if isinstance(prices, pd.Series):
+            prices = prices.reindex(self.table.index)
+        self._current_price = np.array(prices, dtype=float)
+        
+        eps_growth = self.metrics['eps_growth_3y'].to_numpy(dtype=float)
+        self.metrics = self.metrics.assign(**self._valuation_metrics(self._current_price, eps_growth))
+        return self.metrics.copy()
+    
+    def calculate_all_metrics(self) -> pd.DataFrame:
+        """
+        Calculate all 14 fundamental metrics for every company
+        
+        Returns:
+            DataFrame (companies x metrics) with the same metric names and
+            values as FundamentalMetricsCalculator.calculate_all_metrics
+        """
+        # Line items (FY24 unless noted), one array per item
+        total_debt = self._col('balance_sheet', 'fy_2024', 'total_debt')
+        equity_current = self._col('balance_sheet', 'fy_2024', 'shareholders_equity')
+        equity_previous = self._col('balance_sheet', 'fy_2023', 'shareholders_equity')
+        assets_current = self._col('balance_sheet', 'fy_2024', 'total_assets')
+        assets_previous = self._col('balance_sheet', 'fy_2023', 'total_assets')
+        inventory_current = self._col('balance_sheet', 'fy_2024', 'inventory')
+        inventory_previous = self._col('balance_sheet', 'fy_2023', 'inventory')
+        current_assets = self._col('balance_sheet', 'fy_2024', 'current_assets')
+        current_liabilities = self._col('balance_sheet', 'fy_2024', 'current_liabilities')
+        cash = self._col('balance_sheet', 'fy_2024', 'cash_and_equivalents')
+        
+        revenue = self._col('income_statement', 'fy_2024', 'total_revenue')
+        cogs = self._col('income_statement', 'fy_2024', 'cost_of_revenue')
+        ebit = self._col('income_statement', 'fy_2024', 'operating_income')
+        interest_expense = self._col('income_statement', 'fy_2024', 'interest_expense')
+        pretax_income = self._col('income_statement', 'fy_2024', 'pretax_income')
+        income_tax = self._col('income_statement', 'fy_2024', 'income_tax_expense')
+        net_income = self._col('income_statement', 'fy_2024', 'net_income')
+        
+        fcf_current = self._col('cash_flow', 'fy_2024', 'free_cash_flow')
+        fcf_previous = self._col('cash_flow', 'fy_2023', 'free_cash_flow')
+        
+        if self._current_price is None:
+            current_price = self._col('company_info', 'current_price')
+        else:
+            current_price = self._current_price  # latest reprice()
+        
+        m = {}
+        
+        # Financial Health Metrics (20%)
+        m['debt_to_equity'] = self._divide(total_debt, equity_current)
+        m['current_ratio'] = self._divide(current_assets, current_liabilities)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # No interest expense -> infinite coverage
+            m['interest_coverage'] = np.where(interest_expense == 0, np.inf, ebit / interest_expense)
+        
+        # Profitability Metrics (25%)
+        avg_equity = (equity_current + equity_previous) / 2
+        m['roe'] = self._divide(net_income, avg_equity) * 100
+        
+        tax_rate = self._divide(income_tax, pretax_income)
+        nopat = ebit * (1 - tax_rate)
+        invested_capital = equity_current + total_debt - cash
+        m['roic'] = self._divide(nopat, invested_capital) * 100
+        m['net_profit_margin'] = self._divide(net_income, revenue) * 100
+        
+        # Growth Metrics (25%)
+        m['revenue_growth_3y'] = self._average_yoy_growth('income_statement', 'total_revenue')
+        m['eps_growth_3y'] = self._average_yoy_growth('per_share_data', 'eps')
+        m['fcf_growth'] = self._divide(fcf_current - fcf_previous, fcf_previous) * 100
+        
+        # Valuation Metrics (20%)
+        m.update(self._valuation_metrics(current_price, m['eps_growth_3y']))
+        
+        # Efficiency Metrics (10%)
+        avg_assets = (assets_current + assets_previous) / 2
+        m['asset_turnover'] = self._divide(revenue, avg_assets)
+        avg_inventory = (inventory_current + inventory_previous) / 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Service company with no inventory -> infinite turnover
+            m['inventory_turnover'] = np.where(avg_inventory == 0, np.inf, cogs / avg_inventory)
+        
+        self.metrics = pd.DataFrame(m, index=self.table.index)[self.METRIC_NAMES]
+        return self.metrics
+
+
 if __name__ == "__main__":
     # Test with sample data
     from sample_data import ETERNAL_DATA
@@ -0,0 +1,123 @@
+﻿"""
+Output Writers Module
+Pluggable writers for analysis results: Excel workbooks and detailed result files
+
+Excel modes:
+- standard:  pandas + openpyxl (formatted header row)
+- streaming: openpyxl write-only workbook, rows are streamed to disk
+             (constant memory, much faster for thousands of rows)
+
+Detailed result formats (one record per company):
+- json:    indented JSON list (human-readable)
+- jsonl:   JSON Lines, one compact record per line (records are consumed
+           one at a time, so a generator is never held in memory as a list)
+- parquet: flattened columnar table with dotted columns (needs pyarrow)
+"""
+
+import json
+import pandas as pd
+from typing import Dict, Iterable
+
+
+def _write_standard_workbook(path: str, sheets: Dict[str, pd.DataFrame], index_sheets: Iterable[str]):
+    """Write sheets with pandas' openpyxl writer"""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=name in index_sheets)
+
+
+def _write_streaming_workbook(path: str, sheets: Dict[str, pd.DataFrame], index_sheets: Iterable[str]):
+    """Write sheets row by row into a write-only openpyxl workbook"""
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    for name, df in sheets.items():
+        frame = df.reset_index() if name in index_sheets else df
+        sheet = workbook.create_sheet(title=name)
+        sheet.append([str(column) for column in frame.columns])
+        
+        # Missing values become empty cells, as with pandas
+        values = frame.astype(object).where(frame.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            sheet.append(row)
+    
+    workbook.save(path)
+
+
+EXCEL_MODES = {
+    'standard': _write_standard_workbook,
+    'streaming': _write_streaming_workbook,
+}
+
+
+def write_workbook(path: str, sheets: Dict[str, pd.DataFrame], mode: str = 'standard',
+                   index_sheets: Iterable[str] = ()) -> str:
+    """
+    Write several tables into one Excel workbook
+    
+    Args:
+        path: Output .xlsx path
+        sheets: Sheet name -> DataFrame (written in this order)
+        mode: 'standard' or 'streaming' (see EXCEL_MODES)
+        index_sheets: Sheets whose index is written as the first column(s)
+    
+    Returns:
+        Path of the written workbook
+    """
+    if mode not in EXCEL_MODES:
+        raise ValueError(f"Unknown Excel mode '{mode}' (use one of: {', '.join(EXCEL_MODES)})")
+    
+    EXCEL_MODES[mode](path, sheets, set(index_sheets))
+    return path
+
+
+def _write_json(records: Iterable[Dict], path: str):
+    with open(path, 'w') as f:
+        json.dump(list(records), f, indent=2, default=str)
+
+
+def _write_json_lines(records: Iterable[Dict], path: str):
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(record, default=str, separators=(',', ':')))
+            f.write('\n')
+
+
+def _write_parquet(records: Iterable[Dict], path: str):
+    table = pd.json_normalize(list(records), sep='.')
+    
+    # Columns mixing text and numbers are stored as text
+    for column in table.columns[table.dtypes == object]:
+        if pd.api.types.infer_dtype(table[column], skipna=True).startswith('mixed'):
+            table[column] = table[column].astype(str)
+    
+    table.to_parquet(path, index=False)
+
+
+# Format name -> (file extension, writer)
+RESULT_FORMATS = {
+    'json': ('.json', _write_json),
+    'jsonl': ('.jsonl', _write_json_lines),
+    'parquet': ('.parquet', _write_parquet),
+}
+
+
+def write_records(records: Iterable[Dict], path: str, fmt: str = 'json') -> str:
+    """
+    Write detailed per-company records
+    
+    Args:
+        records: Iterable of (nested) result dictionaries; may be a generator
+        path: Output path without extension
+        fmt: 'json', 'jsonl' or 'parquet' (see RESULT_FORMATS)
+    
+    Returns:
+        Path of the written file
+    """
+    if fmt not in RESULT_FORMATS:
+        raise ValueError(f"Unknown result format '{fmt}' (use one of: {', '.join(RESULT_FORMATS)})")
+    
+    extension, writer = RESULT_FORMATS[fmt]
+    output_file = path + extension
+    writer(records, output_file)
+    return output_file
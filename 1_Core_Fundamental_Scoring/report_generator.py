@@ -4,18 +4,35 @@ Creates comprehensive reports with visualizations and Excel export
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from datetime import datetime
 from typing import Dict
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better-looking plots
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 10
+import os
+import sys
+# Chart render profiles are shared with 2_Generic_Stock_Analyzer
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '2_Generic_Stock_Analyzer'))
+
+from render_profiles import save_figure
+from output_writers import write_workbook
+
+
+def _plotting():
+    """
+    Import matplotlib and seaborn on first use and apply the report style
+    
+    Kept out of module import so text-only runs do not load the plotting stack.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set style for better-looking plots
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    plt.rcParams['font.size'] = 10
+    return plt, sns
 
 
 class ReportGenerator:
@@ -139,8 +156,20 @@ class ReportGenerator:
         
         print("\n" + "-" * 80 + "\n")
     
-    def create_visualizations(self, save_path='eternal_analysis.png'):
-        """Create comprehensive visualization dashboard"""
+    def create_visualizations(self, save_path='eternal_analysis.png', render_profile='default'):
+        """
+        Create comprehensive visualization dashboard
+        
+        Args:
+            save_path: Output path (extension set by the render profile)
+            render_profile: 'default' (300 DPI PNG), 'draft', 'web', 'print' (PDF)
+                            or 'svg'; see render_profiles.py
+        
+        Returns:
+            Path of the saved chart
+        """
+        plt, sns = _plotting()
+        
         fig = plt.figure(figsize=(16, 12))
         gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
         
@@ -253,128 +282,152 @@ class ReportGenerator:
                     fontsize=16, fontweight='bold', y=0.98)
         
         # Save figure
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_path = save_figure(save_path, render_profile)
         print(f"✓ Visualization saved to: {save_path}")
         
         # Close the plot to avoid blocking
         plt.close()
+        
+        return save_path
     
-    def export_to_excel(self, filename='eternal_fundamental_analysis.xlsx'):
-        """Export complete analysis to Excel"""
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Sheet 1: Executive Summary
-            summary_data = {
-                'Item': [
-                    'Company Name',
-                    'Ticker',
-                    'Sector',
-                    'Current Price (â‚¹)',
-                    'Market Cap (â‚¹ Cr)',
-                    'Report Date',
-                    '',
-                    'Final Fundamental Score',
-                    'Rating'
-                ],
-                'Value': [
-                    self.company_info['company_name'],
-                    self.company_info['ticker'],
-                    self.company_info['sector'],
-                    f"â‚¹{self.company_info['current_price']:.2f}",
-                    f"â‚¹{self.company_info['market_cap']/10000000:.0f}",
-                    self.report_date,
-                    '',
-                    f"{self.final_score:.1f}/100",
-                    'Excellent' if self.final_score >= 80 else 'Good' if self.final_score >= 60 else 'Average'
-                ]
-            }
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Executive Summary', index=False)
-            
-            # Sheet 2: Category Scores
-            category_data = {
-                'Category': [],
-                'Score (0-100)': [],
-                'Weight (%)': [],
-                'Weighted Contribution': []
-            }
-            for cat_name, cat_data in self.category_scores.items():
-                category_data['Category'].append(cat_name)
-                category_data['Score (0-100)'].append(f"{cat_data['score']:.1f}")
-                category_data['Weight (%)'].append(f"{cat_data['weight']*100:.0f}%")
-                category_data['Weighted Contribution'].append(f"{cat_data['score'] * cat_data['weight']:.1f}")
-            
-            category_df = pd.DataFrame(category_data)
-            category_df.to_excel(writer, sheet_name='Category Scores', index=False)
-            
-            # Sheet 3: Individual Metrics
-            metrics_data = {
-                'Category': [],
-                'Metric': [],
-                'Raw Value': [],
-                'Normalized Score': [],
-                'Rating': [],
-                'Weight (%)': []
-            }
-            
-            for metric_name, data in self.scores.items():
-                metric_display = metric_name.replace('_', ' ').title()
-                metrics_data['Category'].append(data['category'])
-                metrics_data['Metric'].append(metric_display)
-                metrics_data['Raw Value'].append(f"{data['raw_value']:.2f}")
-                metrics_data['Normalized Score'].append(f"{data['normalized_score']:.1f}")
-                metrics_data['Rating'].append(data['interpretation'])
-                metrics_data['Weight (%)'].append(f"{data['weight']*100:.0f}%")
-            
-            metrics_df = pd.DataFrame(metrics_data)
-            metrics_df.to_excel(writer, sheet_name='Individual Metrics', index=False)
-            
-            # Sheet 4: Raw Financial Data
-            financial_data = {
-                'Item': [
-                    'Total Revenue (FY24)',
-                    'Net Income (FY24)',
-                    'Total Assets (FY24)',
-                    'Shareholders Equity (FY24)',
-                    'Total Debt (FY24)',
-                    'Free Cash Flow (FY24)',
-                    'EPS (FY24)',
-                    'Book Value Per Share'
-                ],
-                'Value (â‚¹ Crores)': [
-                    '5,680',
-                    '986',
-                    '4,250',
-                    '2,570',
-                    '580',
-                    '940',
-                    '38.30 (per share)',
-                    '99.84 (per share)'
-                ]
-            }
-            financial_df = pd.DataFrame(financial_data)
-            financial_df.to_excel(writer, sheet_name='Financial Data', index=False)
+    def export_to_excel(self, filename='eternal_fundamental_analysis.xlsx', mode='standard'):
+        """
+        Export complete analysis to Excel
+        
+        Args:
+            filename: Output workbook path
+            mode: 'standard' or 'streaming' (write-only workbook), see output_writers.py
+        """
+        # Sheet 1: Executive Summary
+        summary_data = {
+            'Item': [
+                'Company Name',
+                'Ticker',
+                'Sector',
+                'Current Price (â‚¹)',
+                'Market Cap (â‚¹ Cr)',
+                'Report Date',
+                '',
+                'Final Fundamental Score',
+                'Rating'
+            ],
+            'Value': [
+                self.company_info['company_name'],
+                self.company_info['ticker'],
+                self.company_info['sector'],
+                f"â‚¹{self.company_info['current_price']:.2f}",
+                f"â‚¹{self.company_info['market_cap']/10000000:.0f}",
+                self.report_date,
+                '',
+                f"{self.final_score:.1f}/100",
+                'Excellent' if self.final_score >= 80 else 'Good' if self.final_score >= 60 else 'Average'
+            ]
+        }
+        summary_df = pd.DataFrame(summary_data)
+        
+        # Sheet 2: Category Scores
+        category_data = {
+            'Category': [],
+            'Score (0-100)': [],
+            'Weight (%)': [],
+            'Weighted Contribution': []
+        }
+        for cat_name, cat_data in self.category_scores.items():
+            category_data['Category'].append(cat_name)
+            category_data['Score (0-100)'].append(f"{cat_data['score']:.1f}")
+            category_data['Weight (%)'].append(f"{cat_data['weight']*100:.0f}%")
+            category_data['Weighted Contribution'].append(f"{cat_data['score'] * cat_data['weight']:.1f}")
+        
+        category_df = pd.DataFrame(category_data)
+        
+        # Sheet 3: Individual Metrics
+        metrics_data = {
+            'Category': [],
+            'Metric': [],
+            'Raw Value': [],
+            'Normalized Score': [],
+            'Rating': [],
+            'Weight (%)': []
+        }
+        
+        for metric_name, data in self.scores.items():
+            metric_display = metric_name.replace('_', ' ').title()
+            metrics_data['Category'].append(data['category'])
+            metrics_data['Metric'].append(metric_display)
+            metrics_data['Raw Value'].append(f"{data['raw_value']:.2f}")
+            metrics_data['Normalized Score'].append(f"{data['normalized_score']:.1f}")
+            metrics_data['Rating'].append(data['interpretation'])
+            metrics_data['Weight (%)'].append(f"{data['weight']*100:.0f}%")
+        
+        metrics_df = pd.DataFrame(metrics_data)
+        
+        # Sheet 4: Raw Financial Data
+        financial_data = {
+            'Item': [
+                'Total Revenue (FY24)',
+                'Net Income (FY24)',
+                'Total Assets (FY24)',
+                'Shareholders Equity (FY24)',
+                'Total Debt (FY24)',
+                'Free Cash Flow (FY24)',
+                'EPS (FY24)',
+                'Book Value Per Share'
+            ],
+            'Value (â‚¹ Crores)': [
+                '5,680',
+                '986',
+                '4,250',
+                '2,570',
+                '580',
+                '940',
+                '38.30 (per share)',
+                '99.84 (per share)'
+            ]
+        }
+        financial_df = pd.DataFrame(financial_data)
+        
+        write_workbook(filename, {
+            'Executive Summary': summary_df,
+            'Category Scores': category_df,
+            'Individual Metrics': metrics_df,
+            'Financial Data': financial_df,
+        }, mode=mode)
         
         print(f"âœ“ Excel report exported to: {filename}")
     
-    def generate_complete_report(self):
-        """Generate complete report with all components"""
+    def generate_complete_report(self, render_profile='default', skip_viz=False, skip_excel=False):
+        """
+        Generate complete report with all components
+        
+        Args:
+            render_profile: Render profile of the dashboard chart (see create_visualizations)
+            skip_viz: Do not create the dashboard chart (matplotlib is not loaded)
+            skip_excel: Do not export the Excel report (openpyxl is not loaded)
+        """
         self.print_header()
         self.print_executive_summary()
         self.print_category_summary()
         self.print_strengths_and_weaknesses()
         
-        print("\nGenerating visualizations...")
-        self.create_visualizations()
+        generated = []
+        
+        if not skip_viz:
+            print("\nGenerating visualizations...")
+            chart_file = self.create_visualizations(render_profile=render_profile)
+            generated.append(f"{chart_file} - Visual dashboard")
         
-        print("\nExporting to Excel...")
-        self.export_to_excel()
+        if not skip_excel:
+            print("\nExporting to Excel...")
+            self.export_to_excel()
+            generated.append("eternal_fundamental_analysis.xlsx - Detailed Excel report")
         
         print("\n" + "="*80)
         print("REPORT GENERATION COMPLETE")
         print("="*80)
-        print("\nFiles generated:")
-        print("  1. eternal_analysis.png - Visual dashboard")
-        print("  2. eternal_fundamental_analysis.xlsx - Detailed Excel report")
+        if generated:
+            print("\nFiles generated:")
+            for i, description in enumerate(generated, 1):
+                print(f"  {i}. {description}")
         print("\n" + "="*80 + "\n")
 
 
@@ -0,0 +1,120 @@
+﻿"""
+Result Types Module
+Compact per-company result for bulk runs
+
+A bulk run keeps one result per company in memory. Instead of a dictionary
+of dictionaries, CompanyResult stores the metric values and normalized
+scores as float arrays in the fixed METRIC_NAMES order and the category
+contributions in CATEGORY_NAMES order; weights, categories and the other
+constants are looked up in ScoringEngine when needed.
+
+to_dict() converts back to the nested dictionary format (company_info,
+final_score, rating, category_scores, metrics, normalized_scores,
+analysis_date), and result['metrics'] etc. give the same fields.
+"""
+
+import numpy as np
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from metric_calculator import FundamentalMetricsCalculator
+from scoring_engine import CategoryScore, MetricScore, ScoringEngine
+
+# Fixed index of the result arrays
+METRIC_NAMES = FundamentalMetricsCalculator.METRIC_NAMES
+CATEGORY_NAMES = list(ScoringEngine.CATEGORY_WEIGHTS)
+
+_CATEGORY_SIZES = Counter(config['category'] for config in ScoringEngine.METRIC_CONFIG.values())
+
+
+@dataclass(eq=False)
+class CompanyResult:
+    """Scores of one company, with metrics and scores held in arrays"""
+    
+    __slots__ = ('company_info', 'final_score', 'rating', 'metric_values', 'scores',
+                 'interpretations', 'category_values', 'analysis_time')
+    company_info: Dict
+    final_score: float
+    rating: str
+    metric_values: np.ndarray         # raw metric values, METRIC_NAMES order
+    scores: np.ndarray                # normalized scores (0-100), METRIC_NAMES order
+    interpretations: Tuple[str, ...]  # rating of each metric, METRIC_NAMES order
+    category_values: np.ndarray       # category contributions, CATEGORY_NAMES order
+    analysis_time: float              # POSIX timestamp
+    
+    # Fields of the dictionary format, in its key order
+    DICT_KEYS = ('company_info', 'final_score', 'rating', 'category_scores',
+                 'metrics', 'normalized_scores', 'analysis_date')
+    
+    @classmethod
+    def from_scorer(cls, company_info: Dict, scorer: ScoringEngine,
+                    analysis_time: Optional[float] = None) -> 'CompanyResult':
+        """
+        Build a result from a ScoringEngine that scored all metrics
+        
+        Args:
+            company_info: The company's company_info dictionary (kept by reference)
+            scorer: ScoringEngine after calculate_final_score
+            analysis_time: POSIX timestamp of the analysis (default: now)
+        """
+        metric_scores = [scorer.scores[name] for name in METRIC_NAMES]
+        return cls(
+            company_info=company_info,
+            final_score=scorer.final_score,
+            rating=scorer.rating,
+            metric_values=np.array([score.raw_value for score in metric_scores], dtype=float),
+            scores=np.array([score.normalized_score for score in metric_scores], dtype=float),
+            interpretations=tuple(score.interpretation for score in metric_scores),
+            category_values=np.array([scorer.category_scores[name].score for name in CATEGORY_NAMES],
+                                     dtype=float),
+            analysis_time=datetime.now().timestamp() if analysis_time is None else analysis_time,
+        )
+    
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """Raw metric values by name"""
+        return dict(zip(METRIC_NAMES, self.metric_values.tolist()))
+    
+    @property
+    def normalized_scores(self) -> Dict[str, MetricScore]:
+        """MetricScore of each metric by name"""
+        config = ScoringEngine.METRIC_CONFIG
+        return {
+            name: MetricScore(value, score, interpretation, config[name]['weight'], config[name]['category'])
+            for name, value, score, interpretation in zip(
+                METRIC_NAMES, self.metric_values.tolist(), self.scores.tolist(), self.interpretations)
+        }
+    
+    @property
+    def category_scores(self) -> Dict[str, CategoryScore]:
+        """CategoryScore of each category by name"""
+        weights = ScoringEngine.CATEGORY_WEIGHTS
+        return {
+            name: CategoryScore(score, weights[name], _CATEGORY_SIZES[name], weights[name] * 100)
+            for name, score in zip(CATEGORY_NAMES, self.category_values.tolist())
+        }
+    
+    @property
+    def analysis_date(self) -> str:
+        """Analysis time as 'YYYY-MM-DD HH:MM:SS'"""
+        return datetime.fromtimestamp(self.analysis_time).strftime("%Y-%m-%d %H:%M:%S")
+    
+    def __getitem__(self, key: str):
+        """Field of the dictionary format, e.g. result['final_score']"""
+        if key not in self.DICT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def to_dict(self) -> Dict:
+        """Nested dictionary format, as returned by the bulk analyzer before"""
+        return {
+            'company_info': self.company_info,
+            'final_score': self.final_score,
+            'rating': self.rating,
+            'category_scores': {name: score.to_dict() for name, score in self.category_scores.items()},
+            'metrics': self.metrics,
+            'normalized_scores': {name: score.to_dict() for name, score in self.normalized_scores.items()},
+            'analysis_date': self.analysis_date,
+        }
@@ -5,7 +5,49 @@ Normalizes metrics to 0-100 scale and applies weighted scoring
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+class _ItemAccess:
+    """Read-only dictionary-style access (score['weight']) to a slotted result"""
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self.__slots__
+    
+    def to_dict(self) -> Dict:
+        """Plain dictionary, as stored before these types existed"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class MetricScore(_ItemAccess):
+    """Normalized score of one metric"""
+    
+    __slots__ = ('raw_value', 'normalized_score', 'interpretation', 'weight', 'category')
+    raw_value: float
+    normalized_score: float
+    interpretation: str
+    weight: float
+    category: str
+
+
+@dataclass
+class CategoryScore(_ItemAccess):
+    """Contribution of one category to the final score"""
+    
+    __slots__ = ('score', 'weight', 'num_metrics', 'max_possible')
+    score: float
+    weight: float
+    num_metrics: int
+    max_possible: float
 
 
 class ScoringEngine:
@@ -136,17 +178,30 @@ class ScoringEngine:
         },
     }
     
-    def __init__(self, metrics: Dict):
+    # Category weights (informational - final score uses individual metric weights)
+    CATEGORY_WEIGHTS = {
+        'Financial Health': 0.20,
+        'Profitability': 0.25,
+        'Growth': 0.25,
+        'Valuation': 0.20,
+        'Efficiency': 0.10,
+    }
+    
+    def __init__(self, metrics: Dict, verbose: bool = True):
         """
         Initialize scoring engine with calculated metrics
         
         Args:
             metrics: Dictionary of calculated fundamental metrics
+            verbose: Print the human-readable scoring report. Pass False for
+                     bulk runs so no output is formatted at all
         """
         self.metrics = metrics
+        self.verbose = verbose
         self.scores = {}
         self.category_scores = {}
         self.final_score = 0.0
+        self.rating = None
         
     def normalize_metric(self, metric_name: str, value: float) -> Tuple[float, str]:
         """
@@ -226,33 +281,35 @@ class ScoringEngine:
         
         return score, interpretation
     
-    def calculate_scores(self) -> Dict:
-        """Calculate normalized scores for all metrics"""
-        print("\n" + "="*70)
-        print("CALCULATING NORMALIZED SCORES (0-100 scale)")
-        print("="*70 + "\n")
+    def calculate_scores(self) -> Dict[str, MetricScore]:
+        """Calculate normalized scores for all metrics (metric name -> MetricScore)"""
+        if self.verbose:
+            print("\n" + "="*70)
+            print("CALCULATING NORMALIZED SCORES (0-100 scale)")
+            print("="*70 + "\n")
         
         for metric_name, value in self.metrics.items():
             if metric_name in self.METRIC_CONFIG:
                 score, interpretation = self.normalize_metric(metric_name, value)
-                self.scores[metric_name] = {
-                    'raw_value': value,
-                    'normalized_score': score,
-                    'interpretation': interpretation,
-                    'weight': self.METRIC_CONFIG[metric_name]['weight'],
-                    'category': self.METRIC_CONFIG[metric_name]['category']
-                }
+                self.scores[metric_name] = MetricScore(
+                    raw_value=value,
+                    normalized_score=score,
+                    interpretation=interpretation,
+                    weight=self.METRIC_CONFIG[metric_name]['weight'],
+                    category=self.METRIC_CONFIG[metric_name]['category']
+                )
                 
-                metric_display = metric_name.replace('_', ' ').title()
-                print(f"{metric_display}:")
-                print(f"  Raw Value: {value:.2f}")
-                print(f"  Normalized Score: {score:.1f}/100")
-                print(f"  Rating: {interpretation}")
-                print()
+                if self.verbose:
+                    metric_display = metric_name.replace('_', ' ').title()
+                    print(f"{metric_display}:")
+                    print(f"  Raw Value: {value:.2f}")
+                    print(f"  Normalized Score: {score:.1f}/100")
+                    print(f"  Rating: {interpretation}")
+                    print()
         
         return self.scores
     
-    def calculate_category_scores(self) -> Dict:
+    def calculate_category_scores(self) -> Dict[str, CategoryScore]:
         """
         Calculate category scores for informational/visualization purposes
         
@@ -260,22 +317,19 @@ class ScoringEngine:
         Final score = direct sum of individual weighted metrics.
         Category scores shown here are for understanding performance by category.
         """
-        print("\n" + "="*70)
-        print("CATEGORY SCORES (Informational Only)")
-        print("="*70 + "\n")
+        if self.verbose:
+            print("\n" + "="*70)
+            print("CATEGORY SCORES (Informational Only)")
+            print("="*70 + "\n")
         
         categories = {
-            'Financial Health': {'weight': 0.20, 'metrics': []},
-            'Profitability': {'weight': 0.25, 'metrics': []},
-            'Growth': {'weight': 0.25, 'metrics': []},
-            'Valuation': {'weight': 0.20, 'metrics': []},
-            'Efficiency': {'weight': 0.10, 'metrics': []}
+            name: {'weight': weight, 'metrics': []}
+            for name, weight in self.CATEGORY_WEIGHTS.items()
         }
         
         # Group metrics by category
         for metric_name, score_data in self.scores.items():
-            category = score_data['category']
-            categories[category]['metrics'].append(score_data)
+            categories[score_data.category]['metrics'].append(score_data)
         
         # Calculate ACTUAL weighted contribution for each category
         for category_name, category_data in categories.items():
@@ -283,18 +337,18 @@ class ScoringEngine:
             
             for metric in category_data['metrics']:
                 # This is the actual contribution to final score
-                weighted_contribution = metric['normalized_score'] * metric['weight']
+                weighted_contribution = metric.normalized_score * metric.weight
                 total_weighted_contribution += weighted_contribution
             
             # Store actual contribution (not averaged, but summed)
             category_score = total_weighted_contribution
             
-            self.category_scores[category_name] = {
-                'score': category_score,  # This is the contribution, not a 0-100 score
-                'weight': category_data['weight'],
-                'num_metrics': len(category_data['metrics']),
-                'max_possible': category_data['weight'] * 100  # Max if all metrics = 100
-            }
+            self.category_scores[category_name] = CategoryScore(
+                score=category_score,  # This is the contribution, not a 0-100 score
+                weight=category_data['weight'],
+                num_metrics=len(category_data['metrics']),
+                max_possible=category_data['weight'] * 100  # Max if all metrics = 100
+            )
             
             # Determine rating based on percentage of max possible
             max_possible = category_data['weight'] * 100
@@ -311,13 +365,14 @@ class ScoringEngine:
             else:
                 rating = 'Poor'
             
-            print(f"{category_name} ({category_data['weight']*100:.0f}% weight):")
-            print(f"  Contribution to Final Score: {category_score:.2f}")
-            print(f"  Max Possible Contribution: {max_possible:.2f}")
-            print(f"  Performance: {percentage:.1f}% of maximum")
-            print(f"  Rating: {rating}")
-            print(f"  Number of Metrics: {len(category_data['metrics'])}")
-            print()
+            if self.verbose:
+                print(f"{category_name} ({category_data['weight']*100:.0f}% weight):")
+                print(f"  Contribution to Final Score: {category_score:.2f}")
+                print(f"  Max Possible Contribution: {max_possible:.2f}")
+                print(f"  Performance: {percentage:.1f}% of maximum")
+                print(f"  Rating: {rating}")
+                print(f"  Number of Metrics: {len(category_data['metrics'])}")
+                print()
         
         return self.category_scores
     
@@ -336,24 +391,27 @@ class ScoringEngine:
         # Calculate final score as direct sum of all weighted individual metrics
         total_score = 0
         
-        print("\n" + "="*70)
-        print("FINAL SCORE CALCULATION (Direct Weighted Sum)")
-        print("="*70)
-        print(f"{'Metric':<30} {'Norm Score':<12} {'Weight':<10} {'Contribution':<15}")
-        print("-" * 70)
+        if self.verbose:
+            print("\n" + "="*70)
+            print("FINAL SCORE CALCULATION (Direct Weighted Sum)")
+            print("="*70)
+            print(f"{'Metric':<30} {'Norm Score':<12} {'Weight':<10} {'Contribution':<15}")
+            print("-" * 70)
         
         for metric_name, score_data in self.scores.items():
-            normalized_score = score_data['normalized_score']
-            weight = score_data['weight']
+            normalized_score = score_data.normalized_score
+            weight = score_data.weight
             contribution = normalized_score * weight
             total_score += contribution
             
-            metric_display = metric_name.replace('_', ' ').title()
-            print(f"{metric_display:<30} {normalized_score:>6.2f}/100   {weight*100:>5.1f}%     {contribution:>6.2f}")
+            if self.verbose:
+                metric_display = metric_name.replace('_', ' ').title()
+                print(f"{metric_display:<30} {normalized_score:>6.2f}/100   {weight*100:>5.1f}%     {contribution:>6.2f}")
         
-        print("-" * 70)
-        print(f"{'TOTAL FINAL SCORE':<30} {' '*12} {' '*10} {total_score:>6.2f}/100")
-        print("=" * 70)
+        if self.verbose:
+            print("-" * 70)
+            print(f"{'TOTAL FINAL SCORE':<30} {' '*12} {' '*10} {total_score:>6.2f}/100")
+            print("=" * 70)
         
         self.final_score = total_score
         
@@ -368,13 +426,15 @@ class ScoringEngine:
             rating = 'Below Average - Significant concerns'
         else:
             rating = 'Poor - Weak fundamentals'
+        self.rating = rating
         
-        print("\n" + "="*70)
-        print("FINAL FUNDAMENTAL SCORE")
-        print("="*70)
-        print(f"\nOverall Score: {self.final_score:.1f}/100")
-        print(f"Rating: {rating}")
-        print("="*70 + "\n")
+        if self.verbose:
+            print("\n" + "="*70)
+            print("FINAL FUNDAMENTAL SCORE")
+            print("="*70)
+            print(f"\nOverall Score: {self.final_score:.1f}/100")
+            print(f"Rating: {rating}")
+            print("="*70 + "\n")
         
         return self.final_score
     
@@ -424,6 +484,229 @@ class ScoringEngine:
         
         return pd.DataFrame(data)
 
+    # ==================== BATCH (VECTORIZED) SCORING ====================
+    
+    @classmethod
+    def normalize_metric_array(cls, metric_name: str, values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized version of normalize_metric for one metric across many companies
+        
+        Applies the same piecewise-linear ranges from METRIC_CONFIG with NumPy
+        array operations. Results are identical to calling normalize_metric
+        value by value, including the zero (missing data) and infinity rules.
+        
+        Args:
+            metric_name: Name of the metric
+            values: 1-D array-like of raw metric values
+        
+        Returns:
+            Tuple of (normalized_scores, interpretations) arrays
+        """
+        config = cls.METRIC_CONFIG[metric_name]
+        direction = config['direction']
+        ideal_min = config['ideal_min']
+        ideal_max = config['ideal_max']
+        v = np.asarray(values, dtype=float)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if direction == 'higher':
+                acceptable_min = config.get('acceptable_min', 0)
+                
+                conditions = [v >= ideal_max, v >= ideal_min, v >= acceptable_min]
+                upper_band = 80 + ((v - ideal_min) / (ideal_max - ideal_min)) * 20
+                middle_band = 40 + ((v - acceptable_min) / (ideal_min - acceptable_min)) * 40
+                if acceptable_min > 0:
+                    # NaN compares False, matching Python's max(0, nan) -> 0
+                    below = (v / acceptable_min) * 40
+                    below = np.where(below > 0, below, 0.0)
+                else:
+                    below = np.zeros_like(v)
+                inf_score, inf_label = 100.0, 'Excellent'
+            else:
+                acceptable_max = config.get('acceptable_max', ideal_max * 2)
+                
+                conditions = [v <= ideal_min, v <= ideal_max, v <= acceptable_max]
+                upper_band = 80 + ((ideal_max - v) / (ideal_max - ideal_min)) * 20
+                middle_band = 40 + ((acceptable_max - v) / (acceptable_max - ideal_max)) * 40
+                below = 40 * (1 - (v - acceptable_max) / acceptable_max)
+                below = np.where(below > 0, below, 0.0)
+                inf_score, inf_label = 0.0, 'Poor'
+            
+            raw_score = np.select(conditions, [np.full_like(v, 100.0), upper_band, middle_band], below)
+        
+        interpretation = np.select(
+            conditions,
+            ['Excellent', 'Very Good', np.where(raw_score >= 60, 'Good', 'Average')],
+            np.where(raw_score >= 20, 'Below Average', 'Poor'),
+        ).astype(object)
+        
+        # Ensure score is between 0 and 100
+        score = np.clip(raw_score, 0, 100)
+        
+        # Infinity and zero (missing data) rules take precedence, as in normalize_metric
+        is_inf = v == np.inf
+        score[is_inf] = inf_score
+        interpretation[is_inf] = inf_label
+        
+        is_missing = v == 0
+        score[is_missing] = 0.0
+        interpretation[is_missing] = 'Missing Data'
+        
+        return score, interpretation
+    
+    @classmethod
+    def score_batch(cls, values, metric_names=None) -> Dict:
+        """
+        Score a whole universe of companies in one vectorized pass
+        
+        Args:
+            values: 2-D array (companies x metrics) or DataFrame with one
+                    column per metric
+            metric_names: Metric name for each column. Defaults to the
+                          DataFrame's METRIC_CONFIG columns, or to the
+                          METRIC_CONFIG order for plain arrays
+        
+        Returns:
+            Dictionary with 'normalized_scores', 'interpretations' and
+            'category_scores' DataFrames plus a 'final_score' Series,
+            all indexed by company
+        """
+        if isinstance(values, pd.DataFrame):
+            if metric_names is None:
+                metric_names = [m for m in cls.METRIC_CONFIG if m in values.columns]
+            index = values.index
+            matrix = values[metric_names].to_numpy(dtype=float)
+        else:
+            matrix = np.atleast_2d(np.asarray(values, dtype=float))
+            if metric_names is None:
+                metric_names = list(cls.METRIC_CONFIG)
+            index = pd.RangeIndex(matrix.shape[0])
+        
+        metric_names = list(metric_names)
+        if matrix.shape[1] != len(metric_names):
+            raise ValueError(
+                f"Expected {len(metric_names)} metric columns, got {matrix.shape[1]}"
+            )
+        unknown = [m for m in metric_names if m not in cls.METRIC_CONFIG]
+        if unknown:
+            raise ValueError(f"Unknown metrics: {unknown}")
+        
+        scores = np.empty_like(matrix)
+        interpretations = np.empty(matrix.shape, dtype=object)
+        
+        for j, metric_name in enumerate(metric_names):
+            scores[:, j], interpretations[:, j] = cls.normalize_metric_array(metric_name, matrix[:, j])
+        
+        return cls._batch_result(
+            pd.DataFrame(scores, index=index, columns=metric_names),
+            pd.DataFrame(interpretations, index=index, columns=metric_names),
+        )
+    
+    @classmethod
+    def rescore_batch(cls, batch_scores: Dict, values: pd.DataFrame, metric_names: List[str]) -> Dict:
+        """
+        Re-score only some metrics of an earlier score_batch result
+        
+        Used with BatchMetricsCalculator.reprice: only the price-dependent
+        metrics are normalized again; the other metric scores are reused and
+        the category and final scores are re-aggregated.
+        
+        Args:
+            batch_scores: Result of score_batch for the same companies
+            values: DataFrame with the new raw values of metric_names
+            metric_names: Metrics to re-score
+        
+        Returns:
+            Dictionary in the same format as score_batch
+        """
+        scores = batch_scores['normalized_scores'].copy()
+        interpretations = batch_scores['interpretations'].copy()
+        
+        for metric_name in metric_names:
+            score, interpretation = cls.normalize_metric_array(
+                metric_name, values[metric_name].reindex(scores.index))
+            scores[metric_name] = score
+            interpretations[metric_name] = interpretation
+        
+        return cls._batch_result(scores, interpretations)
+    
+    @classmethod
+    def percentile_scores(cls, values: pd.DataFrame, groups=None, metric_names=None) -> Dict:
+        """
+        Cross-sectional scoring: rank each metric across the universe
+        
+        Instead of the fixed ranges in METRIC_CONFIG, a company's score for a
+        metric is its percentile among all companies (or among its group,
+        e.g. sector), oriented by the metric's direction so that 100 is always
+        best. The whole companies x metrics matrix is ranked in one vectorized
+        pass. Zero and NaN values count as missing data and score 0, as in
+        normalize_metric; infinite values rank as best or worst.
+        
+        Args:
+            values: DataFrame (companies x metrics) of raw metric values
+            groups: Optional group label per company (e.g. sector) to rank within
+            metric_names: Metrics to score. Defaults to the METRIC_CONFIG
+                          columns present in values
+        
+        Returns:
+            Dictionary in the same format as score_batch, with percentile
+            scores (0-100) as 'normalized_scores'
+        """
+        if metric_names is None:
+            metric_names = [m for m in cls.METRIC_CONFIG if m in values.columns]
+        metric_names = list(metric_names)
+        
+        matrix = values[metric_names].astype(float)
+        matrix = matrix.where(matrix != 0)  # zero = missing data
+        
+        # Lower-is-better metrics are ranked on their negated values
+        signs = np.array([1.0 if cls.METRIC_CONFIG[m]['direction'] == 'higher' else -1.0
+                          for m in metric_names])
+        oriented = matrix * signs
+        
+        if groups is None:
+            ranks = oriented.rank(pct=True)
+        else:
+            labels = pd.Series(np.asarray(groups, dtype=object), index=oriented.index).fillna('N/A')
+            ranks = oriented.groupby(labels).rank(pct=True)
+        
+        scores = (ranks * 100).fillna(0.0)
+        
+        bands = scores.to_numpy()
+        interpretations = np.select(
+            [bands >= 80, bands >= 60, bands >= 40, bands >= 20],
+            ['Top 20%', 'Top 40%', 'Middle 20%', 'Bottom 40%'],
+            'Bottom 20%',
+        ).astype(object)
+        interpretations[matrix.isna().to_numpy()] = 'Missing Data'
+        
+        return cls._batch_result(
+            scores,
+            pd.DataFrame(interpretations, index=scores.index, columns=metric_names),
+        )
+    
+    @classmethod
+    def _batch_result(cls, scores: pd.DataFrame, interpretations: pd.DataFrame) -> Dict:
+        """Aggregate normalized metric scores into category and final scores"""
+        index = scores.index
+        category_scores = {name: np.zeros(len(index)) for name in cls.CATEGORY_WEIGHTS}
+        final_score = np.zeros(len(index))
+        
+        # Accumulate column by column (same order as the scalar path) so the
+        # floating-point sums match calculate_category_scores/calculate_final_score
+        for metric_name in scores.columns:
+            contribution = scores[metric_name].to_numpy() * cls.METRIC_CONFIG[metric_name]['weight']
+            category = cls.METRIC_CONFIG[metric_name]['category']
+            category_scores[category] = category_scores[category] + contribution
+            final_score = final_score + contribution
+        
+        return {
+            'normalized_scores': scores,
+            'interpretations': interpretations,
+            'category_scores': pd.DataFrame(category_scores, index=index),
+            'final_score': pd.Series(final_score, index=index, name='final_score'),
+        }
+
 
 if __name__ == "__main__":
     # Test with sample data
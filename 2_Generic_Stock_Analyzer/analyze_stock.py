@@ -17,6 +17,24 @@ Usage:
 
     # Full analysis with all options
     python analyze_stock.py --file "INFY.csv" --company "Infosys" --all
+    
+    # Run every step inside this interpreter instead of one subprocess per step
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --in-process
+    
+    # Store tables as Parquet and publish CSV copies at the end
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --storage parquet --publish-csv
+    
+    # Daily refresh: only fold new bars into the saved technical indicator state
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --incremental
+    
+    # Steps whose input and settings are unchanged are skipped; rerun everything with
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --force
+    
+    # Render the charts in parallel worker processes
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --chart-workers 5
+    
+    # Fast low-resolution charts (or: web, print for PDF, svg)
+    python analyze_stock.py --file "INFY.csv" --company "Infosys" --render-profile draft
 """
 
 import subprocess
@@ -24,24 +42,115 @@ import argparse
 import os
 import sys
 from datetime import datetime
+from table_storage import STORAGE_FORMATS, find_table, publish_csv
+from render_profiles import RENDER_PROFILES
+from stage_cache import StageCache, code_version, file_hash
 
 class StockAnalysisPipeline:
     """Master pipeline for complete stock analysis"""
     
-    def __init__(self, csv_file, company_name, skip_stats=False, skip_viz=False, skip_reports=False):
+    def __init__(self, csv_file, company_name, skip_stats=False, skip_viz=False, skip_reports=False,
+                 output_root=None, in_process=False, storage='csv', publish_csv=False,
+                 incremental=False, force=False, cache_max_age=30, chart_workers=1,
+                 chart_executor=None, defer_charts=False, render_profile='default'):
+        """
+        Parameters:
+        -----------
+        output_root : str, optional
+            Directory in which the analysis directory is created (default: current directory)
+        in_process : bool
+            Call the analyzer classes directly instead of launching one
+            Python subprocess per step (used by the batch tools). The
+            prepared price data is then handed from step to step in memory;
+            CSV files are only written as outputs, never read back.
+        storage : str
+            Table format for all outputs: 'csv', 'parquet' or 'feather'
+        publish_csv : bool
+            Write CSV copies of all tables at the end (Parquet/Feather storage)
+        incremental : bool
+            Statistical step only folds new bars into the saved indicator state
+        force : bool
+            Run every step even if its cached outputs are current
+        cache_max_age : float
+            Days after which cached step outputs are recomputed (see stage_cache.py)
+        chart_workers : int
+            Render the charts in this many parallel processes
+        chart_executor : Executor, optional
+            Shared chart pool (universal_visualization_generator.chart_pool)
+            to render the charts in (in-process mode); reused across stocks
+        defer_charts : bool
+            Do not render the charts; the caller submits them to its own pool
+            and records the visualization step (see deferred_viz_key)
+        render_profile : str
+            Chart resolution/format (see render_profiles.py)
+        """
         self.csv_file = csv_file
         self.company_name = company_name
         self.skip_stats = skip_stats
         self.skip_viz = skip_viz
         self.skip_reports = skip_reports
+        self.output_root = output_root
+        self.in_process = in_process
+        self.storage = storage
+        self.publish_csv = publish_csv
+        self.incremental = incremental
+        self.force = force
+        self.chart_workers = chart_workers
+        self.chart_executor = chart_executor
+        self.defer_charts = defer_charts
+        self.render_profile = render_profile
+        self.deferred_viz_key = None
         
         # Determine output directory
         self.output_dir = f"{company_name.replace(' ', '_')}_Analysis_Complete"
+        if output_root:
+            self.output_dir = os.path.join(output_root, self.output_dir)
         self.master_data_file = None
         
+        # In-memory stage outputs (in-process mode only)
+        self.source_df = None
+        self.master_df = None
+        self.enhanced_df = None
+        
         # Get script directory
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         
+        # Analyzer modules live next to this script
+        if in_process and self.script_dir not in sys.path:
+            sys.path.insert(0, self.script_dir)
+        
+        # Stage cache: steps are keyed on the input content, step options and analyzer code
+        self.cache = StageCache(self.output_dir, max_age_days=cache_max_age)
+        self.cache_base = {
+            'input': file_hash(csv_file),
+            'code': code_version(self.script_dir),
+            'company': company_name,
+            'storage': storage,
+        }
+        self.stage_key = ''
+        self.stage_snapshot = None
+    
+    def stage_cached(self, stage, **params):
+        """
+        Check the stage cache before running a step
+        
+        Returns True (and prints a note) if the step's outputs from an earlier
+        run are still current, so the step can be skipped.
+        """
+        self.stage_key = self.cache.key(stage, dict(self.cache_base, **params), self.stage_key)
+        
+        if not self.force and self.cache.hit(stage, self.stage_key):
+            print(f" Input and settings unchanged - reusing cached {stage} outputs (use --force to rerun)")
+            return True
+        
+        self.stage_snapshot = self.cache.snapshot()
+        return False
+    
+    def cache_stage(self, stage):
+        """Record the outputs of a successfully completed step"""
+        self.cache.record(stage, self.stage_key, self.stage_snapshot)
+        self.cache.save()
+    
     def print_banner(self):
         """Print analysis banner"""
         print(f"\n{'='*80}")
@@ -67,18 +176,33 @@ class StockAnalysisPipeline:
         print(f"STEP 1: PATTERN ANALYSIS")
         print(f"{'='*80}\n")
         
-        script = os.path.join(self.script_dir, "universal_pattern_analyzer.py")
-        
-        cmd = [
-            sys.executable,
-            script,
-            "--file", self.csv_file,
-            "--company", self.company_name
-        ]
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        if result.returncode != 0:
+        cached = self.stage_cached('pattern')
+        if cached:
+            success = True
+        elif self.in_process:
+            from universal_pattern_analyzer import UniversalPatternAnalyzer
+            analyzer = UniversalPatternAnalyzer(self.csv_file, self.company_name,
+                                                output_root=self.output_root, storage=self.storage)
+            success = analyzer.run_complete_analysis()
+            if success:
+                self.master_df = analyzer.df
+                self.source_df = analyzer.df[analyzer.source_columns]
+        else:
+            script = os.path.join(self.script_dir, "universal_pattern_analyzer.py")
+            
+            cmd = [
+                sys.executable,
+                script,
+                "--file", self.csv_file,
+                "--company", self.company_name,
+                "--storage", self.storage
+            ]
+            if self.output_root:
+                cmd += ["--output-root", self.output_root]
+            
+            success = subprocess.run(cmd, capture_output=False).returncode == 0
+        
+        if not success:
             print(f"\n Pattern analysis failed!")
             return False
         
@@ -86,10 +210,13 @@ class StockAnalysisPipeline:
         company_slug = self.company_name.replace(' ', '_').lower()
         self.master_data_file = f"{self.output_dir}/00_Master_Data/{company_slug}_master_data_enhanced.csv"
         
-        if not os.path.exists(self.master_data_file):
+        if find_table(self.master_data_file) is None:
             print(f"\n Master data file not found: {self.master_data_file}")
             return False
         
+        if not cached:
+            self.cache_stage('pattern')
+        
         print(f"\n Pattern analysis complete!")
         return True
     
@@ -103,21 +230,40 @@ class StockAnalysisPipeline:
         print(f"STEP 2: STATISTICAL ANALYSIS")
         print(f"{'='*80}\n")
         
-        script = os.path.join(self.script_dir, "universal_statistical_analyzer.py")
-        
-        cmd = [
-            sys.executable,
-            script,
-            "--file", self.master_data_file,
-            "--company", self.company_name
-        ]
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        if result.returncode != 0:
+        cached = self.stage_cached('statistical', incremental=self.incremental)
+        if cached:
+            success = True
+        elif self.in_process:
+            from universal_statistical_analyzer import UniversalStatisticalAnalyzer
+            master_df = self.master_df.copy() if self.master_df is not None else None
+            analyzer = UniversalStatisticalAnalyzer(self.master_data_file, self.company_name,
+                                                    df=master_df, storage=self.storage,
+                                                    incremental=self.incremental)
+            success = analyzer.run_complete_analysis()
+            if success:
+                self.enhanced_df = analyzer.df
+        else:
+            script = os.path.join(self.script_dir, "universal_statistical_analyzer.py")
+            
+            cmd = [
+                sys.executable,
+                script,
+                "--file", self.master_data_file,
+                "--company", self.company_name,
+                "--storage", self.storage
+            ]
+            if self.incremental:
+                cmd.append("--incremental")
+            
+            success = subprocess.run(cmd, capture_output=False).returncode == 0
+        
+        if not success:
             print(f"\n  Statistical analysis failed (continuing anyway)")
             return True  # Don't fail entire pipeline
         
+        if not cached:
+            self.cache_stage('statistical')
+        
         print(f"\n Statistical analysis complete!")
         return True
     
@@ -127,23 +273,40 @@ class StockAnalysisPipeline:
         print(f"STEP 3: FUNDAMENTAL METRICS ANALYSIS")
         print(f"{'='*80}\n")
         
-        script = os.path.join(self.script_dir, "fundamental_metrics_analyzer.py")
-        
         # Use original CSV file (has all fundamental columns)
-        cmd = [
-            sys.executable,
-            script,
-            "--file", self.csv_file,
-            "--company", self.company_name,
-            "--output", self.output_dir
-        ]
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        if result.returncode != 0:
+        cached = self.stage_cached('fundamental')
+        if cached:
+            success = True
+        elif self.in_process:
+            from fundamental_metrics_analyzer import FundamentalMetricsAnalyzer
+            try:
+                FundamentalMetricsAnalyzer(self.csv_file, self.company_name, self.output_dir,
+                                           df=self.source_df, storage=self.storage).run_all_analyses()
+                success = True
+            except Exception as e:
+                print(f"\n ERROR: {str(e)}")
+                success = False
+        else:
+            script = os.path.join(self.script_dir, "fundamental_metrics_analyzer.py")
+            
+            cmd = [
+                sys.executable,
+                script,
+                "--file", self.csv_file,
+                "--company", self.company_name,
+                "--output", self.output_dir,
+                "--storage", self.storage
+            ]
+            
+            success = subprocess.run(cmd, capture_output=False).returncode == 0
+        
+        if not success:
             print(f"\n  Fundamental analysis failed (continuing anyway)")
             return True  # Don't fail entire pipeline
         
+        if not cached:
+            self.cache_stage('fundamental')
+        
         print(f"\n Fundamental analysis complete!")
         return True
     
@@ -157,21 +320,49 @@ class StockAnalysisPipeline:
         print(f"STEP 4: VISUALIZATION GENERATION")
         print(f"{'='*80}\n")
         
-        script = os.path.join(self.script_dir, "universal_visualization_generator.py")
-        
-        cmd = [
-            sys.executable,
-            script,
-            "--analysis_dir", self.output_dir,
-            "--company", self.company_name
-        ]
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        if result.returncode != 0:
+        cached = self.stage_cached('visualization', skip_stats=self.skip_stats,
+                                   render_profile=self.render_profile)
+        if cached:
+            success = True
+        elif self.defer_charts:
+            # Charts are rendered (and the step recorded) by the caller
+            self.deferred_viz_key = self.stage_key
+            print(f" Charts deferred to the shared chart pool")
+            return True
+        elif self.in_process:
+            from universal_visualization_generator import UniversalVisualizationGenerator, chart_pool
+            generator = UniversalVisualizationGenerator(self.output_dir, self.company_name,
+                                                        master_df=self.master_df,
+                                                        enhanced_df=self.enhanced_df,
+                                                        render_profile=self.render_profile)
+            if self.chart_executor is not None:
+                success = generator.run_all_visualizations(self.chart_executor)
+            elif self.chart_workers > 1:
+                with chart_pool(self.chart_workers) as executor:
+                    success = generator.run_all_visualizations(executor)
+            else:
+                success = generator.run_all_visualizations()
+        else:
+            script = os.path.join(self.script_dir, "universal_visualization_generator.py")
+            
+            cmd = [
+                sys.executable,
+                script,
+                "--analysis_dir", self.output_dir,
+                "--company", self.company_name,
+                "--workers", str(self.chart_workers),
+                "--render-profile", self.render_profile
+            ]
+            
+            success = subprocess.run(cmd, capture_output=False).returncode == 0
+        
+        if not success:
             print(f"\n  Visualization generation failed (continuing anyway)")
             return True  # Don't fail entire pipeline
         
+        if not cached:
+            self.cache_stage('visualization')
+        
         print(f"\n Visualization generation complete!")
         return True
     
@@ -185,21 +376,35 @@ class StockAnalysisPipeline:
         print(f"STEP 5: REPORT GENERATION")
         print(f"{'='*80}\n")
         
-        script = os.path.join(self.script_dir, "universal_report_generator.py")
-        
-        cmd = [
-            sys.executable,
-            script,
-            "--analysis_dir", self.output_dir,
-            "--company", self.company_name
-        ]
-        
-        result = subprocess.run(cmd, capture_output=False)
-        
-        if result.returncode != 0:
+        cached = self.stage_cached('reports', skip_stats=self.skip_stats, skip_viz=self.skip_viz,
+                                   render_profile=self.render_profile)
+        if cached:
+            success = True
+        elif self.in_process:
+            from universal_report_generator import UniversalReportGenerator
+            generator = UniversalReportGenerator(self.output_dir, self.company_name,
+                                                 render_profile=self.render_profile)
+            success = generator.run_all_reports()
+        else:
+            script = os.path.join(self.script_dir, "universal_report_generator.py")
+            
+            cmd = [
+                sys.executable,
+                script,
+                "--analysis_dir", self.output_dir,
+                "--company", self.company_name,
+                "--render-profile", self.render_profile
+            ]
+            
+            success = subprocess.run(cmd, capture_output=False).returncode == 0
+        
+        if not success:
             print(f"\n  Report generation failed (continuing anyway)")
             return True  # Don't fail entire pipeline
         
+        if not cached:
+            self.cache_stage('reports')
+        
         print(f"\n Report generation complete!")
         return True
     
@@ -241,7 +446,7 @@ class StockAnalysisPipeline:
         # Visualizations
         viz_dir = f"{self.output_dir}/08_Visualizations"
         if os.path.exists(viz_dir):
-            charts = [f for f in os.listdir(viz_dir) if f.endswith('.png')]
+            charts = [f for f in os.listdir(viz_dir) if f.endswith(('.png', '.pdf', '.svg'))]
             if charts:
                 print(f"\nVisualizations:")
                 for chart in sorted(charts):
@@ -286,6 +491,11 @@ class StockAnalysisPipeline:
             print(f"\n Pipeline failed at report generation step")
             return False
         
+        # Publish CSV copies of Parquet/Feather tables
+        if self.publish_csv and self.storage != 'csv':
+            published = publish_csv(self.output_dir)
+            print(f"\n Published {len(published)} CSV files")
+        
         # Summary
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -340,6 +550,24 @@ Output:
                        help='Skip report generation (faster)')
     parser.add_argument('--all', action='store_true',
                        help='Run complete analysis (default, overrides skip flags)')
+    parser.add_argument('--output-root', default=None,
+                       help='Directory in which to create the analysis directory (default: current directory)')
+    parser.add_argument('--in-process', action='store_true',
+                       help='Run all steps in this process instead of one subprocess per step')
+    parser.add_argument('--storage', choices=list(STORAGE_FORMATS), default='csv',
+                       help='Table format for all outputs (parquet/feather need pyarrow)')
+    parser.add_argument('--publish-csv', action='store_true',
+                       help='Also write CSV copies of all tables at the end')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Daily refresh: only fold new bars into the saved indicator state')
+    parser.add_argument('--force', action='store_true',
+                       help='Rerun every step even if cached outputs are current')
+    parser.add_argument('--cache-max-age', type=float, default=30,
+                       help='Days after which cached step outputs are recomputed (default: 30)')
+    parser.add_argument('--chart-workers', type=int, default=1,
+                       help='Render charts in parallel with this many processes (default: 1)')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                       help='Chart resolution/format: draft, web, print (PDF), svg (default: 300 DPI PNG)')
     
     args = parser.parse_args()
     
@@ -359,7 +587,16 @@ Output:
         company_name=args.company,
         skip_stats=skip_stats,
         skip_viz=skip_viz,
-        skip_reports=skip_reports
+        skip_reports=skip_reports,
+        output_root=args.output_root,
+        in_process=args.in_process,
+        storage=args.storage,
+        publish_csv=args.publish_csv,
+        incremental=args.incremental,
+        force=args.force,
+        cache_max_age=args.cache_max_age,
+        chart_workers=args.chart_workers,
+        render_profile=args.render_profile
     )
     
     success = pipeline.run_complete_pipeline()
@@ -7,14 +7,19 @@ import pandas as pd
 import numpy as np
 import os
 from pathlib import Path
+from table_storage import STORAGE_FORMATS, read_table, write_table
 
 class FundamentalMetricsAnalyzer:
-    def __init__(self, data_file, company_name, output_base_dir):
+    def __init__(self, data_file, company_name, output_base_dir, df=None, storage='csv'):
         """
         Initialize with enhanced data including fundamental metrics
         Expected columns: Date, Open, High, Low, Close, Volume, MCAP, NO_TRADES, PRICE_BV, VALUE
+        
+        If df is given it is used instead of reading data_file. Output tables
+        are written in the given storage format ('csv', 'parquet' or 'feather').
         """
         self.company_name = company_name
+        self.storage = storage
         self.data_file = data_file
         self.output_base_dir = output_base_dir
         
@@ -23,7 +28,7 @@ class FundamentalMetricsAnalyzer:
         os.makedirs(self.output_dir, exist_ok=True)
         
         # Load data
-        self.df = pd.read_csv(data_file)
+        self.df = df.copy() if df is not None else pd.read_csv(data_file)
         
         # Verify required columns
         required = ['Date', 'Close', 'Volume']
@@ -102,7 +107,7 @@ class FundamentalMetricsAnalyzer:
         
         stats_df = pd.DataFrame(stats)
         stats_file = os.path.join(self.output_dir, "market_cap_statistics.csv")
-        stats_df.to_csv(stats_file, index=False)
+        write_table(stats_df, stats_file, self.storage)
         
         print(f"\n Overall Statistics:")
         for _, row in stats_df.iterrows():
@@ -117,7 +122,7 @@ class FundamentalMetricsAnalyzer:
         yearly['Growth_%'] = ((yearly['MCAP_last'] - yearly['MCAP_first']) / yearly['MCAP_first'] * 100).round(2)
         
         yearly_file = os.path.join(self.output_dir, "market_cap_yearly.csv")
-        yearly.to_csv(yearly_file)
+        write_table(yearly, yearly_file, self.storage, index=True)
         
         print(f"\n Yearly Market Cap Growth:")
         for year, row in yearly.tail(10).iterrows():
@@ -132,7 +137,7 @@ class FundamentalMetricsAnalyzer:
         quarterly['Growth_%'] = ((quarterly['MCAP_last'] - quarterly['MCAP_first']) / quarterly['MCAP_first'] * 100).round(2)
         
         quarterly_file = os.path.join(self.output_dir, "market_cap_quarterly.csv")
-        quarterly.to_csv(quarterly_file)
+        write_table(quarterly, quarterly_file, self.storage, index=True)
         
         print(f"\n Recent Quarterly MCAP Trends:")
         for (year, qtr), row in quarterly.tail(12).iterrows():
@@ -218,7 +223,7 @@ class FundamentalMetricsAnalyzer:
         
         stats_df = pd.DataFrame(stats)
         stats_file = os.path.join(self.output_dir, "liquidity_statistics.csv")
-        stats_df.to_csv(stats_file, index=False)
+        write_table(stats_df, stats_file, self.storage)
         
         print(f"\n Liquidity Statistics:")
         for _, row in stats_df.iterrows():
@@ -235,7 +240,7 @@ class FundamentalMetricsAnalyzer:
         yearly.columns = ['_'.join(col) for col in yearly.columns]
         
         yearly_file = os.path.join(self.output_dir, "liquidity_yearly.csv")
-        yearly.to_csv(yearly_file)
+        write_table(yearly, yearly_file, self.storage, index=True)
         
         print(f"\n Recent Yearly Trends:")
         for year, row in yearly.tail(10).iterrows():
@@ -283,7 +288,7 @@ class FundamentalMetricsAnalyzer:
         
         stats_df = pd.DataFrame(stats)
         stats_file = os.path.join(self.output_dir, "valuation_statistics.csv")
-        stats_df.to_csv(stats_file, index=False)
+        write_table(stats_df, stats_file, self.storage)
         
         print(f"\n Valuation Statistics:")
         for _, row in stats_df.iterrows():
@@ -298,7 +303,7 @@ class FundamentalMetricsAnalyzer:
         yearly['Change_%'] = ((yearly['PRICE_BV_last'] - yearly['PRICE_BV_first']) / yearly['PRICE_BV_first'] * 100).round(2)
         
         yearly_file = os.path.join(self.output_dir, "valuation_yearly.csv")
-        yearly.to_csv(yearly_file)
+        write_table(yearly, yearly_file, self.storage, index=True)
         
         print(f"\n Yearly P/BV Trends:")
         for year, row in yearly.tail(10).iterrows():
@@ -317,7 +322,7 @@ class FundamentalMetricsAnalyzer:
         })
         
         zones_file = os.path.join(self.output_dir, "valuation_zones.csv")
-        zones.to_csv(zones_file, index=False)
+        write_table(zones, zones_file, self.storage)
         
         print(f"\n Valuation Zones (based on historical percentiles):")
         for _, row in zones.iterrows():
@@ -353,7 +358,7 @@ class FundamentalMetricsAnalyzer:
             # Market Cap Summary
             if self.has_mcap:
                 f.write(f"##  Market Capitalization\n\n")
-                mcap_stats = pd.read_csv(os.path.join(self.output_dir, "market_cap_statistics.csv"))
+                mcap_stats = read_table(os.path.join(self.output_dir, "market_cap_statistics.csv"))
                 f.write(f"| Metric | Value |\n")
                 f.write(f"|--------|-------|\n")
                 for _, row in mcap_stats.iterrows():
@@ -362,7 +367,7 @@ class FundamentalMetricsAnalyzer:
             
             # Liquidity Summary
             f.write(f"##  Liquidity & Trading Activity\n\n")
-            liq_stats = pd.read_csv(os.path.join(self.output_dir, "liquidity_statistics.csv"))
+            liq_stats = read_table(os.path.join(self.output_dir, "liquidity_statistics.csv"))
             f.write(f"| Metric | Value |\n")
             f.write(f"|--------|-------|\n")
             for _, row in liq_stats.iterrows():
@@ -373,7 +378,7 @@ class FundamentalMetricsAnalyzer:
             # Valuation Summary
             if self.has_pbv:
                 f.write(f"##  Valuation (Price to Book Value)\n\n")
-                val_stats = pd.read_csv(os.path.join(self.output_dir, "valuation_statistics.csv"))
+                val_stats = read_table(os.path.join(self.output_dir, "valuation_statistics.csv"))
                 f.write(f"| Metric | Value |\n")
                 f.write(f"|--------|-------|\n")
                 for _, row in val_stats.iterrows():
@@ -418,9 +423,10 @@ if __name__ == "__main__":
     parser.add_argument('--file', required=True, help='CSV file with stock data')
     parser.add_argument('--company', required=True, help='Company name')
     parser.add_argument('--output', default='.', help='Output base directory')
+    parser.add_argument('--storage', choices=list(STORAGE_FORMATS), default='csv', help='Output table format')
     
     args = parser.parse_args()
     
-    analyzer = FundamentalMetricsAnalyzer(args.file, args.company, args.output)
+    analyzer = FundamentalMetricsAnalyzer(args.file, args.company, args.output, storage=args.storage)
     analyzer.run_all_analyses()
 
@@ -0,0 +1,256 @@
+﻿"""
+Incremental Indicator State
+===========================
+Append-only updates of the technical indicators for daily refreshes.
+
+A full statistical analysis recomputes every indicator over the whole price
+history. IndicatorState instead keeps the running state of each indicator:
+- Moving averages, RSI, Bollinger Bands, ATR: the current window and its
+  running mean/variance (Welford updates, O(1) per new bar)
+- MACD: the fast, slow and signal EMA values and their weights, updated
+  like pandas ewm(adjust=False), including across missing closes
+
+The state is saved next to the analysis tables (indicator_state.json) and
+new bars are folded in one at a time. Results match a full recompute with
+UniversalStatisticalAnalyzer to within float rounding.
+
+Usage:
+    state = IndicatorState()
+    state.fold(history_df)                 # once, from the full history
+    state.save("indicator_state.json")
+    
+    state = IndicatorState.load("indicator_state.json")
+    values = state.update(date, high, low, close)   # one dict per new bar
+"""
+
+import numpy as np
+import json
+from collections import deque
+
+
+class RollingWindow:
+    """Fixed-size window with running mean and variance (Welford add/remove)"""
+    
+    def __init__(self, size, values=()):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.count = 0        # non-NaN values in the window
+        self.nan_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        for value in values:
+            self.push(value)
+    
+    def _add(self, x):
+        if np.isnan(x):
+            self.nan_count += 1
+            return
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+    
+    def _remove(self, x):
+        if np.isnan(x):
+            self.nan_count -= 1
+            return
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (x - self.mean)
+    
+    def push(self, x):
+        """Add a value, dropping the oldest one once the window is full"""
+        x = float(x)
+        if len(self.values) == self.size:
+            self._remove(self.values[0])
+        self.values.append(x)
+        self._add(x)
+    
+    @property
+    def ready(self):
+        """Window is full and has no missing values (pandas rolling default)"""
+        return len(self.values) == self.size and self.nan_count == 0
+    
+    def window_mean(self):
+        return self.mean if self.ready else np.nan
+    
+    def window_std(self):
+        if not self.ready or self.size < 2:
+            return np.nan
+        return np.sqrt(max(self.m2, 0.0) / (self.size - 1))
+
+
+class IndicatorState:
+    """
+    Running state of all technical indicators of one stock
+    
+    Uses the same definitions and parameters as UniversalStatisticalAnalyzer:
+    simple-average RSI, EMA-based MACD (adjust=False), Bollinger Bands with
+    sample standard deviation and ATR as a simple average of the true range.
+    """
+    
+    def __init__(self, ma_periods=[20, 50, 100, 200], rsi_period=14, macd_params=(12, 26, 9),
+                 bb_period=20, bb_std=2, atr_period=14):
+        self.params = {
+            'ma_periods': list(ma_periods),
+            'rsi_period': rsi_period,
+            'macd_params': list(macd_params),
+            'bb_period': bb_period,
+            'bb_std': bb_std,
+            'atr_period': atr_period,
+        }
+        self.last_date = None
+        self.bars = 0
+        self.prev_close = np.nan
+        self.ma = {period: RollingWindow(period) for period in ma_periods}
+        self.gain = RollingWindow(rsi_period)
+        self.loss = RollingWindow(rsi_period)
+        self.bb = RollingWindow(bb_period)
+        self.tr = RollingWindow(atr_period)
+        self.ema = {'fast': None, 'slow': None, 'signal': None}
+        self.ema_weight = {'fast': 1.0, 'slow': 1.0, 'signal': 1.0}
+    
+    def _update_ema(self, name, x, span):
+        """
+        Fold one value into an EMA, as pandas ewm(span, adjust=False) does
+        
+        A missing value keeps the average but decays the weight of the old
+        average (pandas' default ignore_na=False), so the first value after
+        a gap counts more than a regular update.
+        """
+        previous = self.ema[name]
+        if previous is None or np.isnan(previous):
+            self.ema[name] = x
+            self.ema_weight[name] = 1.0
+            return x
+        
+        alpha = 2 / (span + 1)
+        old_weight = self.ema_weight[name] * (1 - alpha)
+        if np.isnan(x):
+            self.ema_weight[name] = old_weight
+            return previous
+        
+        if previous != x:
+            previous = (old_weight * previous + alpha * x) / (old_weight + alpha)
+        self.ema[name] = previous
+        self.ema_weight[name] = 1.0
+        return previous
+    
+    def columns(self):
+        """Names of the indicator values returned by update()"""
+        return [f'MA_{period}' for period in self.params['ma_periods']] + [
+            'RSI', 'MACD', 'MACD_Signal', 'MACD_Histogram',
+            'BB_Middle', 'BB_Upper', 'BB_Lower', 'BB_Width', 'ATR'
+        ]
+    
+    def update(self, date, high, low, close):
+        """
+        Fold one new bar into the state
+        
+        Returns:
+        --------
+        dict : indicator values for this bar, keyed by the analyzer's column names
+        """
+        close = float(close)
+        delta = close - self.prev_close
+        
+        values = {}
+        for period, window in self.ma.items():
+            window.push(close)
+            values[f'MA_{period}'] = window.window_mean()
+        
+        # RSI (a missing change counts as neither gain nor loss, as in the analyzer)
+        self.gain.push(delta if delta > 0 else 0.0)
+        self.loss.push(-delta if delta < 0 else 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = np.float64(self.gain.window_mean()) / np.float64(self.loss.window_mean())
+            values['RSI'] = 100 - (100 / (1 + rs))
+        
+        # MACD
+        fast, slow, signal = self.params['macd_params']
+        macd_line = self._update_ema('fast', close, fast) - self._update_ema('slow', close, slow)
+        signal_line = self._update_ema('signal', macd_line, signal)
+        values['MACD'] = macd_line
+        values['MACD_Signal'] = signal_line
+        values['MACD_Histogram'] = macd_line - signal_line
+        
+        # Bollinger Bands
+        self.bb.push(close)
+        middle = self.bb.window_mean()
+        band = self.bb.window_std() * self.params['bb_std']
+        values['BB_Middle'] = middle
+        values['BB_Upper'] = middle + band
+        values['BB_Lower'] = middle - band
+        values['BB_Width'] = values['BB_Upper'] - values['BB_Lower']
+        
+        # ATR (true range skips the missing previous close on the first bar)
+        true_range = np.fmax(np.fmax(high - low, abs(high - self.prev_close)), abs(low - self.prev_close))
+        self.tr.push(true_range)
+        values['ATR'] = self.tr.window_mean()
+        
+        self.prev_close = close
+        self.last_date = str(date)
+        self.bars += 1
+        return values
+    
+    def fold(self, df):
+        """
+        Fold a block of bars (Date, High, Low, Close) into the state
+        
+        Returns:
+        --------
+        list : one dict of indicator values per bar
+        """
+        return [self.update(date, high, low, close)
+                for date, high, low, close in zip(df['Date'], df['High'], df['Low'], df['Close'])]
+    
+    def to_dict(self):
+        """State as plain JSON-compatible data"""
+        return {
+            'params': self.params,
+            'last_date': self.last_date,
+            'bars': self.bars,
+            'prev_close': self.prev_close,
+            'ema': self.ema,
+            'ema_weight': self.ema_weight,
+            'windows': {
+                'ma': {str(period): list(window.values) for period, window in self.ma.items()},
+                'gain': list(self.gain.values),
+                'loss': list(self.loss.values),
+                'bb': list(self.bb.values),
+                'tr': list(self.tr.values),
+            },
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a state saved with to_dict()"""
+        params = data['params']
+        state = cls(params['ma_periods'], params['rsi_period'], params['macd_params'],
+                    params['bb_period'], params['bb_std'], params['atr_period'])
+        windows = data['windows']
+        state.ma = {int(period): RollingWindow(int(period), values) for period, values in windows['ma'].items()}
+        state.gain = RollingWindow(params['rsi_period'], windows['gain'])
+        state.loss = RollingWindow(params['rsi_period'], windows['loss'])
+        state.bb = RollingWindow(params['bb_period'], windows['bb'])
+        state.tr = RollingWindow(params['atr_period'], windows['tr'])
+        state.ema = data['ema']
+        state.ema_weight = data.get('ema_weight', {name: 1.0 for name in state.ema})
+        state.prev_close = data['prev_close']
+        state.last_date = data['last_date']
+        state.bars = data['bars']
+        return state
+    
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+    
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,169 @@
+﻿"""
+Panel Indicator Engine
+======================
+Technical indicators for many stocks in one vectorized job.
+
+Instead of running the statistical analyzer once per stock, prices of all
+symbols are laid out as one matrix (bars x symbols) and every indicator is
+computed with 2-D rolling/ewm operations, using the same formulas as
+UniversalStatisticalAnalyzer:
+- Moving averages (MA_20, MA_50, MA_100, MA_200)
+- RSI, MACD (line, signal, histogram), Bollinger Bands, ATR
+
+Symbols are aligned by their own bar number rather than by calendar date,
+so a stock that listed later or missed a trading day gets exactly the values
+a single-stock run would give. The result is written as one long-format
+table (Date, Symbol, Close, indicators...).
+
+Accepted inputs:
+- A directory of per-stock CSV files (e.g. from extract_nifty50_stocks.py);
+  the file name is the symbol
+- A long-format table with Date, Symbol, Close (and High/Low for ATR)
+- A wide table with a Date column and one Close column per symbol
+
+Usage:
+    python panel_indicators.py --input "NIFTY50_Individual_Stocks" --output "nifty50_indicators"
+    python panel_indicators.py --input prices_long.csv --output indicators --storage feather
+"""
+
+import pandas as pd
+import argparse
+import os
+import sys
+from table_storage import STORAGE_FORMATS, read_table, write_table
+from universal_statistical_analyzer import (
+    moving_average, relative_strength_index, macd, bollinger_bands, average_true_range
+)
+
+PRICE_FIELDS = ['Close', 'High', 'Low']
+
+
+def load_panel(path):
+    """
+    Load prices of many symbols as one long-format table
+    
+    Parameters:
+    -----------
+    path : str
+        Directory of per-stock CSV files, or a long/wide price table
+    
+    Returns:
+    --------
+    DataFrame : Date, Symbol, Close and (when available) High, Low
+    """
+    if os.path.isdir(path):
+        frames = []
+        for file in sorted(os.listdir(path)):
+            if not file.lower().endswith('.csv'):
+                continue
+            stock = pd.read_csv(os.path.join(path, file),
+                                usecols=lambda col: col in ['Date'] + PRICE_FIELDS)
+            stock['Symbol'] = os.path.splitext(file)[0]
+            frames.append(stock)
+        if not frames:
+            raise FileNotFoundError(f"No CSV files found in {path}")
+        panel = pd.concat(frames, ignore_index=True)
+    else:
+        panel = read_table(path)
+        if 'Symbol' not in panel.columns:
+            # Wide layout: Date plus one Close column per symbol
+            panel = panel.melt(id_vars='Date', var_name='Symbol', value_name='Close')
+            panel = panel.dropna(subset=['Close'])
+    
+    if 'Close' not in panel.columns:
+        raise ValueError("Price data needs a 'Close' column (or one Close column per symbol)")
+    
+    panel['Date'] = pd.to_datetime(panel['Date'])
+    columns = ['Date', 'Symbol'] + [col for col in PRICE_FIELDS if col in panel.columns]
+    return panel[columns].sort_values(['Symbol', 'Date']).reset_index(drop=True)
+
+
+def bar_matrix(panel, column):
+    """Prices of one field as a matrix: row = bar number within the symbol, column = symbol"""
+    return panel.pivot(index='Bar', columns='Symbol', values=column)
+
+
+def compute_panel_indicators(panel, ma_periods=[20, 50, 100, 200], rsi_period=14,
+                             macd_params=(12, 26, 9), bb_period=20, bb_std=2, atr_period=14):
+    """
+    Compute every technical indicator for all symbols at once
+    
+    Parameters:
+    -----------
+    panel : DataFrame
+        Long-format prices from load_panel() (Date, Symbol, Close[, High, Low])
+    ma_periods : list
+        Moving average windows
+    rsi_period : int
+        RSI window
+    macd_params : tuple
+        (fast, slow, signal) EMA spans
+    bb_period, bb_std : int, float
+        Bollinger Band window and width in standard deviations
+    atr_period : int
+        ATR window (only computed when High and Low are present)
+    
+    Returns:
+    --------
+    DataFrame : one row per symbol and date with Close and all indicator columns
+    """
+    panel = panel.sort_values(['Symbol', 'Date']).reset_index(drop=True)
+    panel['Bar'] = panel.groupby('Symbol').cumcount()
+    
+    close = bar_matrix(panel, 'Close')
+    indicators = {}
+    
+    for period in ma_periods:
+        indicators[f'MA_{period}'] = moving_average(close, period)
+    
+    indicators['RSI'] = relative_strength_index(close, rsi_period)
+    indicators['MACD'], indicators['MACD_Signal'], indicators['MACD_Histogram'] = macd(close, *macd_params)
+    upper, middle, lower = bollinger_bands(close, bb_period, bb_std)
+    indicators['BB_Middle'] = middle
+    indicators['BB_Upper'] = upper
+    indicators['BB_Lower'] = lower
+    indicators['BB_Width'] = indicators['BB_Upper'] - indicators['BB_Lower']
+    
+    if 'High' in panel.columns and 'Low' in panel.columns:
+        indicators['ATR'] = average_true_range(bar_matrix(panel, 'High'), bar_matrix(panel, 'Low'),
+                                               close, atr_period)
+    
+    # Back to one row per (symbol, bar)
+    rows = panel['Bar'].to_numpy()
+    cols = close.columns.get_indexer(panel['Symbol'])
+    result = panel[['Date', 'Symbol', 'Close']].copy()
+    for name, matrix in indicators.items():
+        result[name] = matrix.to_numpy()[rows, cols]
+    
+    return result
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Compute technical indicators for many stocks in one vectorized pass'
+    )
+    parser.add_argument('--input', '-i', required=True,
+                       help='Directory of per-stock CSV files, or a long/wide price table')
+    parser.add_argument('--output', '-o', default='panel_indicators',
+                       help='Output table path (extension set by --storage)')
+    parser.add_argument('--storage', choices=list(STORAGE_FORMATS), default='parquet',
+                       help='Output format (default: parquet, needs pyarrow)')
+    
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.input):
+        print(f" ERROR: Input not found: {args.input}")
+        sys.exit(1)
+    
+    panel = load_panel(args.input)
+    print(f" Loaded {len(panel):,} rows for {panel['Symbol'].nunique()} symbols")
+    
+    result = compute_panel_indicators(panel)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    output_file = write_table(result, args.output, args.storage)
+    print(f" Saved {len(result.columns) - 3} indicators to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+﻿"""
+Chart Render Profiles
+=====================
+Named settings for saving matplotlib figures.
+
+Every chart is addressed by its PNG path (e.g. "08_Visualizations/
+performance_charts.png"); the profile sets the resolution, the tight
+bounding-box pass and the file format:
+- default: 300 DPI PNG with tight bounding box (the original output)
+- draft:   72 DPI PNG without the tight bounding-box pass (fast, small files)
+- web:     120 DPI optimized PNG
+- print:   PDF vector output
+- svg:     SVG vector output
+
+Usage:
+    from render_profiles import RENDER_PROFILES, save_figure
+    output_file = save_figure("08_Visualizations/chart.png", "draft")
+"""
+
+import os
+
+RENDER_PROFILES = {
+    'default': {'format': 'png', 'dpi': 300, 'bbox_inches': 'tight'},
+    'draft': {'format': 'png', 'dpi': 72, 'bbox_inches': None},
+    'web': {'format': 'png', 'dpi': 120, 'bbox_inches': 'tight', 'pil_kwargs': {'optimize': True}},
+    'print': {'format': 'pdf', 'dpi': 300, 'bbox_inches': 'tight'},
+    'svg': {'format': 'svg', 'dpi': 300, 'bbox_inches': 'tight'},
+}
+
+
+def figure_path(path, profile='default'):
+    """Path of a chart in the given render profile"""
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile '{profile}' (use one of: {', '.join(RENDER_PROFILES)})")
+    return os.path.splitext(path)[0] + '.' + RENDER_PROFILES[profile]['format']
+
+
+def save_figure(path, profile='default', fig=None):
+    """
+    Save a figure with a render profile
+    
+    Parameters:
+    -----------
+    path : str
+        Chart path (any extension; replaced by the profile's format)
+    profile : str
+        Name of a RENDER_PROFILES entry
+    fig : Figure, optional
+        Figure to save (default: the current figure)
+    
+    Returns:
+    --------
+    str : path of the written file
+    """
+    output_file = figure_path(path, profile)
+    settings = dict(RENDER_PROFILES[profile])
+    if fig is None:
+        import matplotlib.pyplot as plt  # only needed when a figure is actually saved
+        fig = plt.gcf()
+    fig.savefig(output_file, **settings)
+    return output_file
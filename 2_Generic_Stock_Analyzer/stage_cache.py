@@ -0,0 +1,150 @@
+﻿"""
+Pipeline Stage Cache
+====================
+Skip pipeline stages whose inputs have not changed since the last run.
+
+Each stage of analyze_stock.py is keyed on:
+- the content hash of the input CSV (not its modification time, so
+  re-extracted but identical files still hit the cache)
+- the stage name and its parameters (storage format, options)
+- the analyzer code (all *.py files next to analyze_stock.py), which holds
+  the indicator settings such as MA periods, RSI period and VaR confidence
+- the key of the previous stage, so a re-run stage invalidates what follows
+
+The cache manifest (.stage_cache.json) lives in the analysis directory and
+records the files each stage wrote. A cached stage is only reused while all
+of those files are still present and unmodified.
+
+Eviction policy: an entry is dropped when its key no longer matches, when
+any recorded output file is missing or changed, or when it is older than
+max_age_days (so every stage is recomputed at least that often).
+"""
+
+import hashlib
+import json
+import os
+import time
+
+CACHE_FILE = '.stage_cache.json'
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_version(script_dir):
+    """Hash of all analyzer modules, so code or parameter changes invalidate the cache"""
+    digest = hashlib.sha256()
+    for file in sorted(os.listdir(script_dir)):
+        if file.endswith('.py'):
+            digest.update(file.encode())
+            digest.update(file_hash(os.path.join(script_dir, file)).encode())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """Manifest of cached stage outputs for one analysis directory"""
+    
+    def __init__(self, output_dir, max_age_days=30):
+        """
+        Parameters:
+        -----------
+        output_dir : str
+            Analysis directory (e.g. Company_Analysis_Complete)
+        max_age_days : float
+            Entries older than this are recomputed
+        """
+        self.output_dir = output_dir
+        self.max_age_days = max_age_days
+        self.manifest_file = os.path.join(output_dir, CACHE_FILE)
+        self.entries = {}
+        
+        if os.path.exists(self.manifest_file):
+            try:
+                with open(self.manifest_file) as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}  # Unreadable manifest: start empty
+    
+    @staticmethod
+    def key(stage, params, upstream_key=''):
+        """Cache key of a stage run"""
+        payload = json.dumps({'stage': stage, 'params': params, 'upstream': upstream_key},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def snapshot(self):
+        """Modification times of all files currently in the analysis directory"""
+        files = {}
+        for root, dirs, names in os.walk(self.output_dir):
+            for name in names:
+                if name == CACHE_FILE:
+                    continue
+                path = os.path.join(root, name)
+                files[os.path.relpath(path, self.output_dir)] = os.stat(path).st_mtime_ns
+        return files
+    
+    def _outputs_unchanged(self, outputs):
+        for rel_path, (size, mtime_ns) in outputs.items():
+            path = os.path.join(self.output_dir, rel_path)
+            if not os.path.exists(path):
+                return False
+            stat = os.stat(path)
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return False
+        return True
+    
+    def hit(self, stage, key):
+        """
+        True if the stage ran with this key and its outputs are intact
+        
+        A stale entry is evicted.
+        """
+        entry = self.entries.get(stage)
+        if entry is None:
+            return False
+        
+        expired = time.time() - entry['created'] > self.max_age_days * 86400
+        if entry['key'] != key or expired or not self._outputs_unchanged(entry['outputs']):
+            del self.entries[stage]
+            return False
+        
+        return True
+    
+    def record(self, stage, key, before):
+        """
+        Record a completed stage run
+        
+        Parameters:
+        -----------
+        stage : str
+            Stage name
+        key : str
+            Cache key from key()
+        before : dict
+            snapshot() taken before the stage ran; every file added or
+            rewritten since then is recorded as an output of the stage
+        """
+        outputs = {}
+        for rel_path, mtime_ns in self.snapshot().items():
+            if before.get(rel_path) != mtime_ns:
+                size = os.path.getsize(os.path.join(self.output_dir, rel_path))
+                outputs[rel_path] = (size, mtime_ns)
+        
+        # Files rewritten by this stage are no longer the outputs other entries recorded
+        for other in list(self.entries):
+            if other != stage and any(path in outputs for path in self.entries[other]['outputs']):
+                del self.entries[other]
+        
+        self.entries[stage] = {'key': key, 'created': time.time(), 'outputs': outputs}
+    
+    def save(self):
+        """Write the manifest"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(self.manifest_file, 'w') as f:
+            json.dump(self.entries, f)
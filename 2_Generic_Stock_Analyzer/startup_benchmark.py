@@ -0,0 +1,90 @@
+﻿"""
+Start-up Benchmark
+==================
+Measure the cold-start cost of every command-line mode.
+
+Each mode is started in a fresh Python interpreter that imports what the
+mode needs before it does any work, exactly as a batch tool spawning one
+short run would. The wall time includes interpreter start-up; the heavy
+libraries each mode ends up loading are listed next to it.
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CORE_DIR = os.path.join(SCRIPT_DIR, '..', '1_Core_Fundamental_Scoring')
+
+HEAVY_MODULES = ['pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'openpyxl']
+
+# Mode name -> (working directory, code run before the mode's actual work)
+MODES = {
+    'python (empty)': (SCRIPT_DIR, 'pass'),
+    'analyze_stock.py (driver)': (SCRIPT_DIR, 'import analyze_stock'),
+    'pattern step': (SCRIPT_DIR, 'import universal_pattern_analyzer'),
+    'statistical step': (SCRIPT_DIR, 'import universal_statistical_analyzer'),
+    'fundamental step': (SCRIPT_DIR, 'import fundamental_metrics_analyzer'),
+    'visualization step': (SCRIPT_DIR, 'import universal_visualization_generator'),
+    'report step': (SCRIPT_DIR, 'import universal_report_generator'),
+    'main.py --skip-viz --skip-excel': (CORE_DIR, 'import main'),
+    'main.py (chart + Excel)': (CORE_DIR, 'import main, report_generator, openpyxl; report_generator._plotting()'),
+}
+
+
+def time_mode(directory, code, repeat=5):
+    """
+    Start a mode repeatedly in fresh interpreters
+    
+    Returns:
+    --------
+    tuple : (list of wall times in seconds, heavy modules loaded)
+    """
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    env = dict(os.environ, MPLBACKEND='Agg')
+    
+    times = []
+    loaded = ''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', probe], cwd=directory, env=env,
+                                capture_output=True, text=True)
+        times.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        loaded = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+    
+    return times, loaded
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Measure cold-start time of each command-line mode'
+    )
+    parser.add_argument('--repeat', '-r', type=int, default=5,
+                       help='Runs per mode (default: 5)')
+    
+    args = parser.parse_args()
+    
+    print(f"{'Mode':35s} {'Min (s)':>8s} {'Median (s)':>11s}  Heavy modules loaded")
+    print('-' * 90)
+    
+    for name, (directory, code) in MODES.items():
+        try:
+            times, loaded = time_mode(directory, code, args.repeat)
+        except RuntimeError as e:
+            print(f"{name:35s} {'failed':>8s}  {e}")
+            continue
+        print(f"{name:35s} {min(times):8.3f} {statistics.median(times):11.3f}  {loaded or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+﻿"""
+Table Storage Backend
+=====================
+Read and write analysis tables as CSV, Parquet or Feather.
+
+Every table is addressed by its CSV path (e.g. "03_Weekday_Analysis/
+weekday_comprehensive_statistics.csv"); the storage format only changes the
+file extension. Parquet and Feather keep column dtypes (datetime Date, bool
+Is_* flags) and are much faster to write and read back than CSV. Both need
+pyarrow:  pip install pyarrow
+
+pandas is imported on first use, so the pipeline driver (analyze_stock.py),
+which only locates tables, starts without it.
+
+Usage:
+    # Publish CSV copies of all Parquet/Feather tables in an analysis directory
+    python table_storage.py --analysis_dir "Company_Analysis_Complete"
+"""
+
+import argparse
+import os
+import sys
+
+STORAGE_FORMATS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
+
+# Formats that keep column dtypes; preferred over CSV when reading
+BINARY_FORMATS = [storage for storage in STORAGE_FORMATS if storage != 'csv']
+
+
+def table_path(path, storage='csv'):
+    """Path of a table in the given storage format"""
+    if storage not in STORAGE_FORMATS:
+        raise ValueError(f"Unknown storage format '{storage}' (use one of: {', '.join(STORAGE_FORMATS)})")
+    return os.path.splitext(path)[0] + STORAGE_FORMATS[storage]
+
+
+def write_table(df, path, storage='csv', index=False):
+    """
+    Write a table in the given storage format
+    
+    Parameters:
+    -----------
+    df : DataFrame
+        Table to write
+    path : str
+        Table path (any extension; replaced by the format's extension)
+    storage : str
+        'csv', 'parquet' or 'feather'
+    index : bool
+        Keep the index. Parquet/Feather store it as ordinary columns named
+        like the CSV header: an unnamed index becomes a column with an empty
+        name, so published CSVs match CSV output (pandas reads that column
+        back from a CSV as 'Unnamed: 0').
+    
+    Copies of the table left in other binary formats (and, when writing
+    CSV, in any binary format) are removed, so find_table() never returns
+    an older copy.
+    
+    Returns:
+    --------
+    str : path of the written file
+    """
+    import pandas as pd
+    
+    output_file = table_path(path, storage)
+    
+    for stale_storage in BINARY_FORMATS:
+        stale_file = table_path(path, stale_storage)
+        if stale_storage != storage and os.path.exists(stale_file):
+            os.remove(stale_file)
+    
+    if storage == 'csv':
+        df.to_csv(output_file, index=index)
+        return output_file
+    
+    if index:
+        # Unnamed index: empty column name, as in the CSV header
+        if df.index.nlevels == 1 and df.index.name is None:
+            df = df.rename_axis('')
+        df = df.reset_index()
+    else:
+        df = df.reset_index(drop=True)
+    
+    # Columns mixing text and numbers (e.g. formatted 'Value' columns) are stored as text
+    for col in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed'):
+            df[col] = df[col].astype(str)
+    
+    if storage == 'parquet':
+        df.to_parquet(output_file, index=False)
+    else:
+        df.to_feather(output_file)
+    
+    return output_file
+
+
+def find_table(path):
+    """
+    Existing file of a table in any storage format, or None
+    
+    A Parquet/Feather file is preferred over the CSV: when both exist, the
+    CSV is a copy written by publish_csv() (newer, but without dtypes).
+    """
+    for storage in BINARY_FORMATS + ['csv']:
+        candidate = table_path(path, storage)
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def read_table(path):
+    """Read a table written by write_table(), whatever its storage format"""
+    import pandas as pd
+    
+    found = find_table(path)
+    if found is None:
+        raise FileNotFoundError(f"Table not found: {path}")
+    
+    if found.endswith('.parquet'):
+        return pd.read_parquet(found)
+    if found.endswith('.feather'):
+        return pd.read_feather(found)
+    return pd.read_csv(found)
+
+
+def publish_csv(analysis_dir):
+    """
+    Write a CSV copy of every Parquet/Feather table under analysis_dir
+    
+    Returns:
+    --------
+    list : paths of the CSV files written
+    """
+    import pandas as pd
+    
+    published = []
+    binary_extensions = tuple(STORAGE_FORMATS[s] for s in BINARY_FORMATS)
+    
+    for root, dirs, files in os.walk(analysis_dir):
+        for file in sorted(files):
+            if file.endswith(binary_extensions):
+                source = os.path.join(root, file)
+                output_file = table_path(source, 'csv')
+                df = pd.read_parquet(source) if file.endswith('.parquet') else pd.read_feather(source)
+                df.to_csv(output_file, index=False)
+                published.append(output_file)
+    
+    return published
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Publish CSV copies of Parquet/Feather analysis tables'
+    )
+    parser.add_argument('--analysis_dir', '-d', required=True,
+                       help='Analysis directory (e.g., Company_Analysis_Complete)')
+    
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.analysis_dir):
+        print(f" ERROR: Directory not found: {args.analysis_dir}")
+        sys.exit(1)
+    
+    published = publish_csv(args.analysis_dir)
+    print(f" Published {len(published)} CSV files in {args.analysis_dir}/")
+
+
+if __name__ == "__main__":
+    main()
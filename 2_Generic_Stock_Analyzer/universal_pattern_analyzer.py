@@ -20,12 +20,42 @@ from datetime import datetime
 import argparse
 import os
 import sys
-from scipy import stats
+from table_storage import STORAGE_FORMATS, write_table
+
+
+def month_end_mask(analyzer):
+    """Last 5 trading days of each calendar month"""
+    return analyzer.df.groupby(analyzer.calendar_period('M')).cumcount(ascending=False) < 5
+
+
+def first_monday_mask(analyzer):
+    """First Monday of each calendar month"""
+    is_monday = analyzer.df['Weekday'] == 'Monday'
+    return is_monday & (is_monday.groupby(analyzer.calendar_period('M')).cumsum() == 1)
+
 
 class UniversalPatternAnalyzer:
     """Analyzes cyclical patterns for any stock data"""
     
-    def __init__(self, csv_file, company_name=None):
+    # Pattern registry: comparison table label -> definition
+    # Calendar patterns select one value of a date column ('column'/'value');
+    # other patterns give a 'mask' function called with the analyzer that
+    # returns a boolean Series over analyzer.df. 'flag' is the master data
+    # column for the pattern (None: not saved). Order = comparison table order.
+    PATTERNS = {
+        'Wednesday': {'column': 'Weekday', 'value': 'Wednesday', 'flag': 'Is_Wednesday'},
+        'Monday': {'column': 'Weekday', 'value': 'Monday', 'flag': 'Is_Monday'},
+        'April': {'column': 'Month_Name', 'value': 'April', 'flag': 'Is_April'},
+        'February': {'column': 'Month_Name', 'value': 'February', 'flag': None},
+        'Month-End (Last 5)': {'mask': month_end_mask, 'flag': 'Is_MonthEnd'},
+        'First Monday': {'mask': first_monday_mask, 'flag': 'Is_FirstMonday'},
+    }
+    
+    # Column layout of the master data flags (independent of the registry order);
+    # flags of patterns added with register_pattern() follow in registry order
+    MASTER_FLAG_COLUMNS = ['Is_April', 'Is_Wednesday', 'Is_Monday', 'YearMonth', 'Is_MonthEnd', 'Is_FirstMonday']
+    
+    def __init__(self, csv_file, company_name=None, output_root=None, storage='csv'):
         """
         Initialize analyzer with stock data
         
@@ -35,11 +65,24 @@ class UniversalPatternAnalyzer:
             Path to CSV file with stock data
         company_name : str, optional
             Company name for reports (extracted from filename if not provided)
+        output_root : str, optional
+            Directory in which the analysis directory is created (default: current directory)
+        storage : str
+            Output table format: 'csv', 'parquet' or 'feather' (see table_storage.py)
         """
         self.csv_file = csv_file
+        self.storage = storage
         self.company_name = company_name or self._extract_company_name(csv_file)
         self.df = None
+        self.source_columns = []
+        self.patterns = dict(self.PATTERNS)
+        self.pattern_masks = None
+        self._periods = {}
+        self._calendar_stats = {}
+        self._pattern_stats = {}
         self.output_dir = f"{self.company_name.replace(' ', '_')}_Analysis_Complete"
+        if output_root:
+            self.output_dir = os.path.join(output_root, self.output_dir)
         
     def _extract_company_name(self, filename):
         """Extract company name from filename"""
@@ -60,6 +103,11 @@ class UniversalPatternAnalyzer:
         
         # Load data
         self.df = pd.read_csv(self.csv_file)
+        self.source_columns = list(self.df.columns)
+        self.pattern_masks = None
+        self._periods = {}
+        self._calendar_stats = {}
+        self._pattern_stats = {}
         print(f" Loaded {len(self.df):,} rows")
         
         # Ensure Date column exists
@@ -150,6 +198,149 @@ class UniversalPatternAnalyzer:
         
         return stats_dict
     
+    def calculate_grouped_statistics(self, data, by, percentiles=[10, 25, 50, 75, 90]):
+        """
+        Calculate the calculate_statistics() figures for every group in one pass
+        
+        Parameters:
+        -----------
+        data : DataFrame
+            Rows with a 'Daily_Return' column
+        by : str
+            Column to group by (e.g. 'Weekday', 'Month_Name', 'Year')
+        
+        Returns:
+        --------
+        DataFrame indexed by group value, one column per calculate_statistics()
+        key in the same order. Groups without any returns are omitted.
+        """
+        clean = data.loc[data['Daily_Return'].notna(), [by, 'Daily_Return']]
+        returns = clean['Daily_Return']
+        keys = clean[by]
+        grouped = returns.groupby(keys)
+        
+        count = grouped.count()
+        mean = grouped.mean()
+        
+        stats_df = pd.DataFrame({
+            'Total Trading Days': count,
+            'Mean Daily Return (%)': mean,
+            'Median Daily Return (%)': grouped.median(),
+            'Std Deviation (%)': grouped.std(),
+            'Min Daily Return (%)': grouped.min(),
+            'Max Daily Return (%)': grouped.max(),
+            'Win Rate (%)': (returns > 0).groupby(keys).sum() / count * 100,
+            'Average Win (%)': returns.where(returns > 0).groupby(keys).mean().fillna(0),
+            'Average Loss (%)': returns.where(returns < 0).groupby(keys).mean().fillna(0),
+        })
+        
+        # Add percentiles
+        quantiles = grouped.quantile([p / 100 for p in percentiles]).unstack()
+        for p in percentiles:
+            stats_df[f'{p}th Percentile (%)'] = quantiles[p / 100]
+        
+        # Add distribution metrics from central moments (same bias corrections as Series.skew/kurtosis)
+        deviation = returns - grouped.transform('mean')
+        m2 = (deviation ** 2).groupby(keys).sum()
+        m3 = (deviation ** 3).groupby(keys).sum()
+        m4 = (deviation ** 4).groupby(keys).sum()
+        n = count.astype(float)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skew = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+            kurt = (n * (n + 1) * (n - 1) * m4) / ((n - 2) * (n - 3) * m2 ** 2) - \
+                   3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        stats_df['Skewness'] = skew.where(m2 > 0, 0).where(n >= 3)
+        stats_df['Kurtosis'] = kurt.where(m2 > 0, 0).where(n >= 4)
+        
+        return stats_df
+    
+    def calendar_statistics(self, column):
+        """Grouped statistics of the full dataset by a calendar column, computed once and cached"""
+        if column not in self._calendar_stats:
+            self._calendar_stats[column] = self.calculate_grouped_statistics(self.df, column)
+        return self._calendar_stats[column]
+    
+    def _statistics_row(self, stats_df, key):
+        """Return one group of a grouped statistics table as a calculate_statistics() dict"""
+        if key not in stats_df.index:
+            return None
+        
+        stats = stats_df.loc[key].to_dict()
+        stats['Total Trading Days'] = int(stats['Total Trading Days'])
+        return stats
+    
+    # ==================== PATTERN REGISTRY ====================
+    
+    def register_pattern(self, label, flag=None, column=None, value=None, mask=None):
+        """
+        Add a pattern to this analyzer's registry
+        
+        Parameters:
+        -----------
+        label : str
+            Pattern name used in the comparison table
+        flag : str, optional
+            Boolean column added to the master data (e.g. 'Is_QuarterEnd')
+        column, value : optional
+            Calendar pattern: rows where df[column] == value
+        mask : callable, optional
+            Function taking the analyzer and returning a boolean Series over analyzer.df
+        
+        Example:
+        --------
+        analyzer.register_pattern(
+            'Quarter-End (Last 5)', flag='Is_QuarterEnd',
+            mask=lambda a: a.df.groupby(a.calendar_period('Q')).cumcount(ascending=False) < 5)
+        """
+        if mask is None and column is None:
+            raise ValueError("Pattern needs either a mask function or a column/value pair")
+        
+        self.patterns[label] = {'column': column, 'value': value, 'mask': mask, 'flag': flag}
+        self.pattern_masks = None
+        self._pattern_stats.pop(label, None)
+    
+    def calendar_period(self, freq):
+        """Date column as periods (e.g. 'M', 'Q'), computed once per frequency"""
+        if freq not in self._periods:
+            self._periods[freq] = self.df['Date'].dt.to_period(freq)
+        return self._periods[freq]
+    
+    def build_pattern_masks(self):
+        """Build the boolean matrix of all registered patterns (one column per pattern)"""
+        masks = {}
+        for label, spec in self.patterns.items():
+            if spec.get('mask') is not None:
+                masks[label] = spec['mask'](self).astype(bool)
+            else:
+                masks[label] = self.df[spec['column']] == spec['value']
+        
+        self.pattern_masks = pd.DataFrame(masks, index=self.df.index)
+        return self.pattern_masks
+    
+    def pattern_mask(self, label):
+        """Boolean mask of one registered pattern"""
+        if self.pattern_masks is None:
+            self.build_pattern_masks()
+        return self.pattern_masks[label]
+    
+    def pattern_statistics(self, label):
+        """calculate_statistics() result for one registered pattern, computed once"""
+        if label not in self._pattern_stats:
+            spec = self.patterns[label]
+            if spec.get('mask') is None:
+                # Calendar pattern: read from the shared grouped statistics
+                stats = self._statistics_row(self.calendar_statistics(spec['column']), spec['value'])
+            else:
+                stats = self.calculate_statistics(self.df.loc[self.pattern_mask(label), 'Daily_Return'])
+            self._pattern_stats[label] = stats
+        return self._pattern_stats[label]
+    
+    def _statistics_table(self, stats_df, label):
+        """Lay out a grouped statistics table like the per-group CSV files (group label last)"""
+        table = stats_df.rename_axis(label).reset_index()
+        return table[list(stats_df.columns) + [label]]
+    
     def create_output_directories(self):
         """Create organized directory structure for outputs"""
         directories = [
@@ -177,29 +368,25 @@ class UniversalPatternAnalyzer:
         print(f"{'='*70}\n")
         
         weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
-        weekday_stats = []
+        all_stats = self.calendar_statistics('Weekday')
+        weekdays = [weekday for weekday in weekday_order if weekday in all_stats.index]
+        weekday_groups = dict(tuple(self.df.groupby('Weekday')))
         
-        for weekday in weekday_order:
-            weekday_data = self.df[self.df['Weekday'] == weekday]['Daily_Return']
-            stats = self.calculate_statistics(weekday_data)
+        for weekday in weekdays:
+            stats = self._statistics_row(all_stats, weekday)
             
-            if stats:
-                stats['Weekday'] = weekday
-                weekday_stats.append(stats)
-                
-                # Save individual weekday raw data
-                weekday_df = self.df[self.df['Weekday'] == weekday].copy()
-                output_file = f"{self.output_dir}/03_Weekday_Analysis/{weekday.lower()}_all_days_raw_data.csv"
-                weekday_df.to_csv(output_file, index=False)
-                
-                print(f" {weekday:10s}: Mean={stats['Mean Daily Return (%)']:+7.3f}%, "
-                      f"Median={stats['Median Daily Return (%)']:+7.3f}%, "
-                      f"Win Rate={stats['Win Rate (%)']:.1f}% ({int(stats['Total Trading Days'])} days)")
+            # Save individual weekday raw data
+            output_file = f"{self.output_dir}/03_Weekday_Analysis/{weekday.lower()}_all_days_raw_data.csv"
+            write_table(weekday_groups[weekday], output_file, self.storage)
+            
+            print(f" {weekday:10s}: Mean={stats['Mean Daily Return (%)']:+7.3f}%, "
+                  f"Median={stats['Median Daily Return (%)']:+7.3f}%, "
+                  f"Win Rate={stats['Win Rate (%)']:.1f}% ({int(stats['Total Trading Days'])} days)")
         
         # Save comprehensive statistics
-        weekday_stats_df = pd.DataFrame(weekday_stats)
-        weekday_stats_df.to_csv(f"{self.output_dir}/03_Weekday_Analysis/weekday_comprehensive_statistics.csv", 
-                               index=False)
+        weekday_stats_df = self._statistics_table(all_stats.loc[weekdays], 'Weekday')
+        write_table(weekday_stats_df, f"{self.output_dir}/03_Weekday_Analysis/weekday_comprehensive_statistics.csv", 
+                    self.storage)
         
         return weekday_stats_df
     
@@ -211,29 +398,25 @@ class UniversalPatternAnalyzer:
         
         month_names = ['January', 'February', 'March', 'April', 'May', 'June',
                       'July', 'August', 'September', 'October', 'November', 'December']
-        monthly_stats = []
+        all_stats = self.calendar_statistics('Month_Name')
+        months = [month_name for month_name in month_names if month_name in all_stats.index]
+        month_groups = dict(tuple(self.df.groupby('Month_Name')))
         
-        for month_name in month_names:
-            month_data = self.df[self.df['Month_Name'] == month_name]['Daily_Return']
-            stats = self.calculate_statistics(month_data)
+        for month_name in months:
+            stats = self._statistics_row(all_stats, month_name)
+            
+            # Save individual month raw data
+            output_file = f"{self.output_dir}/06_Monthly_Analysis/{month_name.lower()}_all_days_raw_data.csv"
+            write_table(month_groups[month_name], output_file, self.storage)
             
-            if stats:
-                stats['Month'] = month_name
-                monthly_stats.append(stats)
-                
-                # Save individual month raw data
-                month_df = self.df[self.df['Month_Name'] == month_name].copy()
-                output_file = f"{self.output_dir}/06_Monthly_Analysis/{month_name.lower()}_all_days_raw_data.csv"
-                month_df.to_csv(output_file, index=False)
-                
-                print(f" {month_name:10s}: Mean={stats['Mean Daily Return (%)']:+7.3f}%, "
-                      f"Median={stats['Median Daily Return (%)']:+7.3f}%, "
-                      f"Win Rate={stats['Win Rate (%)']:.1f}% ({int(stats['Total Trading Days'])} days)")
+            print(f" {month_name:10s}: Mean={stats['Mean Daily Return (%)']:+7.3f}%, "
+                  f"Median={stats['Median Daily Return (%)']:+7.3f}%, "
+                  f"Win Rate={stats['Win Rate (%)']:.1f}% ({int(stats['Total Trading Days'])} days)")
         
         # Save comprehensive statistics
-        monthly_stats_df = pd.DataFrame(monthly_stats)
-        monthly_stats_df.to_csv(f"{self.output_dir}/06_Monthly_Analysis/monthly_comprehensive_statistics.csv", 
-                               index=False)
+        monthly_stats_df = self._statistics_table(all_stats.loc[months], 'Month')
+        write_table(monthly_stats_df, f"{self.output_dir}/06_Monthly_Analysis/monthly_comprehensive_statistics.csv", 
+                    self.storage)
         
         return monthly_stats_df
     
@@ -243,32 +426,24 @@ class UniversalPatternAnalyzer:
         print("DETAILED APRIL ANALYSIS")
         print(f"{'='*70}\n")
         
-        april_data = self.df[self.df['Month_Name'] == 'April'].copy()
+        april_data = self.df[self.pattern_mask('April')].copy()
         
         if len(april_data) == 0:
             print(" No April data found")
             return None
         
         # Overall statistics
-        stats = self.calculate_statistics(april_data['Daily_Return'])
+        stats = self.pattern_statistics('April')
         stats_df = pd.DataFrame([stats]).T
         stats_df.columns = ['Value']
-        stats_df.to_csv(f"{self.output_dir}/01_April_Analysis/april_overall_statistics.csv")
+        write_table(stats_df, f"{self.output_dir}/01_April_Analysis/april_overall_statistics.csv", self.storage, index=True)
         
         # Raw data
-        april_data.to_csv(f"{self.output_dir}/01_April_Analysis/april_all_days_raw_data.csv", index=False)
+        write_table(april_data, f"{self.output_dir}/01_April_Analysis/april_all_days_raw_data.csv", self.storage)
         
         # Yearly breakdown
-        yearly_stats = []
-        for year in sorted(april_data['Year'].unique()):
-            year_data = april_data[april_data['Year'] == year]['Daily_Return']
-            year_stats = self.calculate_statistics(year_data)
-            if year_stats:
-                year_stats['Year'] = year
-                yearly_stats.append(year_stats)
-        
-        yearly_df = pd.DataFrame(yearly_stats)
-        yearly_df.to_csv(f"{self.output_dir}/01_April_Analysis/april_yearly_statistics.csv", index=False)
+        yearly_df = self._statistics_table(self.calculate_grouped_statistics(april_data, 'Year').sort_index(), 'Year')
+        write_table(yearly_df, f"{self.output_dir}/01_April_Analysis/april_yearly_statistics.csv", self.storage)
         
         print(f" April Analysis: Mean={stats['Mean Daily Return (%)']:+.3f}%, "
               f"Median={stats['Median Daily Return (%)']:+.3f}%, "
@@ -282,32 +457,24 @@ class UniversalPatternAnalyzer:
         print("DETAILED WEDNESDAY ANALYSIS")
         print(f"{'='*70}\n")
         
-        wednesday_data = self.df[self.df['Weekday'] == 'Wednesday'].copy()
+        wednesday_data = self.df[self.pattern_mask('Wednesday')].copy()
         
         if len(wednesday_data) == 0:
             print(" No Wednesday data found")
             return None
         
         # Overall statistics
-        stats = self.calculate_statistics(wednesday_data['Daily_Return'])
+        stats = self.pattern_statistics('Wednesday')
         stats_df = pd.DataFrame([stats]).T
         stats_df.columns = ['Value']
-        stats_df.to_csv(f"{self.output_dir}/02_Wednesday_Analysis/wednesday_overall_statistics.csv")
+        write_table(stats_df, f"{self.output_dir}/02_Wednesday_Analysis/wednesday_overall_statistics.csv", self.storage, index=True)
         
         # Raw data
-        wednesday_data.to_csv(f"{self.output_dir}/02_Wednesday_Analysis/wednesday_all_days_raw_data.csv", index=False)
+        write_table(wednesday_data, f"{self.output_dir}/02_Wednesday_Analysis/wednesday_all_days_raw_data.csv", self.storage)
         
         # Yearly breakdown
-        yearly_stats = []
-        for year in sorted(wednesday_data['Year'].unique()):
-            year_data = wednesday_data[wednesday_data['Year'] == year]['Daily_Return']
-            year_stats = self.calculate_statistics(year_data)
-            if year_stats:
-                year_stats['Year'] = year
-                yearly_stats.append(year_stats)
-        
-        yearly_df = pd.DataFrame(yearly_stats)
-        yearly_df.to_csv(f"{self.output_dir}/02_Wednesday_Analysis/wednesday_yearly_statistics.csv", index=False)
+        yearly_df = self._statistics_table(self.calculate_grouped_statistics(wednesday_data, 'Year').sort_index(), 'Year')
+        write_table(yearly_df, f"{self.output_dir}/02_Wednesday_Analysis/wednesday_yearly_statistics.csv", self.storage)
         
         print(f" Wednesday Analysis: Mean={stats['Mean Daily Return (%)']:+.3f}%, "
               f"Median={stats['Median Daily Return (%)']:+.3f}%, "
@@ -321,34 +488,26 @@ class UniversalPatternAnalyzer:
         print("MONTH-END PATTERN ANALYSIS (Last 5 Days)")
         print(f"{'='*70}\n")
         
-        # Group by year-month and get last 5 days
-        self.df['YearMonth'] = self.df['Date'].dt.to_period('M')
-        monthend_data = self.df.groupby('YearMonth').tail(5).copy()
+        # Last 5 days of each year-month
+        self.df['YearMonth'] = self.calendar_period('M')
+        monthend_data = self.df[self.pattern_mask('Month-End (Last 5)')].copy()
         
         if len(monthend_data) == 0:
             print(" No month-end data found")
             return None
         
         # Overall statistics
-        stats = self.calculate_statistics(monthend_data['Daily_Return'])
+        stats = self.pattern_statistics('Month-End (Last 5)')
         stats_df = pd.DataFrame([stats]).T
         stats_df.columns = ['Value']
-        stats_df.to_csv(f"{self.output_dir}/04_MonthEnd_Analysis/monthend_overall_statistics.csv")
+        write_table(stats_df, f"{self.output_dir}/04_MonthEnd_Analysis/monthend_overall_statistics.csv", self.storage, index=True)
         
         # Raw data
-        monthend_data.to_csv(f"{self.output_dir}/04_MonthEnd_Analysis/monthend_last5days_raw_data.csv", index=False)
+        write_table(monthend_data, f"{self.output_dir}/04_MonthEnd_Analysis/monthend_last5days_raw_data.csv", self.storage)
         
         # Yearly breakdown
-        yearly_stats = []
-        for year in sorted(monthend_data['Year'].unique()):
-            year_data = monthend_data[monthend_data['Year'] == year]['Daily_Return']
-            year_stats = self.calculate_statistics(year_data)
-            if year_stats:
-                year_stats['Year'] = year
-                yearly_stats.append(year_stats)
-        
-        yearly_df = pd.DataFrame(yearly_stats)
-        yearly_df.to_csv(f"{self.output_dir}/04_MonthEnd_Analysis/monthend_yearly_statistics.csv", index=False)
+        yearly_df = self._statistics_table(self.calculate_grouped_statistics(monthend_data, 'Year').sort_index(), 'Year')
+        write_table(yearly_df, f"{self.output_dir}/04_MonthEnd_Analysis/monthend_yearly_statistics.csv", self.storage)
         
         print(f" Month-End Analysis: Mean={stats['Mean Daily Return (%)']:+.3f}%, "
               f"Median={stats['Median Daily Return (%)']:+.3f}%, "
@@ -362,25 +521,22 @@ class UniversalPatternAnalyzer:
         print("FIRST MONDAY OF MONTH ANALYSIS")
         print(f"{'='*70}\n")
         
-        # Identify first Monday of each month
-        self.df['YearMonth'] = self.df['Date'].dt.to_period('M')
-        first_mondays = self.df[self.df['Weekday'] == 'Monday'].groupby('YearMonth').first().reset_index()
+        # First Monday of each month
+        self.df['YearMonth'] = self.calendar_period('M')
+        first_monday_data = self.df[self.pattern_mask('First Monday')].copy()
         
-        if len(first_mondays) == 0:
+        if len(first_monday_data) == 0:
             print(" No first Monday data found")
             return None
         
-        # Get the data
-        first_monday_data = self.df[self.df['Date'].isin(first_mondays['Date'])].copy()
-        
         # Statistics
-        stats = self.calculate_statistics(first_monday_data['Daily_Return'])
+        stats = self.pattern_statistics('First Monday')
         stats_df = pd.DataFrame([stats]).T
         stats_df.columns = ['Value']
-        stats_df.to_csv(f"{self.output_dir}/05_FirstMonday_Analysis/first_monday_statistics.csv")
+        write_table(stats_df, f"{self.output_dir}/05_FirstMonday_Analysis/first_monday_statistics.csv", self.storage, index=True)
         
         # Raw data
-        first_monday_data.to_csv(f"{self.output_dir}/05_FirstMonday_Analysis/first_monday_raw_data.csv", index=False)
+        write_table(first_monday_data, f"{self.output_dir}/05_FirstMonday_Analysis/first_monday_raw_data.csv", self.storage)
         
         print(f" First Monday Analysis: Mean={stats['Mean Daily Return (%)']:+.3f}%, "
               f"Median={stats['Median Daily Return (%)']:+.3f}%, "
@@ -401,48 +557,11 @@ class UniversalPatternAnalyzer:
         overall_stats['Pattern'] = 'All Days'
         patterns.append(overall_stats)
         
-        # Wednesday
-        wed_data = self.df[self.df['Weekday'] == 'Wednesday']['Daily_Return']
-        wed_stats = self.calculate_statistics(wed_data)
-        wed_stats['Pattern'] = 'Wednesday'
-        patterns.append(wed_stats)
-        
-        # Monday
-        mon_data = self.df[self.df['Weekday'] == 'Monday']['Daily_Return']
-        mon_stats = self.calculate_statistics(mon_data)
-        if mon_stats:
-            mon_stats['Pattern'] = 'Monday'
-            patterns.append(mon_stats)
-        
-        # April
-        apr_data = self.df[self.df['Month_Name'] == 'April']['Daily_Return']
-        apr_stats = self.calculate_statistics(apr_data)
-        if apr_stats:
-            apr_stats['Pattern'] = 'April'
-            patterns.append(apr_stats)
-        
-        # February
-        feb_data = self.df[self.df['Month_Name'] == 'February']['Daily_Return']
-        feb_stats = self.calculate_statistics(feb_data)
-        if feb_stats:
-            feb_stats['Pattern'] = 'February'
-            patterns.append(feb_stats)
-        
-        # Month-End
-        self.df['YearMonth'] = self.df['Date'].dt.to_period('M')
-        monthend_data = self.df.groupby('YearMonth').tail(5)['Daily_Return']
-        me_stats = self.calculate_statistics(monthend_data)
-        if me_stats:
-            me_stats['Pattern'] = 'Month-End (Last 5)'
-            patterns.append(me_stats)
-        
-        # First Monday
-        first_mondays = self.df[self.df['Weekday'] == 'Monday'].groupby('YearMonth').first()
-        fm_data = self.df[self.df['Date'].isin(first_mondays['Date'])]['Daily_Return']
-        fm_stats = self.calculate_statistics(fm_data)
-        if fm_stats:
-            fm_stats['Pattern'] = 'First Monday'
-            patterns.append(fm_stats)
+        # Registered patterns
+        for label in self.patterns:
+            pattern_stats = self.pattern_statistics(label)
+            if pattern_stats:
+                patterns.append(dict(pattern_stats, Pattern=label))
         
         # Create DataFrame
         comparison_df = pd.DataFrame(patterns)
@@ -454,7 +573,7 @@ class UniversalPatternAnalyzer:
         comparison_df = comparison_df[[col for col in cols if col in comparison_df.columns]]
         
         # Save
-        comparison_df.to_csv(f"{self.output_dir}/07_Comparison_Tables/pattern_comparison_table.csv", index=False)
+        write_table(comparison_df, f"{self.output_dir}/07_Comparison_Tables/pattern_comparison_table.csv", self.storage)
         
         print(f" Pattern comparison table created with {len(patterns)} patterns")
         
@@ -467,22 +586,18 @@ class UniversalPatternAnalyzer:
         print(f"{'='*70}\n")
         
         # Add pattern flags
-        self.df['Is_April'] = self.df['Month_Name'] == 'April'
-        self.df['Is_Wednesday'] = self.df['Weekday'] == 'Wednesday'
-        self.df['Is_Monday'] = self.df['Weekday'] == 'Monday'
-        
-        # Month-end flag
-        self.df['YearMonth'] = self.df['Date'].dt.to_period('M')
-        monthend_dates = self.df.groupby('YearMonth').tail(5)['Date']
-        self.df['Is_MonthEnd'] = self.df['Date'].isin(monthend_dates)
-        
-        # First Monday flag
-        first_monday_dates = self.df[self.df['Weekday'] == 'Monday'].groupby('YearMonth').first()['Date']
-        self.df['Is_FirstMonday'] = self.df['Date'].isin(first_monday_dates)
+        flags = {spec['flag']: label for label, spec in self.patterns.items() if spec.get('flag')}
+        for column in self.MASTER_FLAG_COLUMNS:
+            if column == 'YearMonth':
+                self.df['YearMonth'] = self.calendar_period('M')
+            elif column in flags:
+                self.df[column] = self.pattern_mask(flags.pop(column))
+        for flag, label in flags.items():
+            self.df[flag] = self.pattern_mask(label)
         
         # Save
         output_file = f"{self.output_dir}/00_Master_Data/{self.company_name.replace(' ', '_').lower()}_master_data_enhanced.csv"
-        self.df.to_csv(output_file, index=False)
+        output_file = write_table(self.df, output_file, self.storage)
         
         print(f" Master data saved: {output_file}")
         print(f"  Total rows: {len(self.df):,}")
@@ -549,6 +664,10 @@ Examples:
                        help='Path to CSV file with stock data')
     parser.add_argument('--company', '-c', 
                        help='Company name (optional, extracted from filename if not provided)')
+    parser.add_argument('--output-root', default=None,
+                       help='Directory in which to create the analysis directory (default: current directory)')
+    parser.add_argument('--storage', choices=list(STORAGE_FORMATS), default='csv',
+                       help='Output table format (default: csv)')
     
     args = parser.parse_args()
     
@@ -558,7 +677,8 @@ Examples:
         sys.exit(1)
     
     # Run analysis
-    analyzer = UniversalPatternAnalyzer(args.file, args.company)
+    analyzer = UniversalPatternAnalyzer(args.file, args.company, output_root=args.output_root,
+                                        storage=args.storage)
     success = analyzer.run_complete_analysis()
     
     sys.exit(0 if success else 1)
@@ -13,36 +13,52 @@ Usage:
     python universal_report_generator.py --analysis_dir "Company_Analysis_Complete" --company "Company Name"
 """
 
-import pandas as pd
-import numpy as np
 import argparse
 import os
 import sys
 from datetime import datetime
+from table_storage import find_table, read_table
+from render_profiles import RENDER_PROFILES, figure_path
 
 class UniversalReportGenerator:
     """Generate comprehensive reports for stock analysis"""
     
-    def __init__(self, analysis_dir, company_name):
+    def __init__(self, analysis_dir, company_name, render_profile='default'):
+        """
+        Parameters:
+        -----------
+        analysis_dir : str
+            Analysis directory created by the pattern analyzer
+        company_name : str
+            Company name for the reports
+        render_profile : str
+            Render profile the charts were saved with (see render_profiles.py);
+            sets the chart file names listed in the reports
+        """
         self.analysis_dir = analysis_dir
         self.company_name = company_name
+        self.render_profile = render_profile
         self.reports_dir = f"{analysis_dir}/09_Reports"
         
         # Create output directory
         os.makedirs(self.reports_dir, exist_ok=True)
+    
+    def chart_file(self, name):
+        """File name of a chart (e.g. 'performance_charts.png') in the render profile's format"""
+        return figure_path(name, self.render_profile)
         
     def load_comparison_data(self):
         """Load pattern comparison table"""
         file_path = f"{self.analysis_dir}/07_Comparison_Tables/pattern_comparison_table.csv"
-        return pd.read_csv(file_path)
+        return read_table(file_path)
     
     def load_performance_metrics(self):
         """Load performance metrics if available"""
         stats_dir = f"{self.analysis_dir}/10_Statistical_Analysis"
         perf_file = f"{stats_dir}/performance_metrics.csv"
         
-        if os.path.exists(perf_file):
-            return pd.read_csv(perf_file)
+        if find_table(perf_file) is not None:
+            return read_table(perf_file)
         return None
     
     def generate_executive_summary(self):
@@ -447,11 +463,11 @@ This document provides a comprehensive index of all data files and findings with
     pattern_comparison_table.csv (All patterns compared)
 
  08_Visualizations/
-    pattern_comparison_charts.png
-    cyclical_patterns_charts.png
-    technical_indicators_charts.png
-    performance_charts.png
-    yearly_returns_chart.png
+    {self.chart_file('pattern_comparison_charts.png')}
+    {self.chart_file('cyclical_patterns_charts.png')}
+    {self.chart_file('technical_indicators_charts.png')}
+    {self.chart_file('performance_charts.png')}
+    {self.chart_file('yearly_returns_chart.png')}
 
  09_Reports/
     EXECUTIVE_SUMMARY.md (This file)
@@ -566,30 +582,30 @@ Each `*_overall_statistics.csv` contains:
 
 All charts saved in `08_Visualizations/`:
 
-1. **pattern_comparison_charts.png**
+1. **{self.chart_file('pattern_comparison_charts.png')}**
    - Mean vs Median returns
    - Win rates by pattern
    - Volatility comparison
    - Sample size overview
 
-2. **cyclical_patterns_charts.png**
+2. **{self.chart_file('cyclical_patterns_charts.png')}**
    - Weekday performance
    - Monthly performance
    - Seasonal trends
 
-3. **technical_indicators_charts.png** (if statistical analysis run)
+3. **{self.chart_file('technical_indicators_charts.png')}** (if statistical analysis run)
    - Moving averages
    - RSI
    - MACD
    - Bollinger Bands
 
-4. **performance_charts.png**
+4. **{self.chart_file('performance_charts.png')}**
    - Cumulative returns
    - Drawdown analysis
    - Price chart
    - Volume trends
 
-5. **yearly_returns_chart.png**
+5. **{self.chart_file('yearly_returns_chart.png')}**
    - Year-by-year returns
    - Performance consistency
 
@@ -682,6 +698,8 @@ Examples:
                        help='Path to analysis directory')
     parser.add_argument('--company', '-c', required=True,
                        help='Company name for reports')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                       help='Render profile the charts were saved with (sets the chart file names)')
     
     args = parser.parse_args()
     
@@ -691,7 +709,8 @@ Examples:
         sys.exit(1)
     
     # Run report generation
-    generator = UniversalReportGenerator(args.analysis_dir, args.company)
+    generator = UniversalReportGenerator(args.analysis_dir, args.company,
+                                         render_profile=args.render_profile)
     success = generator.run_all_reports()
     
     sys.exit(0 if success else 1)
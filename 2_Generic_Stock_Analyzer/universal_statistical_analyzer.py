@@ -6,10 +6,13 @@ Comprehensive statistical analysis for ANY stock data.
 Calculates:
 - Technical indicators (MA, RSI, MACD, Bollinger Bands, ATR)
 - Statistical metrics (Sharpe, Sortino, VaR, CVaR, Max Drawdown)
-- Performance attribution (CAGR, streaks, yearly returns)
+- Performance attribution (CAGR, streaks, rolling and yearly returns)
 
 Usage:
     python universal_statistical_analyzer.py --file "Company_Analysis_Complete/00_Master_Data/company_master_data_enhanced.csv" --company "Company Name"
+    
+    # Daily refresh: only fold new bars into the saved indicator state
+    python universal_statistical_analyzer.py --file "..." --company "Company Name" --incremental
 """
 
 import pandas as pd
@@ -18,16 +21,191 @@ import argparse
 import os
 import sys
 from datetime import datetime
+from table_storage import STORAGE_FORMATS, find_table, read_table, write_table
+from incremental_indicators import IndicatorState
+
+
+def moving_average(close, period):
+    """Simple moving average of a price Series, or of every column of a price matrix"""
+    return close.rolling(window=period).mean()
+
+
+def relative_strength_index(close, period=14):
+    """RSI from simple rolling averages of gains and losses (Series or price matrix)"""
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def macd(close, fast=12, slow=26, signal=9):
+    """MACD line, signal line and histogram (Series or price matrix)"""
+    exp1 = close.ewm(span=fast, adjust=False).mean()
+    exp2 = close.ewm(span=slow, adjust=False).mean()
+    
+    macd_line = exp1 - exp2
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def bollinger_bands(close, period=20, std_dev=2):
+    """Upper, middle and lower Bollinger Bands (Series or price matrix)"""
+    middle = close.rolling(window=period).mean()
+    rolling_std = close.rolling(window=period).std()
+    return middle + (rolling_std * std_dev), middle, middle - (rolling_std * std_dev)
+
+
+def average_true_range(high, low, close, period=14):
+    """Average True Range (Series or price matrices of the same shape)"""
+    high_low = high - low
+    high_close = np.abs(high - close.shift())
+    low_close = np.abs(low - close.shift())
+    
+    # Element-wise max that skips NaN (the first bar has no previous close)
+    tr = np.fmax(np.fmax(high_low, high_close), low_close)
+    return tr.rolling(window=period).mean()
+
+
+def rolling_compound_return(returns, window):
+    """
+    Compounded return over a rolling window of daily returns
+    
+    Same result as returns.rolling(window).apply(lambda x: ((1 + x/100).prod() - 1) * 100)
+    without calling Python once per window: the growth factors are multiplied
+    over a sliding window view of the array.
+    
+    Parameters:
+    -----------
+    returns : Series
+        Daily returns in percent
+    window : int
+        Window length in trading days
+    
+    Returns:
+    --------
+    Series : compounded window return in percent, aligned to the window's last day.
+             NaN for the first window-1 rows and for every window containing a NaN.
+             A -100% day gives -100% for every window containing it.
+    """
+    factors = 1 + np.asarray(returns, dtype=float) / 100
+    result = np.full(factors.size, np.nan)
+    if 0 < window <= factors.size:
+        windows = np.lib.stride_tricks.sliding_window_view(factors, window)
+        result[window - 1:] = (windows.prod(axis=1) - 1) * 100
+    return pd.Series(result, index=getattr(returns, 'index', None))
+
+
+def streak_lengths(flags):
+    """
+    Run-length encode a boolean series of up/down days
+    
+    Parameters:
+    -----------
+    flags : array-like of bool
+        True for a winning day, False otherwise
+    
+    Returns:
+    --------
+    tuple : (run values, run lengths) as NumPy arrays, one entry per streak
+    """
+    flags = np.asarray(flags, dtype=bool)
+    if flags.size == 0:
+        return flags, np.zeros(0, dtype=int)
+    
+    starts = np.concatenate(([0], np.flatnonzero(flags[1:] != flags[:-1]) + 1))
+    lengths = np.diff(np.append(starts, flags.size))
+    return flags[starts], lengths
+
+
+def performance_kernel(returns, start_price, end_price, years, periods_per_year=252):
+    """
+    Performance and streak statistics of a daily return series in one pass
+    
+    Parameters:
+    -----------
+    returns : ndarray
+        Daily returns in percent, without NaNs
+    start_price, end_price : float
+        First and last close of the analyzed period
+    years : float
+        Length of the analyzed period in years
+    periods_per_year : int
+        Trading days used to annualize volatility, Sharpe and Sortino
+    
+    Returns:
+    --------
+    dict : CAGR, total return, volatility, Sharpe, Sortino, max drawdown,
+           daily return summary, win rate and longest win/loss streaks
+    """
+    returns = np.asarray(returns, dtype=float)
+    n = returns.size
+    
+    mean = returns.mean() if n else np.nan
+    std = returns.std(ddof=1) if n > 1 else np.nan
+    downside = returns[returns < 0]
+    downside_std = downside.std(ddof=1) * np.sqrt(periods_per_year) if downside.size > 1 else np.nan
+    ann_volatility = std * np.sqrt(periods_per_year)
+    
+    # Maximum drawdown of the compounded return path
+    cumulative = np.cumprod(1 + returns / 100)
+    running_max = np.maximum.accumulate(cumulative) if n else cumulative
+    max_drawdown = ((cumulative - running_max) / running_max * 100).min() if n else np.nan
+    
+    # Win/loss streaks (a flat day counts as a loss day)
+    wins = returns > 0
+    run_values, run_lengths = streak_lengths(wins)
+    win_runs = run_lengths[run_values]
+    loss_runs = run_lengths[~run_values]
+    
+    return {
+        'start_price': start_price,
+        'end_price': end_price,
+        'cagr': ((end_price / start_price) ** (1 / years) - 1) * 100,
+        'total_return': (end_price - start_price) / start_price * 100,
+        'ann_volatility': ann_volatility,
+        'sharpe': mean * periods_per_year / ann_volatility if std > 0 else 0,
+        'sortino': mean * periods_per_year / downside_std if downside_std > 0 else 0,
+        'max_drawdown': max_drawdown,
+        'best_day': returns.max() if n else np.nan,
+        'worst_day': returns.min() if n else np.nan,
+        'mean_return': mean,
+        'median_return': np.median(returns) if n else np.nan,
+        'win_rate': wins.mean() * 100 if n else np.nan,
+        'max_win_streak': int(win_runs.max(initial=0)),
+        'max_loss_streak': int(loss_runs.max(initial=0)),
+    }
+
 
 class UniversalStatisticalAnalyzer:
     """Statistical and technical analysis for any stock"""
     
-    def __init__(self, csv_file, company_name):
+    def __init__(self, csv_file, company_name, df=None, storage='csv', incremental=False):
+        """
+        Parameters:
+        -----------
+        csv_file : str
+            Path to the master data file (00_Master_Data/*_master_data_enhanced.csv)
+        company_name : str
+            Company name for reports
+        df : DataFrame, optional
+            Master data already in memory; when given, csv_file is not read
+        storage : str
+            Output table format: 'csv', 'parquet' or 'feather' (see table_storage.py)
+        incremental : bool
+            Only fold bars added since the last run into the saved indicator
+            state (indicator_state.json) instead of recomputing the technical
+            indicators over the whole history
+        """
         self.csv_file = csv_file
         self.company_name = company_name
-        self.df = None
+        self.df = df
+        self.storage = storage
+        self.incremental = incremental
         self.output_dir = os.path.dirname(os.path.dirname(csv_file))  # Parent of 00_Master_Data
         self.stats_dir = f"{self.output_dir}/10_Statistical_Analysis"
+        self.state_file = f"{self.stats_dir}/indicator_state.json"
         
     def load_data(self):
         """Load the master data file"""
@@ -38,7 +216,8 @@ class UniversalStatisticalAnalyzer:
         print(f"Input File: {self.csv_file}")
         print(f"{'='*70}\n")
         
-        self.df = pd.read_csv(self.csv_file)
+        if self.df is None:
+            self.df = read_table(self.csv_file)
         self.df['Date'] = pd.to_datetime(self.df['Date'])
         self.df = self.df.sort_values('Date').reset_index(drop=True)
         
@@ -58,13 +237,13 @@ class UniversalStatisticalAnalyzer:
         
         for period in periods:
             col_name = f'MA_{period}'
-            self.df[col_name] = self.df['Close'].rolling(window=period).mean()
+            self.df[col_name] = moving_average(self.df['Close'], period)
             print(f" {col_name} calculated")
         
         # Save
         output_file = f"{self.stats_dir}/moving_averages.csv"
         ma_cols = ['Date', 'Close'] + [f'MA_{p}' for p in periods]
-        self.df[ma_cols].to_csv(output_file, index=False)
+        output_file = write_table(self.df[ma_cols], output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return self.df
@@ -75,12 +254,7 @@ class UniversalStatisticalAnalyzer:
         print("CALCULATING RSI (Relative Strength Index)")
         print(f"{'='*70}\n")
         
-        delta = self.df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        self.df['RSI'] = 100 - (100 / (1 + rs))
+        self.df['RSI'] = relative_strength_index(self.df['Close'], period)
         
         print(f" RSI calculated (period={period})")
         print(f"  Current RSI: {self.df['RSI'].iloc[-1]:.2f}")
@@ -88,7 +262,7 @@ class UniversalStatisticalAnalyzer:
         
         # Save
         output_file = f"{self.stats_dir}/rsi_data.csv"
-        self.df[['Date', 'Close', 'RSI']].to_csv(output_file, index=False)
+        output_file = write_table(self.df[['Date', 'Close', 'RSI']], output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return self.df
@@ -99,12 +273,8 @@ class UniversalStatisticalAnalyzer:
         print("CALCULATING MACD")
         print(f"{'='*70}\n")
         
-        exp1 = self.df['Close'].ewm(span=fast, adjust=False).mean()
-        exp2 = self.df['Close'].ewm(span=slow, adjust=False).mean()
-        
-        self.df['MACD'] = exp1 - exp2
-        self.df['MACD_Signal'] = self.df['MACD'].ewm(span=signal, adjust=False).mean()
-        self.df['MACD_Histogram'] = self.df['MACD'] - self.df['MACD_Signal']
+        self.df['MACD'], self.df['MACD_Signal'], self.df['MACD_Histogram'] = macd(
+            self.df['Close'], fast, slow, signal)
         
         print(f" MACD calculated (fast={fast}, slow={slow}, signal={signal})")
         print(f"  Current MACD: {self.df['MACD'].iloc[-1]:.2f}")
@@ -112,7 +282,7 @@ class UniversalStatisticalAnalyzer:
         
         # Save
         output_file = f"{self.stats_dir}/macd_data.csv"
-        self.df[['Date', 'Close', 'MACD', 'MACD_Signal', 'MACD_Histogram']].to_csv(output_file, index=False)
+        output_file = write_table(self.df[['Date', 'Close', 'MACD', 'MACD_Signal', 'MACD_Histogram']], output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return self.df
@@ -123,11 +293,10 @@ class UniversalStatisticalAnalyzer:
         print("CALCULATING BOLLINGER BANDS")
         print(f"{'='*70}\n")
         
-        self.df['BB_Middle'] = self.df['Close'].rolling(window=period).mean()
-        rolling_std = self.df['Close'].rolling(window=period).std()
-        
-        self.df['BB_Upper'] = self.df['BB_Middle'] + (rolling_std * std_dev)
-        self.df['BB_Lower'] = self.df['BB_Middle'] - (rolling_std * std_dev)
+        upper, middle, lower = bollinger_bands(self.df['Close'], period, std_dev)
+        self.df['BB_Middle'] = middle
+        self.df['BB_Upper'] = upper
+        self.df['BB_Lower'] = lower
         self.df['BB_Width'] = self.df['BB_Upper'] - self.df['BB_Lower']
         
         print(f" Bollinger Bands calculated (period={period}, std={std_dev})")
@@ -135,7 +304,7 @@ class UniversalStatisticalAnalyzer:
         # Save
         output_file = f"{self.stats_dir}/bollinger_bands.csv"
         bb_cols = ['Date', 'Close', 'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width']
-        self.df[bb_cols].to_csv(output_file, index=False)
+        output_file = write_table(self.df[bb_cols], output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return self.df
@@ -146,12 +315,7 @@ class UniversalStatisticalAnalyzer:
         print("CALCULATING ATR (Average True Range)")
         print(f"{'='*70}\n")
         
-        high_low = self.df['High'] - self.df['Low']
-        high_close = np.abs(self.df['High'] - self.df['Close'].shift())
-        low_close = np.abs(self.df['Low'] - self.df['Close'].shift())
-        
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        self.df['ATR'] = tr.rolling(window=period).mean()
+        self.df['ATR'] = average_true_range(self.df['High'], self.df['Low'], self.df['Close'], period)
         
         print(f" ATR calculated (period={period})")
         print(f"  Current ATR: {self.df['ATR'].iloc[-1]:.2f}")
@@ -159,11 +323,92 @@ class UniversalStatisticalAnalyzer:
         
         # Save
         output_file = f"{self.stats_dir}/atr_data.csv"
-        self.df[['Date', 'High', 'Low', 'Close', 'ATR']].to_csv(output_file, index=False)
+        output_file = write_table(self.df[['Date', 'High', 'Low', 'Close', 'ATR']], output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return self.df
     
+    def save_indicator_state(self):
+        """Save the running indicator state for later incremental updates"""
+        state = IndicatorState()
+        state.fold(self.df)
+        state.save(self.state_file)
+        print(f"\n Indicator state saved: {self.state_file}")
+    
+    def update_indicators_incremental(self):
+        """
+        Fold only the bars added since the last run into the saved indicator state
+        
+        Earlier indicator values are taken from the previous enhanced data.
+        
+        Returns:
+        --------
+        bool : False when no usable state exists and a full calculation is needed
+        """
+        print(f"\n{'='*70}")
+        print("UPDATING TECHNICAL INDICATORS (INCREMENTAL)")
+        print(f"{'='*70}\n")
+        
+        previous_file = find_table(f"{self.stats_dir}/enhanced_data_with_indicators.csv")
+        if not os.path.exists(self.state_file) or previous_file is None:
+            print(" No saved indicator state - calculating all indicators")
+            return False
+        
+        state = IndicatorState.load(self.state_file)
+        previous = read_table(previous_file)
+        new_bars = self.df['Date'] > pd.Timestamp(state.last_date)
+        n_old = len(self.df) - int(new_bars.sum())
+        
+        # The saved state is only valid if the old history is unchanged (no restated prices)
+        history_unchanged = (
+            state.params == IndicatorState().params
+            and state.bars == n_old == len(previous)
+            and np.array_equal(previous['Close'].to_numpy(dtype=float),
+                               self.df['Close'].iloc[:n_old].to_numpy(dtype=float), equal_nan=True)
+        )
+        if not history_unchanged:
+            print(" Saved indicator state does not match the data - calculating all indicators")
+            return False
+        
+        missing = [col for col in state.columns() if col not in previous.columns]
+        if missing:
+            print(f" Columns missing from previous results ({', '.join(missing)}) - calculating all indicators")
+            return False
+        
+        new_values = pd.DataFrame(state.fold(self.df[new_bars]), columns=state.columns())
+        for col in state.columns():
+            self.df[col] = np.concatenate([previous[col].to_numpy(dtype=float),
+                                           new_values[col].to_numpy(dtype=float)])
+        state.save(self.state_file)
+        print(f" Folded {len(new_values)} new bars into the indicator state (last date: {state.last_date})")
+        
+        # Indicator tables, same layout as the full calculation
+        tables = {
+            'moving_averages.csv': ['Date', 'Close'] + [f'MA_{p}' for p in state.params['ma_periods']],
+            'rsi_data.csv': ['Date', 'Close', 'RSI'],
+            'macd_data.csv': ['Date', 'Close', 'MACD', 'MACD_Signal', 'MACD_Histogram'],
+            'bollinger_bands.csv': ['Date', 'Close', 'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width'],
+            'atr_data.csv': ['Date', 'High', 'Low', 'Close', 'ATR'],
+        }
+        for name, columns in tables.items():
+            output_file = write_table(self.df[columns], f"{self.stats_dir}/{name}", self.storage)
+            print(f" Saved to: {output_file}")
+        
+        return True
+    
+    def calculate_rolling_returns(self, windows=[30, 90, 252]):
+        """Calculate compounded rolling returns"""
+        print(f"\n{'='*70}")
+        print("CALCULATING ROLLING RETURNS")
+        print(f"{'='*70}\n")
+        
+        for window in windows:
+            col_name = f'Rolling_Return_{window}D'
+            self.df[col_name] = rolling_compound_return(self.df['Daily_Return'], window)
+            print(f" {col_name}: current {self.df[col_name].iloc[-1]:.2f}%")
+        
+        return self.df
+    
     def calculate_performance_metrics(self):
         """Calculate comprehensive performance metrics"""
         print(f"\n{'='*70}")
@@ -171,48 +416,16 @@ class UniversalStatisticalAnalyzer:
         print(f"{'='*70}\n")
         
         returns = self.df['Daily_Return'].dropna()
-        
-        # Basic metrics
         total_days = len(returns)
         years = (self.df['Date'].max() - self.df['Date'].min()).days / 365.25
         
-        # CAGR
-        start_price = self.df['Close'].iloc[0]
-        end_price = self.df['Close'].iloc[-1]
-        cagr = ((end_price / start_price) ** (1/years) - 1) * 100
-        
-        # Total return
-        total_return = ((end_price - start_price) / start_price) * 100
-        
-        # Annualized volatility
-        ann_volatility = returns.std() * np.sqrt(252)
-        
-        # Sharpe Ratio (assuming 0% risk-free rate)
-        sharpe = (returns.mean() * 252) / (returns.std() * np.sqrt(252)) if returns.std() > 0 else 0
-        
-        # Sortino Ratio (downside deviation)
-        downside_returns = returns[returns < 0]
-        downside_std = downside_returns.std() * np.sqrt(252)
-        sortino = (returns.mean() * 252) / downside_std if downside_std > 0 else 0
-        
-        # Maximum Drawdown
-        cumulative = (1 + returns/100).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max * 100
-        max_drawdown = drawdown.min()
-        
-        # Win/Loss streaks
-        win_loss = (returns > 0).astype(int)
-        streaks = []
-        current_streak = 1
-        for i in range(1, len(win_loss)):
-            if win_loss.iloc[i] == win_loss.iloc[i-1]:
-                current_streak += 1
-            else:
-                streaks.append(current_streak)
-                current_streak = 1
-        max_win_streak = max([s for i, s in enumerate(streaks) if win_loss.iloc[i] == 1], default=0)
-        max_loss_streak = max([s for i, s in enumerate(streaks) if win_loss.iloc[i] == 0], default=0)
+        m = performance_kernel(returns.to_numpy(dtype=float),
+                               self.df['Close'].iloc[0], self.df['Close'].iloc[-1], years)
+        start_price, end_price = m['start_price'], m['end_price']
+        cagr, total_return = m['cagr'], m['total_return']
+        ann_volatility, sharpe, sortino = m['ann_volatility'], m['sharpe'], m['sortino']
+        max_drawdown = m['max_drawdown']
+        max_win_streak, max_loss_streak = m['max_win_streak'], m['max_loss_streak']
         
         # Compile metrics
         metrics = {
@@ -246,11 +459,11 @@ class UniversalStatisticalAnalyzer:
                 f"{sharpe:.3f}",
                 f"{sortino:.3f}",
                 f"{max_drawdown:.2f}",
-                f"{returns.max():.2f}",
-                f"{returns.min():.2f}",
-                f"{returns.mean():.3f}",
-                f"{returns.median():.3f}",
-                f"{(returns > 0).mean() * 100:.2f}",
+                f"{m['best_day']:.2f}",
+                f"{m['worst_day']:.2f}",
+                f"{m['mean_return']:.3f}",
+                f"{m['median_return']:.3f}",
+                f"{m['win_rate']:.2f}",
                 max_win_streak,
                 max_loss_streak,
             ]
@@ -264,11 +477,11 @@ class UniversalStatisticalAnalyzer:
         print(f"  Sharpe Ratio: {sharpe:.3f}")
         print(f"  Sortino Ratio: {sortino:.3f}")
         print(f"  Max Drawdown: {max_drawdown:.2f}%")
-        print(f"  Win Rate: {(returns > 0).mean() * 100:.2f}%")
+        print(f"  Win Rate: {m['win_rate']:.2f}%")
         
         # Save
         output_file = f"{self.stats_dir}/performance_metrics.csv"
-        metrics_df.to_csv(output_file, index=False)
+        output_file = write_table(metrics_df, output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return metrics_df
@@ -307,7 +520,7 @@ class UniversalStatisticalAnalyzer:
         
         # Save
         output_file = f"{self.stats_dir}/yearly_returns.csv"
-        yearly_df.to_csv(output_file, index=False)
+        output_file = write_table(yearly_df, output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return yearly_df
@@ -339,7 +552,7 @@ class UniversalStatisticalAnalyzer:
         
         # Save
         output_file = f"{self.stats_dir}/risk_metrics.csv"
-        risk_metrics.to_csv(output_file, index=False)
+        output_file = write_table(risk_metrics, output_file, self.storage)
         print(f"\n Saved to: {output_file}")
         
         return risk_metrics
@@ -351,7 +564,7 @@ class UniversalStatisticalAnalyzer:
         print(f"{'='*70}\n")
         
         output_file = f"{self.stats_dir}/enhanced_data_with_indicators.csv"
-        self.df.to_csv(output_file, index=False)
+        output_file = write_table(self.df, output_file, self.storage)
         
         print(f" Enhanced data saved: {output_file}")
         print(f"  Rows: {len(self.df):,}")
@@ -363,13 +576,17 @@ class UniversalStatisticalAnalyzer:
             self.load_data()
             
             # Technical indicators
-            self.calculate_moving_averages([20, 50, 100, 200])
-            self.calculate_rsi(14)
-            self.calculate_macd(12, 26, 9)
-            self.calculate_bollinger_bands(20, 2)
-            self.calculate_atr(14)
+            if not (self.incremental and self.update_indicators_incremental()):
+                self.calculate_moving_averages([20, 50, 100, 200])
+                self.calculate_rsi(14)
+                self.calculate_macd(12, 26, 9)
+                self.calculate_bollinger_bands(20, 2)
+                self.calculate_atr(14)
+                if self.incremental:
+                    self.save_indicator_state()
             
             # Statistical metrics
+            self.calculate_rolling_returns([30, 90, 252])
             self.calculate_performance_metrics()
             self.calculate_yearly_returns()
             self.calculate_var_cvar(0.95)
@@ -387,6 +604,7 @@ class UniversalStatisticalAnalyzer:
             print(f"   MACD indicators")
             print(f"   Bollinger Bands")
             print(f"   ATR (Average True Range)")
+            print(f"   Rolling returns (30, 90, 252 days)")
             print(f"   Performance metrics (Sharpe, Sortino, etc.)")
             print(f"   Yearly returns breakdown")
             print(f"   Risk metrics (VaR, CVaR)")
@@ -418,16 +636,21 @@ Examples:
                        help='Path to master data CSV file')
     parser.add_argument('--company', '-c', required=True,
                        help='Company name for reports')
+    parser.add_argument('--storage', choices=list(STORAGE_FORMATS), default='csv',
+                       help='Output table format (default: csv)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only fold new bars into the saved indicator state (daily refresh)')
     
     args = parser.parse_args()
     
-    # Validate file exists
-    if not os.path.exists(args.file):
+    # Validate file exists (in any storage format)
+    if find_table(args.file) is None:
         print(f" ERROR: File not found: {args.file}")
         sys.exit(1)
     
     # Run analysis
-    analyzer = UniversalStatisticalAnalyzer(args.file, args.company)
+    analyzer = UniversalStatisticalAnalyzer(args.file, args.company, storage=args.storage,
+                                            incremental=args.incremental)
     success = analyzer.run_complete_analysis()
     
     sys.exit(0 if success else 1)
@@ -8,8 +8,15 @@ Generates:
 - Technical indicator charts (MA, RSI, MACD, Bollinger)
 - Performance charts (returns, drawdown, yearly performance)
 
+Charts are independent of each other and can be rendered in parallel by a
+pool of worker processes (chart_pool). The pool renders with the Agg backend
+and is meant to be reused: each worker imports matplotlib/seaborn once and
+then renders charts for any number of stocks.
+
 Usage:
     python universal_visualization_generator.py --analysis_dir "Company_Analysis_Complete" --company "Company Name"
+    python universal_visualization_generator.py --analysis_dir "Company_Analysis_Complete" --company "Company Name" --workers 5
+    python universal_visualization_generator.py --analysis_dir "Company_Analysis_Complete" --company "Company Name" --render-profile draft
 """
 
 import pandas as pd
@@ -17,20 +24,110 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import argparse
+import contextlib
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from table_storage import find_table, read_table
+from render_profiles import RENDER_PROFILES, save_figure
 
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
+# Chart methods of UniversalVisualizationGenerator, in output order
+CHARTS = [
+    'create_pattern_comparison_chart',
+    'create_weekday_monthly_charts',
+    'create_technical_indicator_charts',
+    'create_performance_charts',
+    'create_yearly_performance_chart',
+]
+
+# In-memory table each chart reads, if any (all other charts read their tables from disk)
+CHART_FRAMES = {
+    'create_technical_indicator_charts': 'enhanced_df',
+    'create_performance_charts': 'master_df',
+}
+
+
+def _init_chart_worker():
+    """Prepare a chart worker process: headless Agg backend"""
+    os.environ['MPLBACKEND'] = 'Agg'
+    plt.switch_backend('Agg')
+
+
+def chart_pool(workers=None):
+    """
+    Process pool for chart rendering
+    
+    Keep one pool open for a whole batch and pass it to
+    run_all_visualizations() / submit_charts() of every stock, so worker
+    processes (and their matplotlib/seaborn imports) are reused.
+    
+    Parameters:
+    -----------
+    workers : int, optional
+        Number of worker processes (default: CPU count)
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_chart_worker)
+
+
+def render_chart(analysis_dir, company_name, chart, render_profile='default', frame=None):
+    """
+    Render one chart of an analysis directory (pool task)
+    
+    The task only carries the chart's own input, so a worker receives a
+    few strings, plus one DataFrame for the charts listed in CHART_FRAMES.
+    
+    Parameters:
+    -----------
+    analysis_dir, company_name, render_profile : str
+        As for UniversalVisualizationGenerator
+    chart : str
+        Chart method name (one of CHARTS)
+    frame : DataFrame, optional
+        In-memory table the chart reads (see CHART_FRAMES)
+    
+    Returns:
+    --------
+    str : console output of the chart method
+    """
+    frames = {CHART_FRAMES[chart]: frame} if chart in CHART_FRAMES else {}
+    generator = UniversalVisualizationGenerator(analysis_dir, company_name,
+                                                render_profile=render_profile, **frames)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        getattr(generator, chart)()
+    return log.getvalue()
+
+
 class UniversalVisualizationGenerator:
     """Create visualizations for stock analysis"""
     
-    def __init__(self, analysis_dir, company_name):
+    def __init__(self, analysis_dir, company_name, master_df=None, enhanced_df=None,
+                 render_profile='default'):
+        """
+        Parameters:
+        -----------
+        analysis_dir : str
+            Analysis directory created by the pattern analyzer
+        company_name : str
+            Company name for chart titles
+        master_df, enhanced_df : DataFrame, optional
+            Master data and indicator data already in memory; when given,
+            the corresponding CSV files are not read back
+        render_profile : str
+            Chart resolution/format, see render_profiles.py
+            ('default', 'draft', 'web', 'print', 'svg')
+        """
         self.analysis_dir = analysis_dir
         self.company_name = company_name
+        self.master_df = master_df
+        self.enhanced_df = enhanced_df
+        self.render_profile = render_profile
         self.viz_dir = f"{analysis_dir}/08_Visualizations"
         
         # Create output directory
@@ -39,7 +136,7 @@ class UniversalVisualizationGenerator:
     def load_comparison_data(self):
         """Load pattern comparison table"""
         comparison_file = f"{self.analysis_dir}/07_Comparison_Tables/pattern_comparison_table.csv"
-        return pd.read_csv(comparison_file)
+        return read_table(comparison_file)
     
     def create_pattern_comparison_chart(self):
         """Create pattern comparison visualization"""
@@ -100,7 +197,7 @@ class UniversalVisualizationGenerator:
         plt.tight_layout()
         
         output_file = f"{self.viz_dir}/pattern_comparison_charts.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = save_figure(output_file, self.render_profile)
         plt.close()
         
         print(f" Pattern comparison charts saved: {output_file}")
@@ -115,8 +212,8 @@ class UniversalVisualizationGenerator:
         weekday_file = f"{self.analysis_dir}/03_Weekday_Analysis/weekday_comprehensive_statistics.csv"
         monthly_file = f"{self.analysis_dir}/06_Monthly_Analysis/monthly_comprehensive_statistics.csv"
         
-        weekday_df = pd.read_csv(weekday_file)
-        monthly_df = pd.read_csv(monthly_file)
+        weekday_df = read_table(weekday_file)
+        monthly_df = read_table(monthly_file)
         
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle(f'{self.company_name} - Cyclical Patterns Analysis', 
@@ -185,7 +282,7 @@ class UniversalVisualizationGenerator:
         plt.tight_layout()
         
         output_file = f"{self.viz_dir}/cyclical_patterns_charts.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = save_figure(output_file, self.render_profile)
         plt.close()
         
         print(f" Cyclical patterns charts saved: {output_file}")
@@ -196,20 +293,23 @@ class UniversalVisualizationGenerator:
         print("CREATING TECHNICAL INDICATOR CHARTS")
         print(f"{'='*70}\n")
         
-        # Check if statistical analysis exists
-        stats_dir = f"{self.analysis_dir}/10_Statistical_Analysis"
-        if not os.path.exists(stats_dir):
-            print(" Statistical analysis not found. Run universal_statistical_analyzer.py first.")
-            return
-        
-        # Load enhanced data
-        enhanced_file = f"{stats_dir}/enhanced_data_with_indicators.csv"
-        if not os.path.exists(enhanced_file):
-            print(" Enhanced data file not found.")
-            return
-        
-        df = pd.read_csv(enhanced_file)
-        df['Date'] = pd.to_datetime(df['Date'])
+        if self.enhanced_df is not None:
+            df = self.enhanced_df
+        else:
+            # Check if statistical analysis exists
+            stats_dir = f"{self.analysis_dir}/10_Statistical_Analysis"
+            if not os.path.exists(stats_dir):
+                print(" Statistical analysis not found. Run universal_statistical_analyzer.py first.")
+                return
+            
+            # Load enhanced data
+            enhanced_file = f"{stats_dir}/enhanced_data_with_indicators.csv"
+            if find_table(enhanced_file) is None:
+                print(" Enhanced data file not found.")
+                return
+            
+            df = read_table(enhanced_file)
+            df['Date'] = pd.to_datetime(df['Date'])
         
         # Use last 500 days for visibility
         df_recent = df.tail(500)
@@ -277,7 +377,7 @@ class UniversalVisualizationGenerator:
         plt.tight_layout()
         
         output_file = f"{self.viz_dir}/technical_indicators_charts.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = save_figure(output_file, self.render_profile)
         plt.close()
         
         print(f" Technical indicator charts saved: {output_file}")
@@ -288,16 +388,19 @@ class UniversalVisualizationGenerator:
         print("CREATING PERFORMANCE CHARTS")
         print(f"{'='*70}\n")
         
-        # Load master data
-        master_files = [f for f in os.listdir(f"{self.analysis_dir}/00_Master_Data") 
-                       if f.endswith('_master_data_enhanced.csv')]
-        
-        if not master_files:
-            print(" Master data file not found.")
-            return
-        
-        df = pd.read_csv(f"{self.analysis_dir}/00_Master_Data/{master_files[0]}")
-        df['Date'] = pd.to_datetime(df['Date'])
+        if self.master_df is not None:
+            df = self.master_df.copy()
+        else:
+            # Load master data
+            master_files = [f for f in os.listdir(f"{self.analysis_dir}/00_Master_Data") 
+                           if os.path.splitext(f)[0].endswith('_master_data_enhanced')]
+            
+            if not master_files:
+                print(" Master data file not found.")
+                return
+            
+            df = read_table(f"{self.analysis_dir}/00_Master_Data/{master_files[0]}")
+            df['Date'] = pd.to_datetime(df['Date'])
         
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle(f'{self.company_name} - Performance Analysis', 
@@ -340,7 +443,7 @@ class UniversalVisualizationGenerator:
         plt.tight_layout()
         
         output_file = f"{self.viz_dir}/performance_charts.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = save_figure(output_file, self.render_profile)
         plt.close()
         
         print(f" Performance charts saved: {output_file}")
@@ -355,11 +458,11 @@ class UniversalVisualizationGenerator:
         stats_dir = f"{self.analysis_dir}/10_Statistical_Analysis"
         yearly_file = f"{stats_dir}/yearly_returns.csv"
         
-        if not os.path.exists(yearly_file):
+        if find_table(yearly_file) is None:
             print(" Yearly returns file not found.")
             return
         
-        df = pd.read_csv(yearly_file)
+        df = read_table(yearly_file)
         
         fig, ax = plt.subplots(figsize=(14, 6))
         
@@ -377,13 +480,42 @@ class UniversalVisualizationGenerator:
         plt.tight_layout()
         
         output_file = f"{self.viz_dir}/yearly_returns_chart.png"
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        output_file = save_figure(output_file, self.render_profile)
         plt.close()
         
         print(f" Yearly returns chart saved: {output_file}")
     
-    def run_all_visualizations(self):
-        """Generate all visualizations"""
+    def submit_charts(self, executor):
+        """
+        Submit every chart as an independent task
+        
+        Parameters:
+        -----------
+        executor : Executor
+            Pool from chart_pool()
+        
+        Returns:
+        --------
+        list : one future per chart (in CHARTS order), each giving the chart's console output
+        """
+        futures = []
+        for chart in CHARTS:
+            # Only the table this chart reads is sent to the worker
+            frame = getattr(self, CHART_FRAMES[chart]) if chart in CHART_FRAMES else None
+            futures.append(executor.submit(render_chart, self.analysis_dir, self.company_name, chart,
+                                           self.render_profile, frame))
+        return futures
+    
+    def run_all_visualizations(self, executor=None):
+        """
+        Generate all visualizations
+        
+        Parameters:
+        -----------
+        executor : Executor, optional
+            Render the charts in parallel in this pool (see chart_pool);
+            by default they are rendered one after another in this process
+        """
         print(f"\n{'='*70}")
         print(f"UNIVERSAL VISUALIZATION GENERATOR")
         print(f"{'='*70}")
@@ -392,11 +524,12 @@ class UniversalVisualizationGenerator:
         print(f"{'='*70}\n")
         
         try:
-            self.create_pattern_comparison_chart()
-            self.create_weekday_monthly_charts()
-            self.create_technical_indicator_charts()
-            self.create_performance_charts()
-            self.create_yearly_performance_chart()
+            if executor is None:
+                for chart in CHARTS:
+                    getattr(self, chart)()
+            else:
+                for future in self.submit_charts(executor):
+                    print(future.result(), end='')
             
             print(f"\n{'='*70}")
             print(f" ALL VISUALIZATIONS COMPLETE!")
@@ -435,6 +568,10 @@ Examples:
                        help='Path to analysis directory (e.g., Company_Analysis_Complete)')
     parser.add_argument('--company', '-c', required=True,
                        help='Company name for chart titles')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                       help='Render charts in parallel with this many processes (default: 1)')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                       help='Chart resolution/format: draft, web, print (PDF), svg (default: 300 DPI PNG)')
     
     args = parser.parse_args()
     
@@ -444,8 +581,13 @@ Examples:
         sys.exit(1)
     
     # Run visualization
-    generator = UniversalVisualizationGenerator(args.analysis_dir, args.company)
-    success = generator.run_all_visualizations()
+    generator = UniversalVisualizationGenerator(args.analysis_dir, args.company,
+                                                render_profile=args.render_profile)
+    if args.workers > 1:
+        with chart_pool(args.workers) as executor:
+            success = generator.run_all_visualizations(executor)
+    else:
+        success = generator.run_all_visualizations()
     
     sys.exit(0 if success else 1)
 
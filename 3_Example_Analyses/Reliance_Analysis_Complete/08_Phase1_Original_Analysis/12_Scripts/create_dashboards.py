@@ -4,6 +4,10 @@ PHASE 1 VISUALIZATION - Technical & Statistical Dashboards
 Creates comprehensive visualization dashboards for:
 - Technical indicators (Price, MAs, RSI, MACD, Bollinger Bands, Volume, ATR)
 - Statistical analysis (Distributions, Drawdowns, Returns, Risk metrics)
+
+Usage:
+    python create_dashboards.py                         # 300 DPI PNG
+    python create_dashboards.py --render-profile draft  # or: web, print (PDF), svg
 """
 
 import pandas as pd
@@ -12,7 +16,9 @@ import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 import seaborn as sns
 from datetime import datetime
+import argparse
 import os
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -28,6 +34,13 @@ print()
 
 # Setup paths
 base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(base_dir)), '2_Generic_Stock_Analyzer'))
+from render_profiles import RENDER_PROFILES, save_figure
+
+parser = argparse.ArgumentParser(description='Create technical & statistical dashboards')
+parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                    help='Chart resolution/format (default: 300 DPI PNG)')
+render_profile = parser.parse_args().render_profile
 
 # Load data
 print("📂 Loading enhanced data...")
@@ -176,8 +189,8 @@ ax10.grid(True, alpha=0.3)
 plt.suptitle('RELIANCE INDUSTRIES - TECHNICAL ANALYSIS DASHBOARD', fontsize=18, fontweight='bold', y=0.995)
 
 output_path = os.path.join(base_dir, 'Reliance_Complete_Analysis', '10_Visualizations', 'technical_analysis_dashboard.png')
-plt.savefig(output_path, dpi=300, bbox_inches='tight')
-print(f"✓ Saved Technical Dashboard: 10_Visualizations/technical_analysis_dashboard.png")
+output_path = save_figure(output_path, render_profile)
+print(f"✓ Saved Technical Dashboard: 10_Visualizations/{os.path.basename(output_path)}")
 plt.close()
 
 # ============================================================================
@@ -316,8 +329,8 @@ for i, v in enumerate(key_metrics['Value']):
 plt.suptitle('RELIANCE INDUSTRIES - STATISTICAL ANALYSIS DASHBOARD', fontsize=18, fontweight='bold', y=0.995)
 
 output_path2 = os.path.join(base_dir, 'Reliance_Complete_Analysis', '10_Visualizations', 'statistical_analysis_dashboard.png')
-plt.savefig(output_path2, dpi=300, bbox_inches='tight')
-print(f"✓ Saved Statistical Dashboard: 10_Visualizations/statistical_analysis_dashboard.png")
+output_path2 = save_figure(output_path2, render_profile)
+print(f"✓ Saved Statistical Dashboard: 10_Visualizations/{os.path.basename(output_path2)}")
 plt.close()
 
 print()
@@ -326,6 +339,6 @@ print("✅ VISUALIZATION CREATION COMPLETE!")
 print("=" * 80)
 print()
 print("📁 Generated Files:")
-print("   • 10_Visualizations/technical_analysis_dashboard.png")
-print("   • 10_Visualizations/statistical_analysis_dashboard.png")
+print(f"   • 10_Visualizations/{os.path.basename(output_path)}")
+print(f"   • 10_Visualizations/{os.path.basename(output_path2)}")
 print()
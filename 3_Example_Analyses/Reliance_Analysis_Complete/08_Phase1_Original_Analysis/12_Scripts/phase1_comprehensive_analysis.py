@@ -23,7 +23,10 @@ print()
 # Load data
 print("📂 Loading Reliance Industries data...")
 import os
+import sys
 base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(base_dir)), '2_Generic_Stock_Analyzer'))
+from universal_statistical_analyzer import rolling_compound_return
 df = pd.read_csv(os.path.join(base_dir, 'Reliance_Industries.csv'))
 df['Date'] = pd.to_datetime(df['Date'], format='%d-%b-%Y')
 df = df.sort_values('Date').reset_index(drop=True)
@@ -419,9 +422,9 @@ print()
 
 # 8.3 Rolling Returns
 print("📊 Rolling Returns...")
-df['Rolling_30D'] = df['Daily_Return'].rolling(window=30).apply(lambda x: ((1 + x/100).prod() - 1) * 100)
-df['Rolling_90D'] = df['Daily_Return'].rolling(window=90).apply(lambda x: ((1 + x/100).prod() - 1) * 100)
-df['Rolling_365D'] = df['Daily_Return'].rolling(window=252).apply(lambda x: ((1 + x/100).prod() - 1) * 100)
+df['Rolling_30D'] = rolling_compound_return(df['Daily_Return'], 30)
+df['Rolling_90D'] = rolling_compound_return(df['Daily_Return'], 90)
+df['Rolling_365D'] = rolling_compound_return(df['Daily_Return'], 252)
 
 current_30d = df['Rolling_30D'].iloc[-1]
 current_90d = df['Rolling_90D'].iloc[-1]
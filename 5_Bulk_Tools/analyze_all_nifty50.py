@@ -1,24 +1,237 @@
 """
 NIFTY50 Batch Analyzer
 Extracts all 50 stocks from NIFTY50.csv and analyzes each using Generic Stock Analyzer
+
+Stocks are analyzed in a pool of worker processes. Each worker imports the
+analyzer modules once and runs the pipeline in-process, so there is no
+Python interpreter start-up per stock and no change of working directory.
+
+Stocks whose extracted CSV content is unchanged since the last run reuse
+their cached analysis (see 2_Generic_Stock_Analyzer/stage_cache.py), so a
+re-run after one file changes only analyzes that stock again.
+
+Charts are not rendered inside the stock's pipeline: once a stock is
+analyzed, each of its charts is queued in the same pool as an independent
+task, so chart rendering is spread over all workers (which import
+matplotlib/seaborn only once) across charts and across stocks.
+
+Usage:
+    python analyze_all_nifty50.py              # one worker per CPU
+    python analyze_all_nifty50.py --workers 4
+    python analyze_all_nifty50.py --force      # ignore cached results
+    python analyze_all_nifty50.py --render-profile draft   # fast low-resolution charts
 """
 
 import os
 import sys
-import subprocess
+import io
 import time
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 # Add Generic Stock Analyzer to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '2_Generic_Stock_Analyzer'))
+GENERIC_ANALYZER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '2_Generic_Stock_Analyzer')
+sys.path.insert(0, GENERIC_ANALYZER_DIR)
+
+
+def _init_worker():
+    """Prepare a worker process: headless plotting and analyzer import path"""
+    os.environ['MPLBACKEND'] = 'Agg'
+    if GENERIC_ANALYZER_DIR not in sys.path:
+        sys.path.insert(0, GENERIC_ANALYZER_DIR)
+
+
+def analyze_single_stock(stock_path, stock_name, output_subdir, force=False, render_profile='default'):
+    """
+    Run the complete Generic Stock Analyzer pipeline for one stock
+    
+    Console output of the pipeline is captured and returned with the record
+    so parallel workers do not interleave their logs. Charts are left to the
+    caller (see _submit_charts).
+    
+    Args:
+        output_subdir: Directory in which the analysis directory is created
+                       (None or empty: the current directory)
+        force: Rerun every pipeline step even if cached outputs are current
+        render_profile: Chart resolution/format (see render_profiles.py)
+    
+    Returns:
+        Tuple of (result record, captured output)
+    """
+    from analyze_stock import StockAnalysisPipeline
+    from universal_visualization_generator import CHARTS
+    
+    stock_start = time.time()
+    log = io.StringIO()
+    
+    try:
+        if output_subdir:
+            os.makedirs(output_subdir, exist_ok=True)
+        
+        pipeline = StockAnalysisPipeline(
+            csv_file=stock_path,
+            company_name=stock_name,
+            output_root=output_subdir or None,
+            in_process=True,
+            force=force,
+            defer_charts=True,
+            render_profile=render_profile
+        )
+        
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            success = pipeline.run_complete_pipeline()
+        
+        stock_time = time.time() - stock_start
+        
+        if success:
+            # Count generated files (recursively)
+            file_count = sum([len(files) for _, _, files in os.walk(pipeline.output_dir)])
+            
+            return {
+                'stock': stock_name,
+                'status': '✅ Success',
+                'time': stock_time,
+                'files': file_count,
+                'output_dir': output_subdir,
+                'analysis_dir': pipeline.output_dir,
+                'viz_key': pipeline.deferred_viz_key,
+                'charts': list(CHARTS),
+                'render_profile': render_profile
+            }, log.getvalue()
+        
+        return {
+            'stock': stock_name,
+            'status': '❌ Failed',
+            'time': stock_time,
+            'files': 0,
+            'output_dir': output_subdir
+        }, log.getvalue()
+    
+    except Exception as e:
+        stock_time = time.time() - stock_start
+        return {
+            'stock': stock_name,
+            'status': f'❌ Error: {str(e)[:50]}',
+            'time': stock_time,
+            'files': 0,
+            'output_dir': None
+        }, log.getvalue()
+
+
+def _render_chart(analysis_dir, stock_name, chart, render_profile):
+    """Render one chart of an analyzed stock (pool task; plotting is only imported by workers)"""
+    from universal_visualization_generator import render_chart
+    return render_chart(analysis_dir, stock_name, chart, render_profile)
 
-def analyze_all_nifty50():
+
+def _submit_charts(executor, result):
+    """
+    Queue the charts of an analyzed stock as independent pool tasks
+    
+    Each task only carries the analysis directory, stock name, chart name
+    and render profile; the worker reads the chart's tables from disk.
+    
+    Returns:
+        Tuple of (stage cache, snapshot before rendering, chart futures),
+        used to record the stock's visualization step once the charts are done
+    """
+    from stage_cache import StageCache
+    
+    cache = StageCache(result['analysis_dir'])
+    before = cache.snapshot()
+    futures = [executor.submit(_render_chart, result['analysis_dir'], result['stock'], chart,
+                               result['render_profile'])
+               for chart in result['charts']]
+    return cache, before, futures
+
+
+def run_stock_batch(jobs, workers=None):
+    """
+    Analyze stocks in a pool of worker processes, charts included
+    
+    Args:
+        jobs: Tuples of analyze_single_stock arguments
+              (stock_path, stock_name, output_subdir, force, render_profile);
+              an empty output_subdir writes into the current directory
+        workers: Number of worker processes (default: CPU count)
+    
+    Returns:
+        List of result records (stock, status, time, files, output_dir),
+        in the order of jobs
+    """
+    workers = workers or os.cpu_count() or 1
+    print(f"\n⚙️  Running with {workers} worker process(es)")
+    
+    results_by_stock = {}
+    chart_jobs = {}
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(analyze_single_stock, *job): job[1] for job in jobs}
+        
+        for idx, future in enumerate(as_completed(futures), 1):
+            stock_name = futures[future]
+            
+            try:
+                result, log = future.result()
+            except Exception as e:
+                # Worker process died before returning a record
+                result, log = {
+                    'stock': stock_name,
+                    'status': f'❌ Error: {str(e)[:50]}',
+                    'time': 0.0,
+                    'files': 0,
+                    'output_dir': None
+                }, ''
+            
+            results_by_stock[stock_name] = result
+            
+            # Charts of a finished stock go to the same pool
+            if result.get('viz_key'):
+                chart_jobs[stock_name] = _submit_charts(executor, result)
+            
+            print(f"\n[{idx}/{len(jobs)}] {stock_name}")
+            if result['status'].startswith('✅'):
+                print(f"   ✅ Analysis complete: {result['files']} files generated in {result['time']:.2f}s")
+            else:
+                print(f"   {result['status']} after {result['time']:.2f}s")
+                if log:
+                    print(f"   Output: {log[-200:]}")
+        
+        if chart_jobs:
+            print(f"\n🎨 Rendering charts of {len(chart_jobs)} stock(s)...")
+        
+        for stock_name, (cache, before, chart_futures) in chart_jobs.items():
+            result = results_by_stock[stock_name]
+            try:
+                for chart_future in chart_futures:
+                    chart_future.result()
+            except Exception as e:
+                # As in the pipeline, failed charts do not fail the stock
+                print(f"   ⚠️  {stock_name}: chart rendering failed ({str(e)[:50]})")
+                continue
+            
+            cache.record('visualization', result['viz_key'], before)
+            cache.save()
+            result['files'] = sum([len(files) for _, _, files in os.walk(result['analysis_dir'])])
+    
+    # Keep the report in input order, not completion order
+    return [results_by_stock[job[1]] for job in jobs]
+
+
+def analyze_all_nifty50(workers=None, force=False, render_profile='default'):
     """
     Complete pipeline:
     1. Extract all 50 stocks from NIFTY50.csv
     2. Analyze each stock using Generic Stock Analyzer
     3. Generate master summary report
+    
+    Args:
+        workers: Number of worker processes (default: CPU count)
+        force: Reanalyze every stock, ignoring cached results
+        render_profile: Chart resolution/format, e.g. 'draft' for nightly runs
     """
     
     print("\n" + "="*80)
@@ -54,78 +267,24 @@ def analyze_all_nifty50():
     print("STEP 2: ANALYZING EACH STOCK WITH GENERIC STOCK ANALYZER")
     print("─"*80)
     
-    analysis_results = []
     analysis_start = time.time()
     
     # Create master output directory
     master_output_dir = '5_NIFTY50_Complete_Analyses'
     os.makedirs(master_output_dir, exist_ok=True)
     
-    for idx, stock_file in enumerate(stock_files, 1):
-        stock_path = os.path.join(stock_dir, stock_file)
+    jobs = []
+    for stock_file in stock_files:
         stock_name = stock_file.replace('.csv', '')
-        
-        print(f"\n[{idx}/{len(stock_files)}] Analyzing: {stock_name}")
-        print("─"*60)
-        
-        stock_start = time.time()
-        
-        try:
-            # Create output directory for this stock
-            output_subdir = os.path.join(master_output_dir, f"{stock_name}_Analysis")
-            os.makedirs(output_subdir, exist_ok=True)
-            
-            # Change to output directory for analysis
-            original_dir = os.getcwd()
-            os.chdir(output_subdir)
-            
-            # Run analyzer as subprocess
-            analyzer_script = os.path.join(original_dir, '2_Generic_Stock_Analyzer', 'analyze_stock.py')
-            result = subprocess.run(
-                [sys.executable, analyzer_script, '--file', stock_path, '--company', stock_name, '--all'],
-                capture_output=True,
-                text=True
-            )
-            
-            os.chdir(original_dir)
-            
-            stock_time = time.time() - stock_start
-            
-            if result.returncode == 0:
-                # Count generated files (recursively)
-                file_count = sum([len(files) for _, _, files in os.walk(output_subdir)])
-                
-                analysis_results.append({
-                    'stock': stock_name,
-                    'status': '✅ Success',
-                    'time': stock_time,
-                    'files': file_count,
-                    'output_dir': output_subdir
-                })
-                
-                print(f"   ✅ Analysis complete: {file_count} files generated in {stock_time:.2f}s")
-            else:
-                analysis_results.append({
-                    'stock': stock_name,
-                    'status': '❌ Failed',
-                    'time': stock_time,
-                    'files': 0,
-                    'output_dir': output_subdir
-                })
-                print(f"   ❌ Analysis failed after {stock_time:.2f}s")
-                if result.stderr:
-                    print(f"   Error: {result.stderr[:200]}")
-                
-        except Exception as e:
-            stock_time = time.time() - stock_start
-            analysis_results.append({
-                'stock': stock_name,
-                'status': f'❌ Error: {str(e)[:50]}',
-                'time': stock_time,
-                'files': 0,
-                'output_dir': None
-            })
-            print(f"   ❌ Error: {str(e)}")
+        jobs.append((
+            os.path.join(stock_dir, stock_file),
+            stock_name,
+            os.path.join(master_output_dir, f"{stock_name}_Analysis"),
+            force,
+            render_profile
+        ))
+    
+    analysis_results = run_stock_batch(jobs, workers)
     
     analysis_time = time.time() - analysis_start
     total_time = time.time() - start_time
@@ -257,4 +416,16 @@ def analyze_all_nifty50():
     return analysis_results
 
 if __name__ == "__main__":
-    results = analyze_all_nifty50()
+    from render_profiles import RENDER_PROFILES
+    
+    parser = argparse.ArgumentParser(description='Analyze all NIFTY50 stocks with the Generic Stock Analyzer')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Reanalyze every stock, ignoring cached results')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                        help='Chart resolution/format (default: 300 DPI PNG; draft for fast nightly runs)')
+    args = parser.parse_args()
+    
+    results = analyze_all_nifty50(workers=args.workers, force=args.force,
+                                  render_profile=args.render_profile)
@@ -1,64 +1,79 @@
 """
 Simple batch analyzer for NIFTY50 stocks
-Runs each stock through the analyzer one by one
+Runs every extracted stock through the analyzer in a pool of worker processes
+
+Uses the same in-process runner as analyze_all_nifty50.py (no Python
+interpreter per stock), without the extraction step and the master report.
+Each stock is written to <stock>_Analysis_Complete/ in the current
+directory, as analyze_stock.py does.
+
+Usage:
+    python batch_analyze_simple.py
+    python batch_analyze_simple.py --workers 4 --force
 """
 
 import os
-import sys
 import time
-import subprocess
-from pathlib import Path
+import argparse
+
+from analyze_all_nifty50 import run_stock_batch
 
 # Get all extracted stock files
 stock_dir = "4_NIFTY50_Individual_Stocks"
 output_dir = "5_NIFTY50_Complete_Analyses"
 
-stock_files = sorted([f for f in os.listdir(stock_dir) if f.endswith('.csv') and not f.startswith('_')])
-
-print(f"\nFound {len(stock_files)} stocks to analyze")
-print(f"Output directory: {output_dir}")
-print(f"\nStarting batch analysis...")
-print("="*80)
-
-os.makedirs(output_dir, exist_ok=True)
-
-start_time = time.time()
-success_count = 0
-failed_count = 0
 
-for idx, stock_file in enumerate(stock_files, 1):
-    stock_name = stock_file.replace('.csv', '')
-    stock_path = os.path.join(stock_dir, stock_file)
+def main():
+    """Main entry point"""
+    from render_profiles import RENDER_PROFILES
+    
+    parser = argparse.ArgumentParser(description='Analyze all extracted NIFTY50 stocks')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Reanalyze every stock, ignoring cached results')
+    parser.add_argument('--render-profile', choices=list(RENDER_PROFILES), default='default',
+                        help='Chart resolution/format (default: 300 DPI PNG)')
+    args = parser.parse_args()
+    
+    stock_files = sorted([f for f in os.listdir(stock_dir) if f.endswith('.csv') and not f.startswith('_')])
+    
+    print(f"\nFound {len(stock_files)} stocks to analyze")
+    print(f"Output directory: {output_dir}")
+    print(f"\nStarting batch analysis...")
+    print("="*80)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    start_time = time.time()
     
-    print(f"\n[{idx}/{len(stock_files)}] {stock_name}")
-    print("="*60)
+    jobs = []
+    for stock_file in stock_files:
+        stock_name = stock_file.replace('.csv', '')
+        jobs.append((
+            os.path.join(stock_dir, stock_file),
+            stock_name,
+            None,
+            args.force,
+            args.render_profile
+        ))
     
-    # Build command - use full Python path to ensure correct environment
-    python_exe = r"C:\Users\mohit1\AppData\Local\Programs\Python\Python313\python.exe"
-    analyzer_script = r"2_Generic_Stock_Analyzer\analyze_stock.py"
+    results = run_stock_batch(jobs, args.workers)
     
-    # Run analysis using subprocess
-    result = subprocess.run(
-        [python_exe, analyzer_script, "--file", stock_path, "--company", stock_name, "--all"],
-        cwd=os.getcwd(),
-        capture_output=False,
-        text=True
-    )
+    success_count = sum(1 for r in results if r['status'].startswith('✅'))
+    failed_count = len(results) - success_count
+    total_time = time.time() - start_time
     
-    if result.returncode == 0:
-        success_count += 1
-        print(f"  SUCCESS")
-    else:
-        failed_count += 1
-        print(f"  FAILED (exit code: {result.returncode})")
+    print("\n" + "="*80)
+    print("BATCH ANALYSIS COMPLETE")
+    print("="*80)
+    print(f"Total: {len(stock_files)}")
+    print(f"Success: {success_count}")
+    print(f"Failed: {failed_count}")
+    print(f"Time: {total_time:.2f}s ({total_time/60:.2f} min)")
+    if stock_files:
+        print(f"Avg per stock: {total_time/len(stock_files):.2f}s")
 
-total_time = time.time() - start_time
 
-print("\n" + "="*80)
-print("BATCH ANALYSIS COMPLETE")
-print("="*80)
-print(f"Total: {len(stock_files)}")
-print(f"Success: {success_count}")
-print(f"Failed: {failed_count}")
-print(f"Time: {total_time:.2f}s ({total_time/60:.2f} min)")
-print(f"Avg per stock: {total_time/len(stock_files):.2f}s")
+if __name__ == "__main__":
+    main()
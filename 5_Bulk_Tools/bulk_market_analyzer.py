@@ -6,13 +6,56 @@ Supports batch processing for entire market/index analysis
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional, Tuple
 import os
+import sys
 from pathlib import Path
-from metric_calculator import FundamentalMetricsCalculator
-from scoring_engine import FundamentalScorer
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import json
+from collections.abc import Sequence
+
+# Core scoring modules live in 1_Core_Fundamental_Scoring
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '1_Core_Fundamental_Scoring'))
+
+from metric_calculator import FundamentalMetricsCalculator
+from scoring_engine import ScoringEngine
+from output_writers import RESULT_FORMATS, write_records, write_workbook
+from result_types import CATEGORY_NAMES, METRIC_NAMES, CompanyResult
+
+# Output formats of save_results: summary table, workbook and detailed result formats
+OUTPUT_FORMATS = ['csv', 'excel'] + list(RESULT_FORMATS)
+
+
+def _score_company(company_data: Dict) -> Tuple[Optional[CompanyResult], Optional[str]]:
+    """
+    Score one company without printing anything
+
+    Module-level so it can be pickled and run in worker processes.
+
+    Args:
+        company_data: Financial data dictionary for one company
+
+    Returns:
+        Tuple of (result, error). Exactly one of them is None.
+    """
+    try:
+        # Calculate metrics
+        calculator = FundamentalMetricsCalculator(company_data, verbose=False)
+        metrics = calculator.calculate_all_metrics()
+
+        # Calculate scores
+        scorer = ScoringEngine(metrics, verbose=False)
+        scorer.calculate_scores()
+        scorer.calculate_category_scores()
+        scorer.calculate_final_score()
+
+        # Prepare result (compact arrays; result.to_dict() gives the nested dictionaries)
+        result = CompanyResult.from_scorer(company_data['company_info'], scorer)
+
+        return result, None
+
+    except Exception as e:
+        return None, str(e)
 
 
 class BulkMarketAnalyzer:
@@ -27,9 +70,41 @@ class BulkMarketAnalyzer:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-        self.results = []
+        self._results = []
+        self.errors = []
+        
+        # Summary tables built from the results, keyed by their options.
+        # _results_version changes whenever the results do.
+        self._results_version = 0
+        self._summary_cache = {}
+        self._summary_version = None
+    
+    @property
+    def results(self) -> Tuple[CompanyResult, ...]:
+        """
+        Results of the last analyze_market run (read-only)
         
-    def analyze_company(self, company_data: Dict) -> Dict:
+        Change them by assigning a new sequence or with add_result(), so the
+        cached summary table is rebuilt.
+        """
+        return tuple(self._results)
+    
+    @results.setter
+    def results(self, results: Iterable[CompanyResult]):
+        self._results = list(results)
+        self._results_version += 1
+    
+    def add_result(self, result: CompanyResult):
+        """
+        Add one company result (e.g. from analyze_company) to the results
+        
+        Args:
+            result: CompanyResult to add
+        """
+        self._results.append(result)
+        self._results_version += 1
+    
+    def analyze_company(self, company_data: Dict) -> Optional[CompanyResult]:
         """
         Analyze a single company
         
@@ -37,41 +112,30 @@ class BulkMarketAnalyzer:
             company_data: Financial data dictionary for one company
             
         Returns:
-            Dictionary with company info, metrics, and scores
+            CompanyResult with company info, metrics, and scores (to_dict()
+            converts it to the nested dictionary format), or None on error
         """
-        try:
-            # Calculate metrics
-            calculator = FundamentalMetricsCalculator(company_data)
-            metrics = calculator.calculate_all_metrics()
-            
-            # Calculate scores
-            scorer = FundamentalScorer(metrics)
-            normalized_scores = scorer.calculate_normalized_scores()
-            category_scores, final_score, rating = scorer.calculate_final_score(normalized_scores)
-            
-            # Prepare result
-            result = {
-                'company_info': company_data['company_info'],
-                'final_score': final_score,
-                'rating': rating,
-                'category_scores': category_scores,
-                'metrics': metrics,
-                'normalized_scores': normalized_scores,
-                'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            return result
-            
-        except Exception as e:
-            print(f"❌ Error analyzing {company_data['company_info']['company_name']}: {str(e)}")
-            return None
+        result, error = _score_company(company_data)
+        
+        if error is not None:
+            print(f"❌ Error analyzing {company_data['company_info']['company_name']}: {error}")
+        
+        return result
     
-    def analyze_market(self, companies_data: List[Dict]) -> pd.DataFrame:
+    def analyze_market(self, companies_data: List[Dict], workers: int = 1,
+                       chunksize: Optional[int] = None, percentiles: bool = False,
+                       by_sector: bool = False) -> pd.DataFrame:
         """
         Analyze multiple companies
         
         Args:
             companies_data: List of company financial data dictionaries
+            workers: Number of worker processes. 1 runs serially in this process
+            chunksize: Companies sent to a worker at a time (default: spread
+                       evenly as ~4 chunks per worker)
+            percentiles: Add universe-wide percentile scores (see
+                         create_summary_dataframe)
+            by_sector: Rank percentiles within each sector
             
         Returns:
             DataFrame with all companies ranked by score
@@ -81,40 +145,109 @@ class BulkMarketAnalyzer:
         print("="*80)
         print(f"\nAnalyzing {len(companies_data)} companies...")
         
-        self.results = []
-        successful = 0
-        failed = 0
+        self.errors = []
         
-        for i, company_data in enumerate(companies_data, 1):
-            company_name = company_data['company_info']['company_name']
-            print(f"\n[{i}/{len(companies_data)}] Analyzing: {company_name}")
-            
-            result = self.analyze_company(company_data)
+        if workers > 1 and len(companies_data) > 1:
+            if chunksize is None:
+                chunksize = max(1, len(companies_data) // (workers * 4))
+            print(f"Using {workers} worker processes (chunks of {chunksize})")
             
-            if result:
-                self.results.append(result)
-                successful += 1
-                print(f"✓ Score: {result['final_score']:.2f}/100 - {result['rating']}")
+            # map() yields results in input order, so output is deterministic
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_score_company, companies_data, chunksize=chunksize))
+        else:
+            outcomes = []
+            for i, company_data in enumerate(companies_data, 1):
+                company_name = company_data['company_info']['company_name']
+                print(f"\n[{i}/{len(companies_data)}] Analyzing: {company_name}")
+                
+                outcome = _score_company(company_data)
+                outcomes.append(outcome)
+                
+                if outcome[0] is not None:
+                    print(f"✓ Score: {outcome[0].final_score:.2f}/100 - {outcome[0].rating}")
+        
+        results = []
+        for company_data, (result, error) in zip(companies_data, outcomes):
+            if result is not None:
+                results.append(result)
             else:
-                failed += 1
+                self.errors.append({
+                    'company_name': company_data['company_info'].get('company_name', 'Unknown'),
+                    'error': error,
+                })
+        
+        self.results = results
+        
+        successful = len(self._results)
+        failed = len(self.errors)
         
         print("\n" + "="*80)
         print(f"ANALYSIS COMPLETE: {successful} successful, {failed} failed")
         print("="*80)
         
+        if self.errors:
+            print("\nFailed companies:")
+            for err in self.errors:
+                print(f"  ❌ {err['company_name']}: {err['error']}")
+        
         # Create summary DataFrame
-        return self.create_summary_dataframe()
+        return self.create_summary_dataframe(percentiles=percentiles, by_sector=by_sector)
+    
+    def create_summary_dataframe(self, percentiles: bool = False,
+                                 by_sector: bool = False) -> pd.DataFrame:
+        """
+        Create summary DataFrame from results
+        
+        The ranked table is built once per set of results and options and
+        cached; later calls return a copy of the cached table.
+        
+        Args:
+            percentiles: Also score every metric by its percentile rank across
+                         all analyzed companies (100 = best in the universe).
+                         Adds 'Percentile Score' and '<Category> (Pctl)' columns
+                         next to the absolute scores; ranking stays by Final Score.
+            by_sector: Rank percentiles within each company's sector instead of
+                       across the whole universe
+        
+        Returns:
+            DataFrame with all companies ranked by score
+        """
+        summary, _ = self._summary_table(percentiles, by_sector)
+        return summary.copy()
+    
+    def _summary_table(self, percentiles: bool = False,
+                       by_sector: bool = False) -> Tuple[pd.DataFrame, Dict]:
+        """
+        Cached ranked summary table and the row positions of each sector
+        
+        The cache is dropped whenever the results change (analyze_market,
+        assigning self.results or add_result).
+        
+        Returns:
+            Tuple of (summary DataFrame, {sector: row positions in rank order})
+        """
+        if self._summary_version != self._results_version:
+            self._summary_cache = {}
+            self._summary_version = self._results_version
+        
+        key = (percentiles, by_sector)
+        if key not in self._summary_cache:
+            df = self._build_summary_dataframe(percentiles, by_sector)
+            sector_rows = df.groupby('Sector', sort=False).indices if not df.empty else {}
+            self._summary_cache[key] = (df, sector_rows)
+        
+        return self._summary_cache[key]
     
-    def create_summary_dataframe(self) -> pd.DataFrame:
-        """Create summary DataFrame from results"""
-        if not self.results:
+    def _build_summary_dataframe(self, percentiles: bool, by_sector: bool) -> pd.DataFrame:
+        """Build the ranked summary table from the results"""
+        if not self._results:
             return pd.DataFrame()
         
         summary_data = []
         
-        for result in self.results:
-            info = result['company_info']
-            cat_scores = result['category_scores']
+        for result in self._results:
+            info = result.company_info
             
             row = {
                 'Rank': 0,  # Will be filled after sorting
@@ -124,76 +257,112 @@ class BulkMarketAnalyzer:
                 'Industry': info.get('industry', 'N/A'),
                 'Current Price': info.get('current_price', 0),
                 'Market Cap (Cr)': info.get('market_cap', 0),
-                'Final Score': result['final_score'],
-                'Rating': result['rating'],
-                'Financial Health': cat_scores['Financial Health']['score'],
-                'Profitability': cat_scores['Profitability']['score'],
-                'Growth': cat_scores['Growth']['score'],
-                'Valuation': cat_scores['Valuation']['score'],
-                'Efficiency': cat_scores['Efficiency']['score'],
+                'Final Score': result.final_score,
+                'Rating': result.rating,
             }
             
             summary_data.append(row)
         
         # Create DataFrame and sort by score
         df = pd.DataFrame(summary_data)
+        
+        # Category scores straight from the result arrays (CATEGORY_NAMES order)
+        category_matrix = np.vstack([result.category_values for result in self._results])
+        for j, category in enumerate(CATEGORY_NAMES):
+            df[category] = category_matrix[:, j]
+        
+        percentile_cols = []
+        if percentiles:
+            metrics_df = pd.DataFrame(np.vstack([result.metric_values for result in self._results]),
+                                      columns=METRIC_NAMES)
+            sectors = df['Sector'] if by_sector else None
+            ranked = ScoringEngine.percentile_scores(metrics_df, groups=sectors)
+            
+            df['Percentile Score'] = ranked['final_score'].to_numpy()
+            for category in CATEGORY_NAMES:
+                df[f'{category} (Pctl)'] = ranked['category_scores'][category].to_numpy()
+            percentile_cols = ['Percentile Score'] + [f'{category} (Pctl)' for category in CATEGORY_NAMES]
+        
         df = df.sort_values('Final Score', ascending=False).reset_index(drop=True)
         df['Rank'] = range(1, len(df) + 1)
         
         # Reorder columns
         cols = ['Rank', 'Company', 'Symbol', 'Sector', 'Industry', 'Current Price', 
                 'Market Cap (Cr)', 'Final Score', 'Rating', 'Financial Health', 
-                'Profitability', 'Growth', 'Valuation', 'Efficiency']
+                'Profitability', 'Growth', 'Valuation', 'Efficiency'] + percentile_cols
         df = df[cols]
         
         return df
     
-    def save_results(self, summary_df: pd.DataFrame, prefix: str = "market"):
+    def save_results(self, summary_df: pd.DataFrame, prefix: str = "market",
+                     formats: Iterable[str] = ('csv', 'json', 'excel'),
+                     excel_mode: str = 'standard') -> Tuple[str, ...]:
         """
         Save analysis results to files
         
         Args:
             summary_df: Summary DataFrame
             prefix: Prefix for output files
+            formats: Outputs to write, any of OUTPUT_FORMATS:
+                     'csv' (summary table), 'excel' (multi-sheet workbook) and
+                     'json', 'jsonl' or 'parquet' (detailed per-company results)
+            excel_mode: 'standard' or 'streaming' (write-only workbook,
+                        constant memory; see output_writers.py)
+        
+        Returns:
+            Tuple of the written file paths, in the order of formats
         """
+        unknown = [fmt for fmt in formats if fmt not in OUTPUT_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown output format(s) {unknown} (use: {', '.join(OUTPUT_FORMATS)})")
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        paths = []
         
-        # Save summary CSV
-        csv_path = os.path.join(self.output_dir, f"{prefix}_summary_{timestamp}.csv")
-        summary_df.to_csv(csv_path, index=False)
-        print(f"\n✓ Summary saved: {csv_path}")
-        
-        # Save detailed results as JSON
-        json_path = os.path.join(self.output_dir, f"{prefix}_detailed_{timestamp}.json")
-        with open(json_path, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
-        print(f"✓ Detailed results saved: {json_path}")
-        
-        # Save top performers Excel
-        excel_path = os.path.join(self.output_dir, f"{prefix}_analysis_{timestamp}.xlsx")
-        with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-            # Summary sheet
-            summary_df.to_excel(writer, sheet_name='Market Summary', index=False)
-            
-            # Top 20 companies
-            top20 = summary_df.head(20)
-            top20.to_excel(writer, sheet_name='Top 20', index=False)
+        for fmt in formats:
+            if fmt == 'csv':
+                # Save summary CSV
+                csv_path = os.path.join(self.output_dir, f"{prefix}_summary_{timestamp}.csv")
+                summary_df.to_csv(csv_path, index=False)
+                print(f"\n✓ Summary saved: {csv_path}")
+                paths.append(csv_path)
             
-            # By sector
-            sector_summary = summary_df.groupby('Sector').agg({
-                'Final Score': 'mean',
-                'Company': 'count'
-            }).round(2).sort_values('Final Score', ascending=False)
-            sector_summary.columns = ['Average Score', 'Number of Companies']
-            sector_summary.to_excel(writer, sheet_name='Sector Analysis')
+            elif fmt == 'excel':
+                excel_path = os.path.join(self.output_dir, f"{prefix}_analysis_{timestamp}.xlsx")
+                write_workbook(excel_path, self._excel_sheets(summary_df), mode=excel_mode,
+                               index_sheets=['Sector Analysis', 'Rating Distribution'])
+                print(f"✓ Excel report saved: {excel_path}")
+                paths.append(excel_path)
             
-            # Rating distribution
-            rating_dist = summary_df['Rating'].value_counts().sort_index()
-            rating_dist.to_excel(writer, sheet_name='Rating Distribution')
+            else:
+                # Detailed per-company results, converted as the writer consumes them
+                base_path = os.path.join(self.output_dir, f"{prefix}_detailed_{timestamp}")
+                records = (result.to_dict() for result in self._results)
+                output_file = write_records(records, base_path, fmt)
+                print(f"✓ Detailed results saved: {output_file}")
+                paths.append(output_file)
         
-        print(f"✓ Excel report saved: {excel_path}")
+        return tuple(paths)
+    
+    @staticmethod
+    def _excel_sheets(summary_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Sheets of the Excel report"""
+        # By sector
+        sector_summary = summary_df.groupby('Sector').agg({
+            'Final Score': 'mean',
+            'Company': 'count'
+        }).round(2).sort_values('Final Score', ascending=False)
+        sector_summary.columns = ['Average Score', 'Number of Companies']
+        
+        # Rating distribution
+        rating_dist = summary_df['Rating'].value_counts().sort_index()
         
-        return csv_path, json_path, excel_path
+        return {
+            'Market Summary': summary_df,
+            'Top 20': summary_df.head(20),
+            'Sector Analysis': sector_summary,
+            'Rating Distribution': rating_dist.to_frame(),
+        }
     
     def get_top_companies(self, n: int = 10, sector: str = None) -> pd.DataFrame:
         """
@@ -206,26 +375,158 @@ class BulkMarketAnalyzer:
         Returns:
             DataFrame with top companies
         """
-        df = self.create_summary_dataframe()
+        df, sector_rows = self._summary_table()
         
+        # The cached table is already in rank order, so top N is a slice
         if sector:
-            df = df[df['Sector'] == sector]
+            return df.iloc[sector_rows.get(sector, [])[:n]].copy()
         
-        return df.head(n)
+        return df.head(n).copy()
     
     def get_sector_leaders(self) -> pd.DataFrame:
         """Get the top company from each sector"""
-        df = self.create_summary_dataframe()
+        df, sector_rows = self._summary_table()
         
-        # Get highest scored company per sector
-        leaders = df.loc[df.groupby('Sector')['Final Score'].idxmax()]
-        leaders = leaders.sort_values('Final Score', ascending=False).reset_index(drop=True)
+        # Highest scored company per sector = its first row in rank order
+        leader_rows = np.sort([rows[0] for rows in sector_rows.values()]).astype(int)
+        leaders = df.iloc[leader_rows].reset_index(drop=True)
         leaders['Rank'] = range(1, len(leaders) + 1)
         
         return leaders
 
 
-def load_companies_from_csv(csv_path: str) -> List[Dict]:
+# Ace Equity export column of each financial_data field: (field, column, default).
+# A default of None marks a required column.
+ACE_EQUITY_FIELDS = [
+    ('company_info.symbol', 'Symbol', None),
+    ('company_info.company_name', 'Company Name', None),
+    ('company_info.sector', 'Sector', 'N/A'),
+    ('company_info.industry', 'Industry', 'N/A'),
+    ('company_info.current_price', 'Current Price', None),
+    ('company_info.market_cap', 'Market Cap', None),
+    ('balance_sheet.fy_2024.total_assets', 'Total Assets FY24', None),
+    ('balance_sheet.fy_2024.current_assets', 'Current Assets FY24', None),
+    ('balance_sheet.fy_2024.cash_and_equivalents', 'Cash FY24', None),
+    ('balance_sheet.fy_2024.inventory', 'Inventory FY24', 0.0),
+    ('balance_sheet.fy_2024.current_liabilities', 'Current Liabilities FY24', None),
+    ('balance_sheet.fy_2024.total_debt', 'Total Debt FY24', None),
+    ('balance_sheet.fy_2024.shareholders_equity', 'Equity FY24', None),
+    ('balance_sheet.fy_2023.total_assets', 'Total Assets FY23', None),
+    ('balance_sheet.fy_2023.shareholders_equity', 'Equity FY23', None),
+    ('balance_sheet.fy_2023.total_debt', 'Total Debt FY23', 0.0),
+    ('balance_sheet.fy_2022.total_assets', 'Total Assets FY22', 0.0),
+    ('balance_sheet.fy_2022.shareholders_equity', 'Equity FY22', 0.0),
+    ('balance_sheet.fy_2021.total_assets', 'Total Assets FY21', 0.0),
+    ('balance_sheet.fy_2021.shareholders_equity', 'Equity FY21', 0.0),
+    ('income_statement.fy_2024.total_revenue', 'Revenue FY24', None),
+    ('income_statement.fy_2024.cost_of_revenue', 'COGS FY24', None),
+    ('income_statement.fy_2024.operating_income', 'EBIT FY24', None),
+    ('income_statement.fy_2024.interest_expense', 'Interest FY24', None),
+    ('income_statement.fy_2024.pretax_income', 'PBT FY24', None),
+    ('income_statement.fy_2024.income_tax_expense', 'Tax FY24', None),
+    ('income_statement.fy_2024.net_income', 'Net Profit FY24', None),
+    ('income_statement.fy_2023.total_revenue', 'Revenue FY23', None),
+    ('income_statement.fy_2023.operating_income', 'EBIT FY23', 0.0),
+    ('income_statement.fy_2023.net_income', 'Net Profit FY23', None),
+    ('income_statement.fy_2022.total_revenue', 'Revenue FY22', 0.0),
+    ('income_statement.fy_2022.net_income', 'Net Profit FY22', 0.0),
+    ('income_statement.fy_2021.total_revenue', 'Revenue FY21', 0.0),
+    ('income_statement.fy_2021.net_income', 'Net Profit FY21', 0.0),
+    ('cash_flow.fy_2024.operating_cash_flow', 'OCF FY24', None),
+    ('cash_flow.fy_2024.capital_expenditure', 'CapEx FY24', 0.0),
+    ('cash_flow.fy_2024.free_cash_flow', 'FCF FY24', 0.0),
+    ('cash_flow.fy_2023.free_cash_flow', 'FCF FY23', 0.0),
+    ('per_share_data.fy_2024.eps', 'EPS FY24', None),
+    ('per_share_data.fy_2024.book_value_per_share', 'BVPS FY24', None),
+    ('per_share_data.fy_2023.eps', 'EPS FY23', 0.0),
+    ('per_share_data.fy_2022.eps', 'EPS FY22', 0.0),
+    ('per_share_data.fy_2021.eps', 'EPS FY21', 0.0),
+]
+
+TEXT_FIELDS = {'company_info.symbol', 'company_info.company_name',
+               'company_info.sector', 'company_info.industry'}
+
+
+def load_company_table(csv_path: str) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Load an Ace Equity export as a columnar financial table
+    
+    Every column is converted in one vectorized pass. The table has one dotted
+    column per line item per fiscal year (as financial_data_to_frame), so it
+    can go straight into BatchMetricsCalculator.
+    
+    Args:
+        csv_path: Path to CSV file (see ace_equity_template.csv for format)
+    
+    Returns:
+        Tuple of (table, errors). errors holds the reason each invalid row
+        was rejected and is None for valid rows, so errors.isna() is the
+        validation mask.
+    """
+    df = pd.read_csv(csv_path)
+    errors = pd.Series(None, index=df.index, dtype=object)
+    table = {}
+    
+    for field, column, default in ACE_EQUITY_FIELDS:
+        if column not in df.columns:
+            if default is None:
+                errors = errors.fillna(f"missing column '{column}'")
+            table[field] = np.full(len(df), default, dtype=object if field in TEXT_FIELDS else float)
+            continue
+        
+        if field in TEXT_FIELDS:
+            table[field] = df[column].to_numpy()
+            continue
+        
+        values = pd.to_numeric(df[column], errors='coerce')
+        # Blank cells load as NaN, as before; anything else unparseable rejects the row
+        invalid = values.isna() & df[column].notna()
+        if invalid.any():
+            reasons = "invalid number in '" + column + "': " + df[column].astype(str)
+            errors = errors.where(errors.notna() | ~invalid, reasons)
+        table[field] = values.to_numpy(dtype=float)
+    
+    return pd.DataFrame(table, index=df.index), errors
+
+
+class CompanyRecords(Sequence):
+    """
+    Nested financial_data dictionaries backed by a columnar table
+    
+    Behaves like a read-only list of company dictionaries (len, indexing,
+    slicing, iteration), but each dictionary is only built when accessed.
+    """
+    
+    def __init__(self, table: pd.DataFrame):
+        """
+        Args:
+            table: DataFrame with dotted columns (see load_company_table)
+        """
+        self.table = table.reset_index(drop=True)
+        self._fields = [(column.split('.'), self.table[column].to_numpy()) for column in self.table.columns]
+    
+    def __len__(self) -> int:
+        return len(self.table)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CompanyRecords(self.table.iloc[i])
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('company index out of range')
+        
+        record = {}
+        for keys, values in self._fields:
+            node = record
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+            value = values[i]
+            node[keys[-1]] = float(value) if values.dtype.kind == 'f' else value
+        return record
+
+
+def load_companies_from_csv(csv_path: str) -> CompanyRecords:
     """
     Load company data from CSV file exported from Ace Equity
     
@@ -236,104 +537,18 @@ def load_companies_from_csv(csv_path: str) -> List[Dict]:
         csv_path: Path to CSV file
         
     Returns:
-        List of company data dictionaries
+        Sequence of company data dictionaries (valid rows only), built lazily
+        from the columnar table of load_company_table
     """
     print(f"\nLoading companies from: {csv_path}")
     
-    df = pd.read_csv(csv_path)
-    companies_data = []
+    table, errors = load_company_table(csv_path)
+    valid = errors.isna()
     
-    for idx, row in df.iterrows():
-        try:
-            company_data = {
-                'company_info': {
-                    'symbol': row['Symbol'],
-                    'company_name': row['Company Name'],
-                    'sector': row.get('Sector', 'N/A'),
-                    'industry': row.get('Industry', 'N/A'),
-                    'current_price': float(row['Current Price']),
-                    'market_cap': float(row['Market Cap']),
-                },
-                'balance_sheet': {
-                    'fy_2024': {
-                        'total_assets': float(row['Total Assets FY24']),
-                        'current_assets': float(row['Current Assets FY24']),
-                        'cash_and_equivalents': float(row['Cash FY24']),
-                        'inventory': float(row.get('Inventory FY24', 0)),
-                        'current_liabilities': float(row['Current Liabilities FY24']),
-                        'total_debt': float(row['Total Debt FY24']),
-                        'shareholders_equity': float(row['Equity FY24']),
-                    },
-                    'fy_2023': {
-                        'total_assets': float(row['Total Assets FY23']),
-                        'shareholders_equity': float(row['Equity FY23']),
-                        'total_debt': float(row.get('Total Debt FY23', 0)),
-                    },
-                    'fy_2022': {
-                        'total_assets': float(row.get('Total Assets FY22', 0)),
-                        'shareholders_equity': float(row.get('Equity FY22', 0)),
-                    },
-                    'fy_2021': {
-                        'total_assets': float(row.get('Total Assets FY21', 0)),
-                        'shareholders_equity': float(row.get('Equity FY21', 0)),
-                    },
-                },
-                'income_statement': {
-                    'fy_2024': {
-                        'total_revenue': float(row['Revenue FY24']),
-                        'cost_of_revenue': float(row['COGS FY24']),
-                        'operating_income': float(row['EBIT FY24']),
-                        'interest_expense': float(row['Interest FY24']),
-                        'pretax_income': float(row['PBT FY24']),
-                        'income_tax_expense': float(row['Tax FY24']),
-                        'net_income': float(row['Net Profit FY24']),
-                    },
-                    'fy_2023': {
-                        'total_revenue': float(row['Revenue FY23']),
-                        'operating_income': float(row.get('EBIT FY23', 0)),
-                        'net_income': float(row['Net Profit FY23']),
-                    },
-                    'fy_2022': {
-                        'total_revenue': float(row.get('Revenue FY22', 0)),
-                        'net_income': float(row.get('Net Profit FY22', 0)),
-                    },
-                    'fy_2021': {
-                        'total_revenue': float(row.get('Revenue FY21', 0)),
-                        'net_income': float(row.get('Net Profit FY21', 0)),
-                    },
-                },
-                'cash_flow': {
-                    'fy_2024': {
-                        'operating_cash_flow': float(row['OCF FY24']),
-                        'capital_expenditure': float(row.get('CapEx FY24', 0)),
-                        'free_cash_flow': float(row.get('FCF FY24', 0)),
-                    },
-                    'fy_2023': {
-                        'free_cash_flow': float(row.get('FCF FY23', 0)),
-                    },
-                },
-                'per_share_data': {
-                    'fy_2024': {
-                        'eps': float(row['EPS FY24']),
-                        'book_value_per_share': float(row['BVPS FY24']),
-                    },
-                    'fy_2023': {
-                        'eps': float(row.get('EPS FY23', 0)),
-                    },
-                    'fy_2022': {
-                        'eps': float(row.get('EPS FY22', 0)),
-                    },
-                    'fy_2021': {
-                        'eps': float(row.get('EPS FY21', 0)),
-                    },
-                },
-            }
-            
-            companies_data.append(company_data)
-            
-        except Exception as e:
-            print(f"❌ Error loading {row.get('Company Name', 'Unknown')}: {str(e)}")
-            continue
+    for name, error in zip(table['company_info.company_name'][~valid], errors[~valid]):
+        print(f"❌ Error loading {name if name is not None else 'Unknown'}: {error}")
+    
+    companies_data = CompanyRecords(table[valid])
     
     print(f"✓ Loaded {len(companies_data)} companies successfully")
     return companies_data
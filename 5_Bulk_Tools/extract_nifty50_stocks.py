@@ -2,20 +2,95 @@
 NIFTY50 Stock Extractor
 Extracts individual stock data from NIFTY50.csv portfolio file
 Converts wide format (50 stocks horizontal) to long format (1 stock per file)
+
+The file is streamed in a single pass: each line is split once and its
+11-column company groups are buffered per company, then appended to the
+company files every `chunk_rows` lines, so memory stays bounded for large
+index exports.
 """
 
 import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 import os
 import re
 
-def excel_serial_to_date(serial):
-    """Convert Excel serial number to datetime"""
-    try:
-        base_date = datetime(1899, 12, 30)
-        return base_date + timedelta(days=int(float(serial)))
-    except:
-        return None
+# Column layout of one company group in the wide export
+# DATE, ADJCLOSE, ADJHIGH, ADJLOW, ADJOPEN, MCAP, NO_TRADES, PRICE_BV, VOLUME, VALUE, PE_CONS
+COMPANY_COLUMNS = [
+    'DATE', 'ADJCLOSE', 'ADJHIGH', 'ADJLOW', 'ADJOPEN', 
+    'MCAP', 'NO_TRADES', 'PRICE_BV', 'VOLUME', 'VALUE', 'PE_CONS'
+]
+PRICE_COLUMNS = ['ADJCLOSE', 'ADJHIGH', 'ADJLOW', 'ADJOPEN', 'VOLUME']
+OUTPUT_PRICE_COLUMNS = ['Close', 'High', 'Low', 'Open', 'Volume']
+
+EXCEL_EPOCH = pd.Timestamp(1899, 12, 30)
+# Serial range that fits a pandas Timedelta and gives a pandas Timestamp
+MIN_SERIAL = (pd.Timestamp.min.ceil('D') - EXCEL_EPOCH).days
+MAX_SERIAL = pd.Timedelta.max.days
+
+def excel_serials_to_dates(serials):
+    """Convert a Series of Excel serial numbers to datetimes (invalid or out-of-range values become NaT)"""
+    days = np.trunc(pd.to_numeric(serials, errors='coerce').astype(float))
+    days = days.where((days >= MIN_SERIAL) & (days <= MAX_SERIAL))
+    return EXCEL_EPOCH + pd.to_timedelta(days, unit='D')
+
+def standardize_company_rows(rows):
+    """
+    Convert raw rows of one company group to Generic Stock Analyzer format
+    
+    Args:
+        rows: List of 11-value rows (see COMPANY_COLUMNS)
+    
+    Returns:
+        DataFrame with Date, Open, High, Low, Close, Volume and fundamental columns
+    """
+    df = pd.DataFrame(rows, columns=COMPANY_COLUMNS)
+    
+    # Convert date from Excel serial to datetime
+    df['DATE'] = excel_serials_to_dates(df['DATE'])
+    
+    # Drop rows with invalid dates
+    df = df.dropna(subset=['DATE'])
+    
+    # Convert numeric columns
+    for col in PRICE_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    
+    # Drop rows where all price data is missing
+    df = df.dropna(subset=PRICE_COLUMNS, how='all')
+    
+    # Rename columns to match Generic Stock Analyzer expectations
+    return pd.DataFrame({
+        'Date': df['DATE'].dt.strftime('%Y-%m-%d'),
+        'Open': df['ADJOPEN'],
+        'High': df['ADJHIGH'],
+        'Low': df['ADJLOW'],
+        'Close': df['ADJCLOSE'],
+        'Volume': df['VOLUME'],
+        'MCAP': df['MCAP'],
+        'NO_TRADES': df['NO_TRADES'],
+        'PRICE_BV': df['PRICE_BV'],
+        'VALUE': df['VALUE'],
+        'PE_CONS': df['PE_CONS']
+    })
+
+def unify_numeric_columns(filepath, columns):
+    """
+    Rewrite integer values of the given columns as floats
+    
+    Chunks are converted separately, so a column can be written as integers
+    in one chunk and as floats (missing or fractional values) in another.
+    Reading the whole file would have made the column float everywhere.
+    
+    Args:
+        filepath: Company CSV written by extract_nifty50_stocks
+        columns: Output column names to convert to float
+    """
+    df = pd.read_csv(filepath, dtype=str, keep_default_na=False)
+    for col in columns:
+        df[col] = pd.to_numeric(df[col], errors='coerce').astype(float)
+    df.to_csv(filepath, index=False)
 
 def clean_company_name(name):
     """Convert company name to valid filename"""
@@ -29,13 +104,14 @@ def clean_company_name(name):
     name = re.sub(r'_+', '_', name)
     return name.strip('_')
 
-def extract_nifty50_stocks(input_file='NIFTY50.csv', output_dir='4_NIFTY50_Individual_Stocks'):
+def extract_nifty50_stocks(input_file='NIFTY50.csv', output_dir='4_NIFTY50_Individual_Stocks', chunk_rows=1000):
     """
     Extract all 50 stocks from NIFTY50.csv into individual CSV files
     
     Args:
         input_file: Path to NIFTY50.csv
         output_dir: Directory to save extracted stock files
+        chunk_rows: Number of input lines buffered before company files are appended
     """
     
     print("\n" + "="*80)
@@ -46,114 +122,109 @@ def extract_nifty50_stocks(input_file='NIFTY50.csv', output_dir='4_NIFTY50_Indiv
     os.makedirs(output_dir, exist_ok=True)
     print(f"\n📁 Output Directory: {output_dir}")
     
-    # Read file manually to handle multi-row headers
     print(f"\n📂 Reading: {input_file}")
     with open(input_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Parse headers
-    header1 = lines[0].strip().split(',')  # Exchange type
-    header2 = lines[1].strip().split(',')  # Company names
-    header3 = lines[2].strip().split(',')  # Column names
-    
-    print(f"✅ File loaded: {len(lines)} lines")
-    print(f"✅ Data rows: {len(lines) - 3}")
-    
-    # Identify company column groups (each company has 12 columns)
-    companies = []
-    company_positions = []
+        # Parse multi-row headers
+        header1 = f.readline().strip().split(',')  # Exchange type
+        header2 = f.readline().strip().split(',')  # Company names
+        header3 = f.readline().strip().split(',')  # Column names
+        
+        # Identify company column groups (each company has 12 columns)
+        companies = []
+        company_positions = []
+        
+        for i, company_name in enumerate(header2):
+            if company_name and company_name.strip() and company_name != 'EQNXTH':
+                companies.append(company_name.strip())
+                # Each company starts at position i and spans 11 data columns + 1 separator
+                company_positions.append(i)
+        
+        print(f"\n📊 Detected Companies: {len(companies)}")
+        print("="*80)
+        
+        # Per-company output state
+        outputs = []
+        for company_name in companies:
+            filename = f"{clean_company_name(company_name)}.csv"
+            outputs.append({
+                'company': company_name,
+                'filename': filename,
+                'filepath': os.path.join(output_dir, filename),
+                'buffer': [],
+                'written': False,
+                'rows': 0,
+                'first_date': None,
+                'last_date': None,
+                'dtype_kinds': {col: set() for col in OUTPUT_PRICE_COLUMNS},
+                'error': None
+            })
+        
+        def fail(output, error):
+            """Mark a company as failed and remove its partly written file"""
+            output['error'] = error
+            if os.path.exists(output['filepath']):
+                os.remove(output['filepath'])
+        
+        def flush():
+            """Append buffered rows of every company to its file"""
+            for output in outputs:
+                rows, output['buffer'] = output['buffer'], []
+                if output['error']:
+                    continue
+                try:
+                    df_standard = standardize_company_rows(rows)
+                    df_standard.to_csv(output['filepath'], mode='a' if output['written'] else 'w',
+                                       header=not output['written'], index=False)
+                    output['written'] = True
+                    
+                    # Chunks without valid dates say nothing about the column dtype
+                    for col in OUTPUT_PRICE_COLUMNS:
+                        kind = df_standard[col].dtype.kind
+                        if kind == 'f' or len(df_standard) > 0:
+                            output['dtype_kinds'][col].add(kind)
+                    
+                    if len(df_standard) > 0:
+                        if output['first_date'] is None:
+                            output['first_date'] = df_standard['Date'].iloc[0]
+                        output['last_date'] = df_standard['Date'].iloc[-1]
+                        output['rows'] += len(df_standard)
+                except Exception as e:
+                    fail(output, e)
+        
+        # Stream data rows: split each line once and route company groups
+        data_rows = 0
+        for line in f:
+            values = line.strip().split(',')
+            for output, start_col in zip(outputs, company_positions):
+                if len(values) >= start_col + 11:
+                    output['buffer'].append(values[start_col:start_col + 11])
+            
+            data_rows += 1
+            if data_rows % chunk_rows == 0:
+                flush()
+        
+        flush()
     
-    for i, company_name in enumerate(header2):
-        if company_name and company_name.strip() and company_name != 'EQNXTH':
-            companies.append(company_name.strip())
-            # Each company starts at position i and spans 11 data columns + 1 separator
-            company_positions.append(i)
+    # Columns written as integers in some chunks and floats in others
+    for output in outputs:
+        mixed = [col for col, kinds in output['dtype_kinds'].items() if len(kinds) > 1]
+        if mixed and not output['error']:
+            try:
+                unify_numeric_columns(output['filepath'], mixed)
+            except Exception as e:
+                fail(output, e)
     
-    print(f"\n📊 Detected Companies: {len(companies)}")
-    print("="*80)
+    print(f"✅ File streamed: {data_rows + 3} lines")
+    print(f"✅ Data rows: {data_rows}")
     
     extraction_summary = []
     
-    # Extract each company
-    for idx, (company_name, start_col) in enumerate(zip(companies, company_positions), 1):
-        try:
-            print(f"\n[{idx}/{len(companies)}] Processing: {company_name}")
-            
-            # Extract columns for this company (11 data columns)
-            # DATE, ADJCLOSE, ADJHIGH, ADJLOW, ADJOPEN, MCAP, NO_TRADES, PRICE_BV, VOLUME, VALUE, PE_CONS
-            col_indices = list(range(start_col, start_col + 11))
-            
-            # Extract data
-            company_data = []
-            for line in lines[3:]:  # Skip 3 header rows
-                values = line.strip().split(',')
-                if len(values) > max(col_indices):
-                    row_data = [values[i] for i in col_indices]
-                    company_data.append(row_data)
-            
-            # Create DataFrame
-            df = pd.DataFrame(company_data, columns=[
-                'DATE', 'ADJCLOSE', 'ADJHIGH', 'ADJLOW', 'ADJOPEN', 
-                'MCAP', 'NO_TRADES', 'PRICE_BV', 'VOLUME', 'VALUE', 'PE_CONS'
-            ])
-            
-            # Convert date from Excel serial to datetime
-            df['DATE'] = df['DATE'].apply(excel_serial_to_date)
-            
-            # Drop rows with invalid dates
-            df = df.dropna(subset=['DATE'])
-            
-            # Convert numeric columns
-            numeric_cols = ['ADJCLOSE', 'ADJHIGH', 'ADJLOW', 'ADJOPEN', 'VOLUME']
-            for col in numeric_cols:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            # Drop rows where all price data is missing
-            df = df.dropna(subset=numeric_cols, how='all')
-            
-            # Rename columns to match Generic Stock Analyzer expectations
-            df_standard = pd.DataFrame({
-                'Date': df['DATE'].dt.strftime('%Y-%m-%d'),
-                'Open': df['ADJOPEN'],
-                'High': df['ADJHIGH'],
-                'Low': df['ADJLOW'],
-                'Close': df['ADJCLOSE'],
-                'Volume': df['VOLUME'],
-                'MCAP': df['MCAP'],
-                'NO_TRADES': df['NO_TRADES'],
-                'PRICE_BV': df['PRICE_BV'],
-                'VALUE': df['VALUE'],
-                'PE_CONS': df['PE_CONS']
-            })
-            
-            # Generate filename
-            clean_name = clean_company_name(company_name)
-            filename = f"{clean_name}.csv"
-            filepath = os.path.join(output_dir, filename)
-            
-            # Save to CSV
-            df_standard.to_csv(filepath, index=False)
-            
-            # Get date range
-            if len(df_standard) > 0:
-                date_range = f"{df_standard['Date'].iloc[-1]} to {df_standard['Date'].iloc[0]}"
-                days = len(df_standard)
-            else:
-                date_range = "No valid data"
-                days = 0
-            
-            print(f"   ✅ Saved: {filename}")
-            print(f"   📅 Date Range: {date_range}")
-            print(f"   📊 Rows: {days}")
-            
-            extraction_summary.append({
-                'Company': company_name,
-                'Filename': filename,
-                'Rows': days,
-                'Status': '✅ Success'
-            })
-            
-        except Exception as e:
+    for idx, output in enumerate(outputs, 1):
+        company_name = output['company']
+        print(f"\n[{idx}/{len(companies)}] Processing: {company_name}")
+        
+        if output['error']:
+            e = output['error']
             print(f"   ❌ Error: {str(e)}")
             extraction_summary.append({
                 'Company': company_name,
@@ -161,6 +232,24 @@ def extract_nifty50_stocks(input_file='NIFTY50.csv', output_dir='4_NIFTY50_Indiv
                 'Rows': 0,
                 'Status': f'❌ Failed: {str(e)[:50]}'
             })
+            continue
+        
+        # Get date range (file is in source order, newest first)
+        if output['rows'] > 0:
+            date_range = f"{output['last_date']} to {output['first_date']}"
+        else:
+            date_range = "No valid data"
+        
+        print(f"   ✅ Saved: {output['filename']}")
+        print(f"   📅 Date Range: {date_range}")
+        print(f"   📊 Rows: {output['rows']}")
+        
+        extraction_summary.append({
+            'Company': company_name,
+            'Filename': output['filename'],
+            'Rows': output['rows'],
+            'Status': '✅ Success'
+        })
     
     # Summary Report
     print("\n" + "="*80)